@@ -0,0 +1,40 @@
+# linkedin_mcp_server/api/__init__.py
+"""
+LinkedIn REST API client package.
+
+This package provides the clients used by the post, media and reaction tools to
+talk to the official LinkedIn REST API (w_member_social permission).
+
+Key Components:
+- AsyncLinkedInAPIClient: Native asyncio client used by the MCP tools
+- LinkedInAPIClient: Deprecated blocking facade over the async client for scripts
+- PostVisibility / ReactionType: Enumerations shared by both clients (see common)
+- PersonURNCache: Persistent token to person URN cache shared across processes
+- MediaCache: Content-addressed cache that deduplicates image uploads
+- PostQueue / PostScheduler: Durable queue of scheduled posts and its background publisher
+- RateLimiter: Per-endpoint-family token buckets shared by all clients
+- RetryPolicy: Backoff with jitter and deadline for idempotent calls
+"""
+
+from .async_client import AsyncLinkedInAPIClient
+from .client import LinkedInAPIClient
+from .common import PostVisibility, ReactionType
+from .media_cache import MediaCache
+from .post_queue import PostQueue, PostScheduler
+from .ratelimit import RateLimiter, get_rate_limiter
+from .retry import RetryPolicy
+from .urn_cache import PersonURNCache
+
+__all__ = [
+    "AsyncLinkedInAPIClient",
+    "LinkedInAPIClient",
+    "MediaCache",
+    "PersonURNCache",
+    "PostQueue",
+    "PostScheduler",
+    "PostVisibility",
+    "RateLimiter",
+    "ReactionType",
+    "RetryPolicy",
+    "get_rate_limiter",
+]
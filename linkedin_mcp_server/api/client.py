@@ -0,0 +1,136 @@
+# linkedin_mcp_server/api/client.py
+"""
+Synchronous LinkedIn REST API client (deprecated).
+
+A blocking facade over AsyncLinkedInAPIClient for existing scripts. Every call
+is run on a private event loop in a background thread, so the sync client has
+exactly the features, retries and rate limiting of the async one without a
+second implementation. New code should use AsyncLinkedInAPIClient directly.
+"""
+
+import asyncio
+import functools
+import inspect
+import logging
+import threading
+import warnings
+from typing import Any, Iterator, Optional
+
+from .async_client import AsyncLinkedInAPIClient
+from .common import extract_post_id_from_url
+from .media_cache import MediaCache
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from .urn_cache import PersonURNCache
+
+logger = logging.getLogger(__name__)
+
+
+class LinkedInAPIClient:
+    """Comprehensive LinkedIn REST API client (deprecated, use AsyncLinkedInAPIClient)."""
+
+    def __init__(
+        self,
+        access_token: str,
+        base_url: Optional[str] = None,
+        pool_connections: Optional[int] = None,
+        pool_maxsize: Optional[int] = None,
+        urn_cache: Optional[PersonURNCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        media_cache: Optional[MediaCache] = None,
+    ):
+        """
+        Initialize LinkedIn API client.
+
+        Args:
+            access_token (str): LinkedIn API access token
+            base_url (str, optional): Base URL for REST API
+            pool_connections (int, optional): Number of hosts to keep connection pools for
+            pool_maxsize (int, optional): Maximum keep-alive connections per host
+            urn_cache (PersonURNCache, optional): Persistent person URN cache
+            rate_limiter (RateLimiter, optional): Limiter for API calls (default:
+                the process-wide limiter)
+            retry_policy (RetryPolicy, optional): Backoff for idempotent calls
+                (default: from LINKEDIN_RETRY_* variables)
+            media_cache (MediaCache, optional): Content-addressed cache of
+                uploaded images
+        """
+        warnings.warn(
+            "LinkedInAPIClient is deprecated and no longer gains features; "
+            "use AsyncLinkedInAPIClient instead",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        self._client = AsyncLinkedInAPIClient(
+            access_token,
+            base_url=base_url,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            urn_cache=urn_cache,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            media_cache=media_cache,
+        )
+
+        # Private loop, so calls work from any thread, including ones that
+        # already run an event loop
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="linkedin-api-client", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self, coro: Any) -> Any:
+        """Run a coroutine on the private loop and wait for its result."""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def _iterate(self, agen: Any) -> Iterator[Any]:
+        """Drive an async generator on the private loop."""
+        try:
+            while True:
+                try:
+                    yield self._run(agen.__anext__())
+                except StopAsyncIteration:
+                    return
+        finally:
+            self._run(agen.aclose())
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for names not set on the wrapper: delegate to the
+        # async client and make its coroutine methods blocking
+        attr = getattr(self._client, name)
+        if inspect.iscoroutinefunction(attr):
+
+            @functools.wraps(attr)
+            def call(*args: Any, **kwargs: Any) -> Any:
+                return self._run(attr(*args, **kwargs))
+
+            return call
+        if inspect.isasyncgenfunction(attr):
+
+            @functools.wraps(attr)
+            def iterate(*args: Any, **kwargs: Any) -> Iterator[Any]:
+                return self._iterate(attr(*args, **kwargs))
+
+            return iterate
+        return attr
+
+    def close(self) -> None:
+        """Close pooled HTTP connections and stop the private loop."""
+        if self._loop.is_closed():
+            return
+        self._run(self._client.aclose())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    def __enter__(self) -> "LinkedInAPIClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    # ==================== POST READING (SCRAPING-BASED) ====================
+
+    extract_post_id_from_url = staticmethod(extract_post_id_from_url)
@@ -0,0 +1,235 @@
+# linkedin_mcp_server/api/common.py
+"""
+Request building and response helpers of the LinkedIn API client.
+
+The pieces that do not depend on the HTTP library (headers, pagination, batch
+URLs, post content and the shared enums) live here, so they can be imported
+and tested without creating a client.
+"""
+
+import os
+import re
+from enum import Enum
+from typing import Any, Dict, List, Optional
+from urllib.parse import quote
+
+# Reactions fetched per request when walking all pages
+REACTIONS_PAGE_SIZE = int(os.getenv("LINKEDIN_REACTIONS_PAGE_SIZE", "100"))
+
+
+def next_page_start(page: Dict[str, Any], start: int, count: int) -> Optional[int]:
+    """
+    Offset of the page after a Rest.li collection page.
+
+    Args:
+        page: Collection response with "elements" and optional "paging"
+        start: Offset the page was requested with
+        count: Page size the page was requested with
+
+    Returns:
+        Optional[int]: Start of the next page, or None if this was the last one
+    """
+    elements = page.get("elements") or []
+    if not elements:
+        return None
+
+    next_start = start + len(elements)
+    total = (page.get("paging") or {}).get("total")
+    if total is not None:
+        # The server may return short pages before the end (e.g. after
+        # filtering out deleted entries), so trust the total when it is given
+        return next_start if next_start < total else None
+    if len(elements) < count:
+        return None
+    return next_start
+
+
+# Longest URL sent for a BATCH_GET; longer ID lists are split into chunks
+BATCH_MAX_URL_LENGTH = int(os.getenv("LINKEDIN_BATCH_MAX_URL_LENGTH", "4000"))
+
+# Concurrent requests of bulk operations (e.g. reacting to many posts)
+BULK_WORKERS = int(os.getenv("LINKEDIN_BULK_WORKERS", "8"))
+
+
+def summarize_bulk_results(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Summarize per-item results of a bulk operation.
+
+    Args:
+        results: One dict per item, each with a "status" of success or error
+
+    Returns:
+        Dict with overall status (success, partial or error), counts and results
+    """
+    succeeded = sum(1 for r in results if r["status"] == "success")
+    if succeeded == len(results):
+        status = "success"
+    elif succeeded:
+        status = "partial"
+    else:
+        status = "error"
+    return {
+        "status": status,
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+        "results": results,
+    }
+
+
+def media_urn(media_id: str, media_type: str) -> str:
+    """Expand a bare media ID to its URN (e.g. "C4E..." -> "urn:li:image:C4E...")."""
+    return (
+        media_id if media_id.startswith("urn:") else f"urn:li:{media_type}:{media_id}"
+    )
+
+
+def batch_get_urls(
+    resource_url: str, ids: List[str], max_length: Optional[int] = None
+) -> List[str]:
+    """
+    Build Rest.li BATCH_GET URLs ("?ids=List(...)") for a list of IDs.
+
+    IDs are percent-encoded and split across as many URLs as needed to keep
+    each one within max_length.
+
+    Args:
+        resource_url: Collection URL, e.g. https://api.linkedin.com/rest/images
+        ids: Entity IDs or URNs
+        max_length: URL length limit (default: LINKEDIN_BATCH_MAX_URL_LENGTH)
+
+    Returns:
+        List[str]: One URL per chunk
+    """
+    max_length = max_length or BATCH_MAX_URL_LENGTH
+    prefix = f"{resource_url}?ids=List("
+    urls: List[str] = []
+    chunk: List[str] = []
+    length = len(prefix) + 1  # closing parenthesis
+
+    for encoded in dict.fromkeys(quote(i, safe="") for i in ids):
+        added = len(encoded) + (1 if chunk else 0)
+        if chunk and length + added > max_length:
+            urls.append(prefix + ",".join(chunk) + ")")
+            chunk, length = [], len(prefix) + 1
+            added = len(encoded)
+        chunk.append(encoded)
+        length += added
+
+    if chunk:
+        urls.append(prefix + ",".join(chunk) + ")")
+    return urls
+
+
+def merge_batch_results(pages: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Combine the results and errors of several BATCH_GET responses."""
+    results: Dict[str, Any] = {}
+    errors: Dict[str, Any] = {}
+    for page in pages:
+        results.update(page.get("results") or {})
+        errors.update(page.get("errors") or {})
+    return {"status": "success", "results": results, "errors": errors}
+
+
+def build_api_headers(access_token: str) -> Dict[str, str]:
+    """Build the headers required by every LinkedIn REST API call."""
+    return {
+        "Authorization": f"Bearer {access_token}",
+        "Content-Type": "application/json",
+        "LinkedIn-Version": os.getenv("LINKEDIN_API_VERSION", "202510"),
+        "X-Restli-Protocol-Version": "2.0.0",
+    }
+
+
+def get_api_base_url(base_url: Optional[str] = None) -> str:
+    """Resolve the REST API base URL from the argument or environment."""
+    return base_url or os.getenv(
+        "LINKEDIN_API_BASE_URL", "https://api.linkedin.com/rest"
+    )
+
+
+def get_pool_limits(
+    pool_connections: Optional[int] = None, pool_maxsize: Optional[int] = None
+) -> Dict[str, int]:
+    """Resolve connection pool sizes from the arguments or environment."""
+    return {
+        "pool_connections": pool_connections
+        or int(os.getenv("LINKEDIN_API_POOL_CONNECTIONS", "10")),
+        "pool_maxsize": pool_maxsize
+        or int(os.getenv("LINKEDIN_API_POOL_MAXSIZE", "10")),
+    }
+
+
+def build_media_content(
+    media_urns: List[str], title: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Build the content block of a post for its media.
+
+    Args:
+        media_urns: One media URN, or several image URNs for a multi-image post
+        title: Title shown for single media (required by LinkedIn for documents)
+
+    Returns:
+        Dict for the "content" field of a post
+    """
+    if len(media_urns) == 1:
+        media = {"id": media_urns[0]}
+        if title:
+            media["title"] = title
+        return {"media": media}
+
+    if not all(urn.startswith("urn:li:image:") for urn in media_urns):
+        raise ValueError("Posts with several media items may only contain images")
+    return {
+        "multiImage": {"images": [{"id": urn, "altText": ""} for urn in media_urns]}
+    }
+
+
+class PostVisibility(str, Enum):
+    """LinkedIn post visibility options."""
+
+    PUBLIC = "PUBLIC"
+    CONNECTIONS = "CONNECTIONS"
+
+
+class ReactionType(str, Enum):
+    """LinkedIn reaction types."""
+
+    LIKE = "LIKE"
+    PRAISE = "PRAISE"
+    APPRECIATION = "APPRECIATION"
+    EMPATHY = "EMPATHY"
+    INTEREST = "INTEREST"
+    ENTERTAINMENT = "ENTERTAINMENT"
+
+
+def extract_post_id_from_url(url: str) -> Optional[str]:
+    """
+    Extract post/activity ID from LinkedIn post URL.
+
+    Supports multiple URL formats:
+    - https://www.linkedin.com/posts/username_activity-7394701839126016000-3V9W
+    - https://www.linkedin.com/feed/update/urn:li:activity:7394701839126016000
+    - https://www.linkedin.com/posts/aemal_llm-ai-promptengineering-activity-7394335719143555072-ye8K
+
+    Args:
+        url: LinkedIn post URL
+
+    Returns:
+        Post/activity ID or None if not found
+    """
+    # Remove URL parameters
+    url = url.split("?")[0]
+
+    patterns = [
+        r"activity[:-](\d{19})",  # Most common: activity-7394701839126016000
+        r"share[:-](\d{19})",  # Share format
+        r"ugcPost[:-](\d{19})",  # UGC post format
+    ]
+
+    for pattern in patterns:
+        match = re.search(pattern, url)
+        if match:
+            return match.group(1)
+
+    return None
@@ -0,0 +1,53 @@
+# linkedin_mcp_server/api/media_cache.py
+"""
+Content-addressed cache of uploaded images.
+
+Campaigns reuse the same logos and banners across many posts. Uploaded images
+are recorded under the SHA-256 of their bytes (per owner, since image URNs
+belong to the member who uploaded them), so posting identical content again
+reuses the existing image URN instead of initializing and uploading it anew.
+Entries expire after a TTL and are verified with get_image before reuse.
+"""
+
+import os
+from pathlib import Path
+from typing import Optional
+
+from linkedin_mcp_server.storage import JSONFileCache
+
+# Lifetime of a cached image URN in seconds (default: 30 days, 0 disables the cache)
+MEDIA_CACHE_TTL = float(os.getenv("LINKEDIN_MEDIA_CACHE_TTL", str(30 * 24 * 3600)))
+
+MEDIA_CACHE_FILE = "media_urns.json"
+
+
+class MediaCache(JSONFileCache):
+    """SHA-256 of image bytes to image URN mapping, per owner."""
+
+    def __init__(self, path: Optional[Path] = None, ttl: Optional[float] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            path: Cache file (default: media_urns.json in the data directory)
+            ttl: Entry lifetime in seconds (default: LINKEDIN_MEDIA_CACHE_TTL)
+        """
+        super().__init__(
+            MEDIA_CACHE_FILE, MEDIA_CACHE_TTL if ttl is None else ttl, path
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    def get_urn(self, owner_urn: str, digest: str) -> Optional[str]:
+        """Image URN previously uploaded by owner_urn with these bytes, if any."""
+        return self.get(f"{owner_urn}|{digest}")
+
+    def set_urn(self, owner_urn: str, digest: str, image_urn: str) -> None:
+        """Record the image URN uploaded by owner_urn for these bytes."""
+        self.set(f"{owner_urn}|{digest}", image_urn)
+
+    def invalidate_urn(self, owner_urn: str, digest: str) -> bool:
+        """Forget a cached image URN that can no longer be used."""
+        return self.invalidate(f"{owner_urn}|{digest}")
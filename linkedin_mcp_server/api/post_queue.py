@@ -0,0 +1,475 @@
+# linkedin_mcp_server/api/post_queue.py
+"""
+Durable queue of scheduled LinkedIn posts and the background publisher.
+
+Posts are enqueued into a SQLite database in the data directory with the time
+they should go out, so agents do not block a tool call on each publish and the
+queue survives restarts. A background asyncio task publishes due posts through
+the API client, where the shared rate limiter smooths bursts into a steady
+rate. Failed publishes are retried with backoff before being marked failed.
+
+Several server processes may share the queue: a post is claimed with a
+conditional update, so only one of them publishes it. A claim is a lease held
+by its process; posts are only returned to the queue once the lease has
+expired (e.g. because the process crashed), never while another process may
+still be publishing them.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import socket
+import sqlite3
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from linkedin_mcp_server.storage import get_data_dir
+
+from .common import PostVisibility
+from .retry import RetryPolicy
+
+logger = logging.getLogger(__name__)
+
+POST_QUEUE_FILE = "post_queue.db"
+
+# Longest sleep between queue checks when nothing is due
+SCHEDULER_POLL_INTERVAL = float(os.getenv("LINKEDIN_SCHEDULER_POLL_INTERVAL", "30"))
+
+# Publish attempts per post before it is marked failed
+SCHEDULER_MAX_ATTEMPTS = int(os.getenv("LINKEDIN_SCHEDULER_MAX_ATTEMPTS", "3"))
+
+# Seconds a claimed post is reserved for its publisher before it is re-queued;
+# must exceed the time a publish (image uploads included) can take
+SCHEDULER_CLAIM_LEASE = float(os.getenv("LINKEDIN_SCHEDULER_CLAIM_LEASE", "600"))
+
+# Queue entry states
+PENDING = "pending"
+PUBLISHING = "publishing"
+PUBLISHED = "published"
+FAILED = "failed"
+CANCELLED = "cancelled"
+POST_STATES = (PENDING, PUBLISHING, PUBLISHED, FAILED, CANCELLED)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS scheduled_posts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    text TEXT NOT NULL,
+    visibility TEXT NOT NULL,
+    image_urls TEXT NOT NULL,
+    scheduled_at REAL NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    post_urn TEXT,
+    error TEXT,
+    claimed_by TEXT,
+    claimed_at REAL,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS scheduled_posts_due ON scheduled_posts (status, scheduled_at);
+"""
+
+
+def parse_schedule_time(value: Optional[str]) -> float:
+    """
+    Parse an ISO 8601 publish time into a UNIX timestamp.
+
+    Args:
+        value: ISO 8601 date-time; without a timezone it is taken as UTC.
+            None or empty means now.
+
+    Returns:
+        float: UNIX timestamp
+
+    Raises:
+        ValueError: If the value is not a valid ISO 8601 date-time
+    """
+    if not value:
+        return time.time()
+    when = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return when.timestamp()
+
+
+def _format_time(timestamp: Optional[float]) -> Optional[str]:
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat()
+
+
+class PostQueue:
+    """SQLite-backed queue of posts keyed by scheduled time."""
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        owner: Optional[str] = None,
+        lease: Optional[float] = None,
+    ):
+        """
+        Initialize the queue, creating the database if needed.
+
+        Args:
+            path: Database file (default: post_queue.db in the data directory)
+            owner: Name recorded on claims (default: unique per queue instance)
+            lease: Seconds a claim is held (default: LINKEDIN_SCHEDULER_CLAIM_LEASE)
+
+        Raises:
+            sqlite3.Error, OSError: If the database cannot be opened
+        """
+        self.path = path or get_data_dir() / POST_QUEUE_FILE
+        self.owner = (
+            owner or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        )
+        self.lease = SCHEDULER_CLAIM_LEASE if lease is None else lease
+        with self._connect() as db:
+            db.execute("PRAGMA journal_mode=WAL")
+            db.executescript(_SCHEMA)
+            columns = {
+                row["name"] for row in db.execute("PRAGMA table_info(scheduled_posts)")
+            }
+            for column, kind in (("claimed_by", "TEXT"), ("claimed_at", "REAL")):
+                if column not in columns:
+                    db.execute(
+                        f"ALTER TABLE scheduled_posts ADD COLUMN {column} {kind}"
+                    )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # Short-lived connections, so the queue can be used from any thread
+        db = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        db.row_factory = sqlite3.Row
+        try:
+            yield db
+        finally:
+            db.close()
+
+    def enqueue(
+        self,
+        text: str,
+        visibility: PostVisibility = PostVisibility.PUBLIC,
+        image_urls: Optional[List[str]] = None,
+        scheduled_at: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Add a post to the queue.
+
+        Args:
+            text: Post content
+            visibility: PUBLIC or CONNECTIONS
+            image_urls: Optional image URLs or local file paths, uploaded at publish time
+            scheduled_at: UNIX timestamp to publish at (default: now)
+
+        Returns:
+            Dict describing the queued post
+        """
+        now = time.time()
+        with self._connect() as db:
+            cursor = db.execute(
+                "INSERT INTO scheduled_posts (text, visibility, image_urls, scheduled_at,"
+                " status, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    text,
+                    visibility.value,
+                    json.dumps(image_urls or []),
+                    scheduled_at if scheduled_at is not None else now,
+                    PENDING,
+                    now,
+                    now,
+                ),
+            )
+            return self.get(cursor.lastrowid, db)
+
+    def get(
+        self, post_id: int, db: Optional[sqlite3.Connection] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Get a queued post by ID."""
+        if db is None:
+            with self._connect() as db:
+                return self.get(post_id, db)
+        row = db.execute(
+            "SELECT * FROM scheduled_posts WHERE id = ?", (post_id,)
+        ).fetchone()
+        return self._to_dict(row) if row else None
+
+    def list(
+        self, status: Optional[str] = None, limit: int = 50
+    ) -> List[Dict[str, Any]]:
+        """
+        List queued posts ordered by scheduled time.
+
+        Args:
+            status: Only posts in this state (default: all)
+            limit: Maximum number of posts
+
+        Returns:
+            List of queued posts
+        """
+        query = "SELECT * FROM scheduled_posts"
+        params: List[Any] = []
+        if status:
+            query += " WHERE status = ?"
+            params.append(status)
+        query += " ORDER BY scheduled_at, id LIMIT ?"
+        params.append(limit)
+
+        with self._connect() as db:
+            return [self._to_dict(row) for row in db.execute(query, params)]
+
+    def cancel(self, post_id: int) -> bool:
+        """
+        Cancel a post that has not been published yet.
+
+        Returns:
+            bool: True if the post was pending and is now cancelled
+        """
+        with self._connect() as db:
+            cursor = db.execute(
+                "UPDATE scheduled_posts SET status = ?, updated_at = ?"
+                " WHERE id = ? AND status = ?",
+                (CANCELLED, time.time(), post_id, PENDING),
+            )
+            return cursor.rowcount == 1
+
+    def claim_due(self, now: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Claim the earliest due pending post for publishing.
+
+        Returns:
+            Optional[Dict[str, Any]]: The claimed post, or None if nothing is due
+        """
+        now = time.time() if now is None else now
+        with self._connect() as db:
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                row = db.execute(
+                    "SELECT id FROM scheduled_posts WHERE status = ? AND scheduled_at <= ?"
+                    " ORDER BY scheduled_at, id LIMIT 1",
+                    (PENDING, now),
+                ).fetchone()
+                if row is None:
+                    db.execute("COMMIT")
+                    return None
+                db.execute(
+                    "UPDATE scheduled_posts SET status = ?, claimed_by = ?, claimed_at = ?,"
+                    " updated_at = ? WHERE id = ?",
+                    (PUBLISHING, self.owner, now, now, row["id"]),
+                )
+                db.execute("COMMIT")
+            except BaseException:
+                db.execute("ROLLBACK")
+                raise
+            return self.get(row["id"], db)
+
+    def next_due_time(self) -> Optional[float]:
+        """Scheduled time of the earliest pending post, if any."""
+        with self._connect() as db:
+            row = db.execute(
+                "SELECT MIN(scheduled_at) FROM scheduled_posts WHERE status = ?",
+                (PENDING,),
+            ).fetchone()
+            return row[0]
+
+    def mark_published(self, post_id: int, post_urn: str) -> None:
+        """Record a successful publish."""
+        with self._connect() as db:
+            db.execute(
+                "UPDATE scheduled_posts SET status = ?, post_urn = ?, error = NULL,"
+                " attempts = attempts + 1, claimed_by = NULL, claimed_at = NULL,"
+                " updated_at = ? WHERE id = ?",
+                (PUBLISHED, post_urn, time.time(), post_id),
+            )
+
+    def mark_failed(
+        self, post_id: int, error: str, retry_at: Optional[float] = None
+    ) -> None:
+        """
+        Record a failed publish attempt of a post claimed by this queue.
+
+        Args:
+            post_id: ID of the post
+            error: Error message of the attempt
+            retry_at: When to try again; None marks the post failed for good
+        """
+        status = FAILED if retry_at is None else PENDING
+        with self._connect() as db:
+            db.execute(
+                "UPDATE scheduled_posts SET status = ?, error = ?,"
+                " scheduled_at = COALESCE(?, scheduled_at), attempts = attempts + 1,"
+                " claimed_by = NULL, claimed_at = NULL, updated_at = ?"
+                " WHERE id = ? AND status = ? AND claimed_by = ?",
+                (status, error, retry_at, time.time(), post_id, PUBLISHING, self.owner),
+            )
+
+    def recover(self, now: Optional[float] = None) -> int:
+        """
+        Return posts whose claim lease has expired (e.g. after a crash) to the queue.
+
+        Posts still within their lease are left alone, since their publisher
+        may be in the middle of creating them.
+
+        Returns:
+            int: Number of recovered posts
+        """
+        now = time.time() if now is None else now
+        with self._connect() as db:
+            cursor = db.execute(
+                "UPDATE scheduled_posts SET status = ?, claimed_by = NULL, claimed_at = NULL,"
+                " updated_at = ? WHERE status = ? AND COALESCE(claimed_at, 0) <= ?",
+                (PENDING, now, PUBLISHING, now - self.lease),
+            )
+            return cursor.rowcount
+
+    @staticmethod
+    def _to_dict(row: sqlite3.Row) -> Dict[str, Any]:
+        return {
+            "id": row["id"],
+            "text": row["text"],
+            "visibility": row["visibility"],
+            "image_urls": json.loads(row["image_urls"]),
+            "scheduled_at": _format_time(row["scheduled_at"]),
+            "status": row["status"],
+            "attempts": row["attempts"],
+            "post_urn": row["post_urn"],
+            "error": row["error"],
+            "created_at": _format_time(row["created_at"]),
+        }
+
+
+class PostScheduler:
+    """Background asyncio task that publishes due posts from a PostQueue."""
+
+    def __init__(
+        self,
+        client: Any,
+        queue: PostQueue,
+        poll_interval: Optional[float] = None,
+        max_attempts: Optional[int] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            client: AsyncLinkedInAPIClient used to upload images and publish
+            queue: Queue to publish from
+            poll_interval: Longest sleep between queue checks (default:
+                LINKEDIN_SCHEDULER_POLL_INTERVAL)
+            max_attempts: Publish attempts per post (default:
+                LINKEDIN_SCHEDULER_MAX_ATTEMPTS)
+            retry_policy: Backoff between attempts (default: RetryPolicy())
+        """
+        self.client = client
+        self.queue = queue
+        self.poll_interval = poll_interval or SCHEDULER_POLL_INTERVAL
+        self.max_attempts = max_attempts or SCHEDULER_MAX_ATTEMPTS
+        self.retry_policy = retry_policy or RetryPolicy(base_delay=30, max_delay=900)
+        self._task: Optional[asyncio.Task] = None
+        self._wake: Optional[asyncio.Event] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def ensure_started(self) -> None:
+        """Start the publisher on the running event loop if it is not running."""
+        if self.running:
+            return
+
+        self._wake = asyncio.Event()
+        self._task = asyncio.get_running_loop().create_task(
+            self._run(), name="linkedin-post-scheduler"
+        )
+        logger.info("Post scheduler started")
+
+    def wake(self) -> None:
+        """Re-check the queue now (e.g. after a post was enqueued)."""
+        if self._wake is not None:
+            self._wake.set()
+
+    async def stop(self) -> None:
+        """Stop the publisher; queued posts stay in the database."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        assert self._wake is not None
+        while True:
+            try:
+                # Pick up posts of publishers that died while holding a claim
+                recovered = await asyncio.to_thread(self.queue.recover)
+                if recovered:
+                    logger.warning(
+                        f"Re-queued {recovered} post(s) whose publish claim expired"
+                    )
+
+                post = await asyncio.to_thread(self.queue.claim_due)
+                if post is not None:
+                    await self._publish(post)
+                    continue
+
+                next_due = await asyncio.to_thread(self.queue.next_due_time)
+            except sqlite3.Error as e:
+                logger.error(f"Post queue unavailable: {e}")
+                next_due = None
+
+            timeout = self.poll_interval
+            if next_due is not None:
+                timeout = min(max(next_due - time.time(), 0.0), self.poll_interval)
+
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+
+    async def _publish(self, post: Dict[str, Any]) -> None:
+        try:
+            media_urns = None
+            if post["image_urls"]:
+                upload_result = await self.client.upload_images(post["image_urls"])
+                media_urns = upload_result["image_urns"]
+
+            result = await self.client.create_post(
+                post["text"], PostVisibility(post["visibility"]), media_urns
+            )
+        except Exception as e:
+            attempt = post["attempts"] + 1
+            retry_at = None
+            if attempt < self.max_attempts:
+                retry_at = time.time() + self.retry_policy.backoff(attempt)
+            logger.warning(
+                f"Scheduled post {post['id']} failed (attempt {attempt}): {e}"
+            )
+            await asyncio.to_thread(
+                self.queue.mark_failed, post["id"], str(e), retry_at
+            )
+            return
+
+        # LinkedIn has accepted the post: from here on it must never be
+        # published again, so bookkeeping failures are retried, not the publish
+        post_urn = result["post_urn"]
+        for attempt in range(1, self.retry_policy.max_attempts + 1):
+            try:
+                await asyncio.to_thread(self.queue.mark_published, post["id"], post_urn)
+                break
+            except sqlite3.Error as e:
+                if attempt == self.retry_policy.max_attempts:
+                    logger.error(
+                        f"Scheduled post {post['id']} was published as {post_urn} "
+                        f"but could not be recorded: {e}"
+                    )
+                    return
+                await asyncio.sleep(self.retry_policy.backoff(attempt))
+        logger.info(f"Published scheduled post {post['id']}: {post_urn}")
@@ -0,0 +1,203 @@
+# linkedin_mcp_server/api/ratelimit.py
+"""
+Client-side rate limiting for LinkedIn REST API calls.
+
+Every API request passes through a token bucket for its endpoint family (posts,
+reactions, images, videos, documents, or other). When a bucket is empty the
+request waits for its turn instead of being rejected, so bulk jobs run at the
+configured ceiling rather than hitting LinkedIn's throttles and failing.
+
+Limits are set per family with LINKEDIN_RATE_LIMIT_<FAMILY>="<rate>[/<burst>]",
+e.g. LINKEDIN_RATE_LIMIT_REACTIONS="2/10" for 2 requests per second with bursts
+of up to 10. A rate of 0 disables limiting for that family.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+# Default (requests per second, burst) per endpoint family
+DEFAULT_RATE_LIMITS: Dict[str, Tuple[float, float]] = {
+    "posts": (1.0, 5.0),
+    "reactions": (5.0, 10.0),
+    "images": (5.0, 10.0),
+    "videos": (5.0, 10.0),
+    "documents": (5.0, 10.0),
+    "other": (10.0, 20.0),
+}
+
+
+def endpoint_family(url: str) -> str:
+    """
+    Map an API URL to its rate limit family.
+
+    Args:
+        url: Request URL (e.g. https://api.linkedin.com/rest/posts/urn...)
+
+    Returns:
+        str: Family name, "other" for endpoints without a dedicated bucket
+    """
+    segments = [s for s in urlsplit(url).path.split("/") if s]
+    for segment in segments[:3]:
+        if segment in DEFAULT_RATE_LIMITS:
+            return segment
+    return "other"
+
+
+def parse_rate_limit(value: str) -> Tuple[float, float]:
+    """
+    Parse a "<rate>[/<burst>]" limit; the burst defaults to max(1, rate).
+
+    Raises:
+        ValueError: If the value is malformed or negative
+    """
+    rate_text, _, burst_text = value.strip().partition("/")
+    rate = float(rate_text)
+    burst = float(burst_text) if burst_text else max(1.0, rate)
+    if rate < 0 or burst < 1:
+        raise ValueError(f"Invalid rate limit '{value}'")
+    return rate, burst
+
+
+class TokenBucket:
+    """Thread-safe token bucket that hands out reservations in FIFO order."""
+
+    def __init__(self, rate: float, burst: float):
+        """
+        Initialize the bucket full.
+
+        Args:
+            rate: Tokens added per second (0 means unlimited)
+            burst: Bucket capacity
+        """
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+        self.requests = 0
+        self.throttled = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def reserve(self) -> float:
+        """
+        Take one token, going into debt if none are available.
+
+        Returns:
+            float: Seconds the caller must wait before sending its request
+        """
+        with self._lock:
+            self.requests += 1
+            if self.rate <= 0:
+                return 0.0
+
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            if wait > 0:
+                self.throttled += 1
+                self.total_wait += wait
+                self.max_wait = max(self.max_wait, wait)
+            return wait
+
+    def stats(self) -> Dict[str, Any]:
+        """Current limit, available tokens and wait statistics."""
+        with self._lock:
+            tokens = self._tokens
+            if self.rate > 0:
+                elapsed = time.monotonic() - self._updated
+                tokens = min(self.burst, tokens + elapsed * self.rate)
+            return {
+                "rate_per_second": self.rate,
+                "burst": self.burst,
+                "available_tokens": round(tokens, 2),
+                "requests": self.requests,
+                "throttled": self.throttled,
+                "total_wait_seconds": round(self.total_wait, 3),
+                "max_wait_seconds": round(self.max_wait, 3),
+            }
+
+
+class RateLimiter:
+    """One token bucket per endpoint family."""
+
+    def __init__(self, limits: Optional[Dict[str, Tuple[float, float]]] = None):
+        """
+        Initialize the limiter.
+
+        Args:
+            limits: (rate, burst) per family (default: DEFAULT_RATE_LIMITS
+                overridden by LINKEDIN_RATE_LIMIT_<FAMILY> variables)
+        """
+        if limits is None:
+            limits = load_rate_limits()
+        self.buckets = {
+            family: TokenBucket(rate, burst) for family, (rate, burst) in limits.items()
+        }
+        self.buckets.setdefault("other", TokenBucket(*DEFAULT_RATE_LIMITS["other"]))
+
+    def _reserve(self, url: str) -> float:
+        family = endpoint_family(url)
+        wait = self.buckets.get(family, self.buckets["other"]).reserve()
+        if wait > 0:
+            logger.debug(f"Rate limit: delaying {family} request by {wait:.2f}s")
+        return wait
+
+    def acquire(self, url: str) -> None:
+        """Block until a request to url may be sent."""
+        wait = self._reserve(url)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self, url: str) -> None:
+        """Wait without blocking the event loop until a request to url may be sent."""
+        wait = self._reserve(url)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Statistics of every bucket, keyed by endpoint family."""
+        return {family: bucket.stats() for family, bucket in self.buckets.items()}
+
+
+def load_rate_limits() -> Dict[str, Tuple[float, float]]:
+    """Default limits overridden by LINKEDIN_RATE_LIMIT_<FAMILY> variables."""
+    limits = dict(DEFAULT_RATE_LIMITS)
+    for family in DEFAULT_RATE_LIMITS:
+        value = os.getenv(f"LINKEDIN_RATE_LIMIT_{family.upper()}")
+        if not value:
+            continue
+        try:
+            limits[family] = parse_rate_limit(value)
+        except ValueError:
+            logger.warning(
+                f"Ignoring invalid LINKEDIN_RATE_LIMIT_{family.upper()}='{value}'"
+            )
+    return limits
+
+
+# Shared by all clients in the process, since LinkedIn throttles per app and member
+_rate_limiter: Optional[RateLimiter] = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Get the process-wide rate limiter, creating it on first use."""
+    global _rate_limiter
+    with _rate_limiter_lock:
+        if _rate_limiter is None:
+            _rate_limiter = RateLimiter()
+        return _rate_limiter
@@ -0,0 +1,110 @@
+# linkedin_mcp_server/api/retry.py
+"""
+Retry policy for transient LinkedIn API failures.
+
+Idempotent requests (GET, DELETE, PATCH) that fail with a connection error or a
+429/5xx response are retried with capped exponential backoff and full jitter,
+honoring Retry-After when LinkedIn sends it. Each call has an overall deadline,
+so retries never stretch a tool call indefinitely.
+"""
+
+import os
+import random
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+# Status codes that signal a transient failure
+RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+# Methods that are safe to send again after an unknown outcome
+RETRY_METHODS = frozenset({"GET", "HEAD", "DELETE", "PATCH"})
+
+
+@dataclass
+class RetryPolicy:
+    """Backoff settings for retried requests."""
+
+    max_attempts: int = 4
+    base_delay: float = 0.5
+    max_delay: float = 30.0
+    deadline: float = 60.0
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Delay before the next attempt, using full jitter.
+
+        Args:
+            attempt: Number of failed attempts so far (1-based)
+
+        Returns:
+            float: Random delay between 0 and the capped exponential backoff
+        """
+        return random.uniform(
+            0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        )
+
+    def next_delay(
+        self, attempt: int, started: float, retry_after: Optional[float] = None
+    ) -> Optional[float]:
+        """
+        Decide whether and when to retry after a failed attempt.
+
+        Args:
+            attempt: Number of failed attempts so far (1-based)
+            started: time.monotonic() when the call started
+            retry_after: Delay requested by the server, if any
+
+        Returns:
+            Optional[float]: Seconds to wait, or None if the call should give up
+        """
+        if attempt >= self.max_attempts:
+            return None
+
+        delay = retry_after if retry_after is not None else self.backoff(attempt)
+        if time.monotonic() - started + delay > self.deadline:
+            return None
+        return delay
+
+    def remaining(self, started: float) -> float:
+        """Seconds left until the call's deadline."""
+        return max(0.0, self.deadline - (time.monotonic() - started))
+
+
+def load_retry_policy() -> RetryPolicy:
+    """Retry policy from LINKEDIN_RETRY_* environment variables."""
+    defaults = RetryPolicy()
+    return RetryPolicy(
+        max_attempts=int(
+            os.getenv("LINKEDIN_RETRY_MAX_ATTEMPTS", str(defaults.max_attempts))
+        ),
+        base_delay=float(
+            os.getenv("LINKEDIN_RETRY_BASE_DELAY", str(defaults.base_delay))
+        ),
+        max_delay=float(os.getenv("LINKEDIN_RETRY_MAX_DELAY", str(defaults.max_delay))),
+        deadline=float(os.getenv("LINKEDIN_RETRY_DEADLINE", str(defaults.deadline))),
+    )
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header.
+
+    Args:
+        value: Header value, either delay seconds or an HTTP date
+
+    Returns:
+        Optional[float]: Seconds to wait, or None if absent or invalid
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
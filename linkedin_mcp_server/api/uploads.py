@@ -0,0 +1,279 @@
+# linkedin_mcp_server/api/uploads.py
+"""
+Streaming helpers for media uploads.
+
+Media can come from a URL or a local file. URL bodies are streamed straight into
+the upload request in bounded chunks, and local files are memory-mapped, so peak
+memory stays flat regardless of the media size and the upload starts as soon as
+the first chunk arrives. Tool callers may be remote, so local files are only
+read from the LINKEDIN_UPLOAD_DIR directory. Multipart uploads (videos) are split into the byte
+ranges LinkedIn returns, and only the parts in flight are held in memory.
+"""
+
+import hashlib
+import mmap
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    BinaryIO,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Union,
+)
+
+# Only directory local media may be read from (unset: local files are refused)
+UPLOAD_DIR = os.getenv("LINKEDIN_UPLOAD_DIR")
+
+# Size of each buffered chunk while streaming media (default: 1 MiB)
+UPLOAD_CHUNK_SIZE = int(os.getenv("LINKEDIN_UPLOAD_CHUNK_SIZE", str(1024 * 1024)))
+
+# Parts of a multipart upload sent concurrently
+UPLOAD_WORKERS = int(os.getenv("LINKEDIN_UPLOAD_WORKERS", "4"))
+
+# Retries per failed part, with exponential backoff starting at PART_RETRY_BACKOFF
+UPLOAD_PART_RETRIES = int(os.getenv("LINKEDIN_UPLOAD_PART_RETRIES", "3"))
+PART_RETRY_BACKOFF = 1.0
+
+# Ceiling in seconds for uploaded media to finish processing
+MEDIA_READY_TIMEOUT = float(os.getenv("LINKEDIN_MEDIA_READY_TIMEOUT", "120"))
+
+# Processing status polling: first delay, growth factor and maximum delay
+POLL_INITIAL_DELAY = 0.5
+POLL_BACKOFF_FACTOR = 1.5
+POLL_MAX_DELAY = 8.0
+
+# Media processing states reported by the images/videos/documents APIs
+MEDIA_AVAILABLE = "AVAILABLE"
+MEDIA_FAILED = "PROCESSING_FAILED"
+
+Buffer = Union[mmap.mmap, bytes]
+
+
+class UploadPart(NamedTuple):
+    """One byte range of a multipart upload."""
+
+    index: int
+    url: str
+    start: int
+    end: int  # exclusive
+
+    @property
+    def size(self) -> int:
+        return self.end - self.start
+
+
+def upload_parts(instructions: List[Dict[str, Any]]) -> List[UploadPart]:
+    """
+    Convert LinkedIn uploadInstructions into parts ordered by byte offset.
+
+    Args:
+        instructions: Entries with uploadUrl, firstByte and lastByte (inclusive)
+
+    Returns:
+        List of parts; ETags must be reported to finalizeUpload in this order
+    """
+    ordered = sorted(instructions, key=lambda i: int(i["firstByte"]))
+    return [
+        UploadPart(index, i["uploadUrl"], int(i["firstByte"]), int(i["lastByte"]) + 1)
+        for index, i in enumerate(ordered)
+    ]
+
+
+def part_retry_delay(attempt: int) -> float:
+    """Backoff in seconds before retrying a part for the given attempt (0-based)."""
+    return PART_RETRY_BACKOFF * (2**attempt)
+
+
+def poll_delays(timeout: float) -> Iterator[float]:
+    """
+    Yield growing delays between status polls until timeout is used up.
+
+    Small files are usually processed within a second, so polling starts fast
+    and backs off for large files instead of hammering the API.
+
+    Args:
+        timeout: Total time budget in seconds
+
+    Yields:
+        Seconds to wait before the next poll
+    """
+    delay = POLL_INITIAL_DELAY
+    remaining = timeout
+    while remaining > 0:
+        step = min(delay, remaining)
+        yield step
+        remaining -= step
+        delay = min(delay * POLL_BACKOFF_FACTOR, POLL_MAX_DELAY)
+
+
+def is_local_source(source: str) -> bool:
+    """Check whether a media source is a local file rather than an HTTP(S) URL."""
+    return not source.lower().startswith(("http://", "https://"))
+
+
+def local_path(source: str) -> Path:
+    """
+    Resolve a local media source (plain path or file:// URL) to a path.
+
+    Args:
+        source: Path or file:// URL, relative paths are taken from UPLOAD_DIR
+
+    Returns:
+        Resolved path inside UPLOAD_DIR
+
+    Raises:
+        PermissionError: If LINKEDIN_UPLOAD_DIR is unset or the path is outside it
+    """
+    if not UPLOAD_DIR:
+        raise PermissionError(
+            "Local file uploads are disabled. Set LINKEDIN_UPLOAD_DIR to the "
+            "directory media may be uploaded from, or pass an HTTP(S) URL"
+        )
+    if source.lower().startswith("file://"):
+        source = source[len("file://") :]
+
+    # Resolve symlinks and ".." before checking containment
+    upload_dir = Path(UPLOAD_DIR).expanduser().resolve()
+    path = (upload_dir / Path(source).expanduser()).resolve()
+    if not path.is_relative_to(upload_dir):
+        raise PermissionError(f"Local file {source} is outside LINKEDIN_UPLOAD_DIR")
+    return path
+
+
+@contextmanager
+def map_file(path: Path) -> Iterator[Buffer]:
+    """
+    Memory-map a file read-only.
+
+    Pages are loaded on demand by the OS and can be evicted again, so large files
+    never have to fit into process memory.
+
+    Args:
+        path: File to map
+
+    Yields:
+        Read-only buffer over the file contents
+    """
+    with open(path, "rb") as f:
+        with map_open_file(f) as buffer:
+            yield buffer
+
+
+@contextmanager
+def map_open_file(f: BinaryIO) -> Iterator[Buffer]:
+    """Memory-map an open binary file read-only (see map_file())."""
+    if os.fstat(f.fileno()).st_size == 0:
+        # Empty files cannot be mapped
+        yield b""
+        return
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        yield buffer
+
+
+def sha256_digest(buffer: Buffer) -> str:
+    """Hex SHA-256 of a buffer, hashed in bounded chunks."""
+    digest = hashlib.sha256()
+    for chunk in iter_chunks(buffer):
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+def iter_chunks(
+    buffer: Buffer,
+    start: int = 0,
+    end: Optional[int] = None,
+    chunk_size: int = UPLOAD_CHUNK_SIZE,
+) -> Iterator[bytes]:
+    """Yield bounded chunks of buffer[start:end]."""
+    end = len(buffer) if end is None else end
+    for offset in range(start, end, chunk_size):
+        yield buffer[offset : min(offset + chunk_size, end)]
+
+
+async def aiter_chunks(
+    buffer: Buffer,
+    start: int = 0,
+    end: Optional[int] = None,
+    chunk_size: int = UPLOAD_CHUNK_SIZE,
+) -> AsyncIterator[bytes]:
+    """Async variant of iter_chunks() for httpx request bodies."""
+    for chunk in iter_chunks(buffer, start, end, chunk_size):
+        yield chunk
+
+
+def content_length(headers: Mapping[str, str]) -> Optional[int]:
+    """
+    Length of a response body as it will be streamed, if known up front.
+
+    Encoded bodies are decoded while streaming, so their header length is unusable.
+    """
+    if headers.get("Content-Encoding", "identity") != "identity":
+        return None
+    try:
+        return int(headers["Content-Length"])
+    except (KeyError, ValueError):
+        return None
+
+
+def slice_parts(buffer: Buffer, parts: List[UploadPart]) -> Iterator[bytes]:
+    """Yield the body of each part from a mapped file, one part at a time."""
+    for part in parts:
+        yield buffer[part.start : part.end]
+
+
+async def aslice_parts(buffer: Buffer, parts: List[UploadPart]) -> AsyncIterator[bytes]:
+    """Async variant of slice_parts()."""
+    for body in slice_parts(buffer, parts):
+        yield body
+
+
+def regroup_parts(chunks: Iterable[bytes], parts: List[UploadPart]) -> Iterator[bytes]:
+    """
+    Regroup a sequential byte stream into part bodies.
+
+    Only the part being assembled is held in memory.
+
+    Args:
+        chunks: Stream of the full media, in order
+        parts: Parts covering the media contiguously from offset 0
+
+    Yields:
+        Body of each part, in order
+    """
+    pending = bytearray()
+    remaining = iter(parts)
+    part = next(remaining, None)
+    for chunk in chunks:
+        pending += chunk
+        while part is not None and len(pending) >= part.size:
+            yield bytes(pending[: part.size])
+            del pending[: part.size]
+            part = next(remaining, None)
+    if part is not None:
+        raise ValueError("Media stream ended before all upload parts were filled")
+
+
+async def aregroup_parts(
+    chunks: AsyncIterable[bytes], parts: List[UploadPart]
+) -> AsyncIterator[bytes]:
+    """Async variant of regroup_parts()."""
+    pending = bytearray()
+    remaining = iter(parts)
+    part = next(remaining, None)
+    async for chunk in chunks:
+        pending += chunk
+        while part is not None and len(pending) >= part.size:
+            yield bytes(pending[: part.size])
+            del pending[: part.size]
+            part = next(remaining, None)
+    if part is not None:
+        raise ValueError("Media stream ended before all upload parts were filled")
@@ -0,0 +1,81 @@
+# linkedin_mcp_server/api/urn_cache.py
+"""
+Persistent cache of the person URN behind an access token.
+
+Every post, upload and reaction needs the author URN, which costs one or two
+lookups (/v2/userinfo, then /rest/me). Short-lived stdio workers would repeat
+them on every start, so the mapping is stored on disk. Entries are keyed by a
+SHA-256 hash of the token (the token itself is never written), expire after a
+TTL and are dropped when the API rejects the token with 401.
+"""
+
+import hashlib
+import logging
+import os
+from pathlib import Path
+from typing import Optional
+
+from linkedin_mcp_server.storage import JSONFileCache
+
+logger = logging.getLogger(__name__)
+
+# Lifetime of a cached URN in seconds (default: 7 days, 0 disables the cache)
+URN_CACHE_TTL = float(os.getenv("LINKEDIN_URN_CACHE_TTL", str(7 * 24 * 3600)))
+
+URN_CACHE_FILE = "person_urns.json"
+
+
+def token_key(access_token: str) -> str:
+    """Cache key for an access token."""
+    return hashlib.sha256(access_token.encode("utf-8")).hexdigest()
+
+
+class PersonURNCache(JSONFileCache):
+    """Token to person URN mapping stored in a small JSON file."""
+
+    def __init__(self, path: Optional[Path] = None, ttl: Optional[float] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            path: Cache file (default: person_urns.json in the data directory)
+            ttl: Entry lifetime in seconds (default: LINKEDIN_URN_CACHE_TTL)
+        """
+        super().__init__(URN_CACHE_FILE, URN_CACHE_TTL if ttl is None else ttl, path)
+
+    def get(self, access_token: str) -> Optional[str]:
+        """
+        Get the cached URN for a token.
+
+        Args:
+            access_token: LinkedIn API access token
+
+        Returns:
+            Optional[str]: Person URN, or None if missing or expired
+        """
+        return super().get(token_key(access_token))
+
+    def set(self, access_token: str, urn: str) -> None:
+        """
+        Cache the URN for a token.
+
+        Args:
+            access_token: LinkedIn API access token
+            urn: Person URN the token belongs to
+        """
+        super().set(token_key(access_token), urn)
+
+    def invalidate(self, access_token: str) -> bool:
+        """
+        Drop the cached URN for a token (e.g. after a 401 response).
+
+        Args:
+            access_token: LinkedIn API access token
+
+        Returns:
+            bool: True if an entry was removed
+        """
+        removed = super().invalidate(token_key(access_token))
+        if removed:
+            logger.info("Invalidated cached person URN for rejected token")
+        return removed
@@ -0,0 +1,44 @@
+# linkedin_mcp_server/cache/__init__.py
+"""
+Result caching for the browser-based scraping tools.
+
+Scrapes cost a browser navigation and tens of seconds, while agents often ask
+about the same entity several times. This package keeps recent results so
+repeat lookups are answered from memory or disk.
+
+Key Components:
+- ResultCache: In-memory TTL cache with LRU eviction by entry count and bytes
+- ScrapeCache: Compressed SQLite cache shared across restarts and processes
+- read_through: Stale-while-revalidate reads that refresh in the background
+- SingleFlight / scrape_flights: Coalescing of identical in-flight scrapes
+- guard_not_found: Short-lived negative cache of missing or private entities
+- cache_key / normalize_*: Canonical cache keys for tool arguments
+"""
+
+from .disk import ScrapeCache, get_scrape_cache
+from .keys import (
+    cache_key,
+    normalize_company_name,
+    normalize_job_id,
+    normalize_search_term,
+    normalize_username,
+)
+from .memory import ResultCache
+from .negative import guard_not_found
+from .singleflight import SingleFlight, scrape_flights
+from .swr import read_through
+
+__all__ = [
+    "ResultCache",
+    "ScrapeCache",
+    "SingleFlight",
+    "cache_key",
+    "get_scrape_cache",
+    "guard_not_found",
+    "normalize_company_name",
+    "normalize_job_id",
+    "normalize_search_term",
+    "normalize_username",
+    "read_through",
+    "scrape_flights",
+]
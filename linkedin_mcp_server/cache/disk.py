@@ -0,0 +1,254 @@
+# linkedin_mcp_server/cache/disk.py
+"""
+Persistent scrape result cache shared across restarts and processes.
+
+Results are stored as zlib-compressed JSON in a SQLite database in the data
+directory. The database runs in WAL mode, so several server processes on one
+host can read while one of them writes. Each entry carries the TTL of its
+entity kind; when the compressed results exceed the size budget, expired
+entries go first and then the least recently used ones.
+"""
+
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from linkedin_mcp_server.storage import get_data_dir
+
+logger = logging.getLogger(__name__)
+
+SCRAPE_CACHE_FILE = "scrape_cache.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed_at);
+CREATE INDEX IF NOT EXISTS results_expires ON results (expires_at);
+"""
+
+
+class ScrapeCache:
+    """SQLite-backed cache of compressed scrape results with per-entry TTLs."""
+
+    def __init__(self, max_bytes: int, path: Optional[Path] = None):
+        """
+        Initialize the cache, creating the database if needed.
+
+        If the database cannot be opened, a warning is logged and the cache
+        stays disabled, so scraping keeps working without it.
+
+        Args:
+            max_bytes: Budget for the compressed results (0 disables the cache)
+            path: Database file (default: scrape_cache.db in the data directory)
+        """
+        self.max_bytes = max_bytes
+        self.path = path
+        if not self.enabled:
+            return
+        try:
+            self.path = path or get_data_dir() / SCRAPE_CACHE_FILE
+            with self._connect() as db:
+                db.execute("PRAGMA journal_mode=WAL")
+                db.executescript(_SCHEMA)
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Scrape cache disabled, could not open {self.path}: {e}")
+            self.max_bytes = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # Short-lived connections, so the cache can be used from any thread
+        db = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        try:
+            db.execute("PRAGMA synchronous=NORMAL")
+            yield db
+        finally:
+            db.close()
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a cached result and mark it as recently used.
+
+        Args:
+            key: Cache key (see cache_key)
+
+        Returns:
+            Optional[Any]: The result, or None if missing, expired or unreadable
+        """
+        entry = self.get_entry(key)
+        return entry[0] if entry else None
+
+    def get_entry(self, key: str) -> Optional[Tuple[Any, float]]:
+        """
+        Get a cached result with its age and mark it as recently used.
+
+        Args:
+            key: Cache key (see cache_key)
+
+        Returns:
+            Optional[Tuple[Any, float]]: The result and seconds since it was
+                stored, or None if missing, expired or unreadable
+        """
+        if not self.enabled:
+            return None
+
+        now = time.time()
+        try:
+            with self._connect() as db:
+                row = db.execute(
+                    "SELECT value, created_at FROM results WHERE key = ? AND expires_at > ?",
+                    (key, now),
+                ).fetchone()
+                if row is None:
+                    return None
+                db.execute(
+                    "UPDATE results SET accessed_at = ? WHERE key = ?", (now, key)
+                )
+            return json.loads(zlib.decompress(row[0])), now - row[1]
+        except (sqlite3.Error, zlib.error, ValueError) as e:
+            logger.warning(f"Ignoring unreadable scrape cache entry {key}: {e}")
+            return None
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """
+        Cache a JSON-serializable result, evicting entries if over budget.
+
+        Args:
+            key: Cache key (see cache_key)
+            value: Result to store
+            ttl: Lifetime in seconds (0 skips caching)
+        """
+        if not self.enabled or ttl <= 0:
+            return
+
+        blob = zlib.compress(json.dumps(value, default=str).encode("utf-8"))
+        if len(blob) > self.max_bytes:
+            logger.debug(
+                f"Not caching {key}: {len(blob)} bytes exceeds the cache budget"
+            )
+            return
+
+        now = time.time()
+        try:
+            with self._connect() as db:
+                db.execute("BEGIN IMMEDIATE")
+                try:
+                    db.execute(
+                        "INSERT OR REPLACE INTO results"
+                        " (key, kind, value, size, created_at, expires_at, accessed_at)"
+                        " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        (
+                            key,
+                            key.split(":", 1)[0],
+                            blob,
+                            len(blob),
+                            now,
+                            now + ttl,
+                            now,
+                        ),
+                    )
+                    self._evict(db, now)
+                    db.execute("COMMIT")
+                except BaseException:
+                    db.execute("ROLLBACK")
+                    raise
+        except sqlite3.Error as e:
+            logger.warning(f"Could not write scrape cache entry {key}: {e}")
+
+    def _evict(self, db: sqlite3.Connection, now: float) -> None:
+        total = db.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        # Expired entries first, then the least recently used ones
+        db.execute("DELETE FROM results WHERE expires_at <= ?", (now,))
+        total = db.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+
+        evicted = 0
+        for key, size in db.execute(
+            "SELECT key, size FROM results ORDER BY accessed_at"
+        ).fetchall():
+            if total <= self.max_bytes:
+                break
+            db.execute("DELETE FROM results WHERE key = ?", (key,))
+            total -= size
+            evicted += 1
+        if evicted:
+            logger.debug(f"Evicted {evicted} least recently used scrape results")
+
+    def invalidate(self, key: str) -> bool:
+        """
+        Drop a cached result.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            bool: True if an entry was removed
+        """
+        if not self.enabled:
+            return False
+        with self._connect() as db:
+            return db.execute("DELETE FROM results WHERE key = ?", (key,)).rowcount == 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Entry count and compressed size per entity kind."""
+        if not self.enabled:
+            return {}
+        with self._connect() as db:
+            return {
+                kind: {"entries": entries, "bytes": size}
+                for kind, entries, size in db.execute(
+                    "SELECT kind, COUNT(*), SUM(size) FROM results GROUP BY kind"
+                )
+            }
+
+    async def aget(self, key: str) -> Optional[Any]:
+        """get() without blocking the event loop."""
+        if not self.enabled:
+            return None
+        return await asyncio.to_thread(self.get, key)
+
+    async def aget_entry(self, key: str) -> Optional[Tuple[Any, float]]:
+        """get_entry() without blocking the event loop."""
+        if not self.enabled:
+            return None
+        return await asyncio.to_thread(self.get_entry, key)
+
+    async def aset(self, key: str, value: Any, ttl: float) -> None:
+        """set() without blocking the event loop."""
+        if self.enabled and ttl > 0:
+            await asyncio.to_thread(self.set, key, value, ttl)
+
+
+# Shared by all scraping tools in the process
+_scrape_cache: Optional[ScrapeCache] = None
+_scrape_cache_lock = threading.Lock()
+
+
+def get_scrape_cache() -> ScrapeCache:
+    """Get the process-wide scrape cache, creating it on first use."""
+    from linkedin_mcp_server.config import get_config
+
+    global _scrape_cache
+    with _scrape_cache_lock:
+        if _scrape_cache is None:
+            _scrape_cache = ScrapeCache(get_config().cache.disk_max_bytes)
+        return _scrape_cache
@@ -0,0 +1,72 @@
+# linkedin_mcp_server/cache/keys.py
+"""
+Cache keys for scraping tool arguments.
+
+Callers refer to the same entity in different ways ("Anthropic", "anthropic/",
+a full company URL), so arguments are normalized before they are used as keys
+and as scrape targets.
+"""
+
+import re
+from typing import Any
+from urllib.parse import unquote, urlsplit
+
+
+def _slug(value: str, section: str) -> str:
+    """Lowercase slug of a bare name or of a linkedin.com/<section>/<slug> URL."""
+    value = value.strip()
+    if "linkedin.com/" in value:
+        path = urlsplit(value if "://" in value else f"https://{value}").path
+        segments = [s for s in path.split("/") if s]
+        if len(segments) >= 2 and segments[0] == section:
+            value = segments[1]
+    return unquote(value).strip("/").lower()
+
+
+def normalize_username(value: str) -> str:
+    """
+    Canonical key for a LinkedIn username.
+
+    Accepts bare usernames as well as profile URLs, so "JohnDoe",
+    "johndoe/" and "https://www.linkedin.com/in/johndoe/" share one entry.
+
+    Args:
+        value: LinkedIn username or profile URL
+
+    Returns:
+        str: Lowercase username
+    """
+    return _slug(value, "in")
+
+
+def normalize_company_name(value: str) -> str:
+    """Canonical key for a LinkedIn company name or company page URL."""
+    return _slug(value, "company")
+
+
+def normalize_job_id(value: str) -> str:
+    """Canonical key for a LinkedIn job ID or job posting URL."""
+    value = value.strip()
+    match = re.search(r"/jobs/view/(?:[^/?#]*-)?(\d+)", value)
+    if match:
+        return match.group(1)
+    return value.strip("/")
+
+
+def normalize_search_term(value: str) -> str:
+    """Canonical key for a search term: lowercase with collapsed whitespace."""
+    return " ".join(value.lower().split())
+
+
+def cache_key(kind: str, *parts: Any) -> str:
+    """
+    Build a cache key from an entity kind and normalized arguments.
+
+    Args:
+        kind: Entity kind (e.g. "company")
+        *parts: Normalized arguments identifying the result
+
+    Returns:
+        str: Key such as "company:anthropic:basic"
+    """
+    return ":".join([kind, *(str(part) for part in parts)])
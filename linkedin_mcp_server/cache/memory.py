@@ -0,0 +1,153 @@
+# linkedin_mcp_server/cache/memory.py
+"""
+In-memory TTL cache for scraped results.
+
+Entries expire after a TTL and the least recently used ones are evicted when
+the cache exceeds its entry count or byte budget. The size of an entry is the
+length of its JSON serialization, which is what the result costs to keep and
+to send back to the client.
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def entry_size(value: Any) -> int:
+    """Approximate memory cost of a value: the length of its JSON form."""
+    try:
+        return len(json.dumps(value, default=str).encode("utf-8"))
+    except (TypeError, ValueError):
+        return len(repr(value).encode("utf-8"))
+
+
+class ResultCache:
+    """Thread-safe TTL cache with LRU eviction by entry count and total bytes."""
+
+    def __init__(self, ttl: float, max_entries: int = 128, max_bytes: int = 0):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Entry lifetime in seconds (0 disables the cache)
+            max_entries: Maximum number of entries (0 means unlimited)
+            max_bytes: Maximum total size of entries (0 means unlimited)
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        # key -> (value, expires_at, size), least recently used first
+        self._entries: "OrderedDict[str, Tuple[Any, float, int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a cached value and mark it as recently used.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Optional[Any]: The value, or None if missing or expired
+        """
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            value, expires_at, _ = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Cache a value, evicting least recently used entries if over budget.
+
+        Values larger than the whole byte budget are not cached.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Lifetime of this entry in seconds (default: the cache TTL)
+        """
+        ttl = self.ttl if ttl is None else ttl
+        if not self.enabled or ttl <= 0:
+            return
+
+        size = entry_size(value)
+        if self.max_bytes and size > self.max_bytes:
+            logger.debug(f"Not caching {key}: {size} bytes exceeds the cache budget")
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, time.monotonic() + ttl, size)
+            self._bytes += size
+
+            while self._entries and (
+                (self.max_entries and len(self._entries) > self.max_entries)
+                or (self.max_bytes and self._bytes > self.max_bytes)
+            ):
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def invalidate(self, key: str) -> bool:
+        """
+        Drop a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            bool: True if an entry was removed
+        """
+        with self._lock:
+            if key not in self._entries:
+                return False
+            self._remove(key)
+            return True
+
+    def clear(self) -> None:
+        """Drop all cached values."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Entry count, size and hit statistics."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def _remove(self, key: str) -> None:
+        _, _, size = self._entries.pop(key)
+        self._bytes -= size
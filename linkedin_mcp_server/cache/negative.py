@@ -0,0 +1,75 @@
+# linkedin_mcp_server/cache/negative.py
+"""
+Negative cache of entities that do not exist or are not accessible.
+
+A scrape of an unknown username, a removed job or a private post only fails
+after a full page load, and agents tend to retry it. Such outcomes are stored
+in the scrape cache for a short TTL, so repeat requests fail immediately with
+the entity_not_found error instead of costing another browser navigation.
+When the scrape cache is disabled, they are kept in memory instead.
+"""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, TypeVar
+
+from linkedin_mcp_server.exceptions import EntityNotFoundError
+
+from .disk import ScrapeCache
+from .keys import cache_key
+from .memory import ResultCache
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Negative entries of this process while the scrape cache is disabled
+_memory_not_found = ResultCache(ttl=600, max_entries=1024)
+
+
+async def guard_not_found(
+    cache: ScrapeCache,
+    key: str,
+    scrape: Callable[[], Awaitable[T]],
+    ttl: float,
+    force_refresh: bool = False,
+) -> T:
+    """
+    Run a scrape unless its entity is known to be missing.
+
+    Args:
+        cache: Scrape cache holding the negative entries (memory is used
+            while it is disabled)
+        key: Cache key of the entity (see cache_key)
+        scrape: Coroutine function that scrapes the entity
+        ttl: Seconds a not-found outcome is remembered (0 disables)
+        force_refresh: Ignore a remembered outcome and scrape again
+
+    Returns:
+        The scrape result
+
+    Raises:
+        EntityNotFoundError: If the entity is missing, now or recently
+    """
+    negative_key = cache_key("not_found", key)
+    if not force_refresh:
+        if cache.enabled:
+            known = await cache.aget(negative_key)
+        else:
+            known = _memory_not_found.get(negative_key)
+        if known is not None:
+            raise EntityNotFoundError(
+                f"{known['message']} (remembered from a recent attempt)"
+            )
+
+    try:
+        return await scrape()
+    except EntityNotFoundError as e:
+        logger.info(f"Remembering missing entity {key} for {ttl:.0f}s")
+        if cache.enabled:
+            await cache.aset(negative_key, {"message": str(e)}, ttl)
+            # Drop a stale result that would otherwise keep being served
+            await asyncio.to_thread(cache.invalidate, key)
+        else:
+            _memory_not_found.set(negative_key, {"message": str(e)}, ttl)
+        raise
@@ -0,0 +1,66 @@
+# linkedin_mcp_server/cache/singleflight.py
+"""
+Single-flight coalescing of identical in-flight scrapes.
+
+When several callers ask for the same entity while it is being scraped, only
+the first call starts a scrape; the others await its result. Calls are keyed by
+tool name and normalized arguments. A waiting caller that is cancelled does
+not cancel the shared scrape, which keeps serving the remaining callers.
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Shares one in-flight call among concurrent callers with the same key."""
+
+    def __init__(self) -> None:
+        self._flights: Dict[str, "asyncio.Future[Any]"] = {}
+        self.started = 0
+        self.coalesced = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Number of calls currently running."""
+        return len(self._flights)
+
+    async def do(self, key: str, fn: Callable[..., Awaitable[T]], *args: Any) -> T:
+        """
+        Run fn(*args), or join the call already running for key.
+
+        Args:
+            key: Call key (see cache_key), e.g. "get_company_profile:anthropic:basic"
+            fn: Coroutine function performing the call
+            *args: Arguments for fn
+
+        Returns:
+            The result of the shared call (exceptions are raised to every caller)
+        """
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = asyncio.ensure_future(fn(*args))
+            self._flights[key] = flight
+            flight.add_done_callback(lambda done: self._finish(key, done))
+            self.started += 1
+        else:
+            self.coalesced += 1
+            logger.debug(f"Joining in-flight call {key}")
+
+        return await asyncio.shield(flight)
+
+    def _finish(self, key: str, flight: "asyncio.Future[Any]") -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+        # Mark the outcome as retrieved in case every caller was cancelled
+        if not flight.cancelled():
+            flight.exception()
+
+
+# Shared by all scraping tools in the process
+scrape_flights = SingleFlight()
@@ -0,0 +1,85 @@
+# linkedin_mcp_server/cache/swr.py
+"""
+Stale-while-revalidate reads through the scrape cache.
+
+A result younger than its TTL is fresh and returned as is. Past the TTL it
+stays servable for a further max_stale seconds: the stale result is returned
+immediately and one background scrape per key refreshes the cache on the
+driver pool. Only results older than both, or missing ones, make the caller
+wait for a scrape.
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, TypeVar
+
+from linkedin_mcp_server.exceptions import ScraperQueueFullError
+
+from .disk import ScrapeCache
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Background refreshes by cache key, so a hot entity is refreshed only once
+_refreshes: Dict[str, "asyncio.Task[None]"] = {}
+
+
+async def read_through(
+    cache: ScrapeCache,
+    key: str,
+    scrape: Callable[[], Awaitable[T]],
+    ttl: float,
+    max_stale: float = 0.0,
+    force_refresh: bool = False,
+) -> T:
+    """
+    Get a result from the cache, scraping it when missing or too old.
+
+    Args:
+        cache: Scrape cache to read and fill
+        key: Cache key (see cache_key)
+        scrape: Coroutine function that scrapes the result on the driver pool
+        ttl: Seconds a result is fresh
+        max_stale: Further seconds a result is served while it is refreshed in
+            the background (0 disables stale reads)
+        force_refresh: Skip the cache and wait for a new scrape
+
+    Returns:
+        The cached or freshly scraped result
+    """
+    if not force_refresh:
+        entry = await cache.aget_entry(key)
+        if entry is not None:
+            value, age = entry
+            if age >= ttl:
+                logger.debug(f"Serving stale {key} ({age:.0f}s old), refreshing")
+                _schedule_refresh(cache, key, scrape, ttl + max_stale)
+            return value
+
+    value = await scrape()
+    await cache.aset(key, value, ttl + max_stale)
+    return value
+
+
+def _schedule_refresh(
+    cache: ScrapeCache, key: str, scrape: Callable[[], Awaitable[Any]], lifetime: float
+) -> None:
+    task = _refreshes.get(key)
+    if task is not None and not task.done():
+        return
+
+    async def refresh() -> None:
+        try:
+            value = await scrape()
+            await cache.aset(key, value, lifetime)
+            logger.debug(f"Refreshed {key} in the background")
+        except ScraperQueueFullError:
+            # Foreground scrapes take precedence; the next read tries again
+            logger.debug(f"Skipped refreshing {key}: scraper queue is full")
+        except Exception as e:
+            logger.warning(f"Background refresh of {key} failed: {e}")
+        finally:
+            _refreshes.pop(key, None)
+
+    _refreshes[key] = asyncio.get_running_loop().create_task(refresh())
@@ -31,7 +31,10 @@ from linkedin_mcp_server.config import (
     get_config,
     get_keyring_name,
 )
-from linkedin_mcp_server.drivers.chrome import close_all_drivers, get_or_create_driver
+from linkedin_mcp_server.drivers.chrome import (
+    close_all_drivers,
+    initialize_driver_pool,
+)
 from linkedin_mcp_server.exceptions import CredentialsNotFoundError, LinkedInMCPError
 from linkedin_mcp_server.logging_config import configure_logging
 from linkedin_mcp_server.server import create_mcp_server, shutdown_handler
@@ -263,8 +266,8 @@ def initialize_driver_with_auth(authentication: str) -> None:
     logger.info("Initializing Chrome WebDriver and logging in...")
 
     try:
-        # Create driver and login with provided authentication
-        get_or_create_driver(authentication)
+        # Create pooled drivers and login with provided authentication
+        initialize_driver_pool(authentication)
         logger.info("✅ Web driver initialized and authenticated successfully")
 
     except Exception as e:
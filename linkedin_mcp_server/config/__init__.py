@@ -27,7 +27,14 @@ from .providers import (
     get_keyring_name,
     save_credentials_to_keyring,
 )
-from .schema import AppConfig, ChromeConfig, LinkedInConfig, ServerConfig
+from .schema import (
+    AppConfig,
+    CacheConfig,
+    ChromeConfig,
+    LinkedInConfig,
+    ScraperConfig,
+    ServerConfig,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -55,8 +62,10 @@ def reset_config() -> None:
 # Export schema classes for type annotations
 __all__ = [
     "AppConfig",
+    "CacheConfig",
     "ChromeConfig",
     "LinkedInConfig",
+    "ScraperConfig",
     "ServerConfig",
     "get_config",
     "reset_config",
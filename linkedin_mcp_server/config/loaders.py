@@ -47,6 +47,27 @@ class EnvironmentKeys:
     CHROMEDRIVER = "CHROMEDRIVER"
     HEADLESS = "HEADLESS"
     USER_AGENT = "USER_AGENT"
+    IMPLICIT_WAIT = "IMPLICIT_WAIT"
+
+    # Scraper configuration
+    SCRAPER_QUEUE_DEPTH = "SCRAPER_QUEUE_DEPTH"
+    SCRAPER_POOL_MIN_SIZE = "SCRAPER_POOL_MIN_SIZE"
+    SCRAPER_POOL_MAX_SIZE = "SCRAPER_POOL_MAX_SIZE"
+    SCRAPER_POOL_TIMEOUT = "SCRAPER_POOL_TIMEOUT"
+    SCRAPER_PAGE_TIMEOUT = "SCRAPER_PAGE_TIMEOUT"
+    SCRAPER_LOGIN_TIMEOUT = "SCRAPER_LOGIN_TIMEOUT"
+
+    # Result cache configuration
+    CACHE_PROFILE_TTL = "CACHE_PROFILE_TTL"
+    CACHE_PROFILE_MAX_ENTRIES = "CACHE_PROFILE_MAX_ENTRIES"
+    CACHE_PROFILE_MAX_BYTES = "CACHE_PROFILE_MAX_BYTES"
+    CACHE_COMPANY_TTL = "CACHE_COMPANY_TTL"
+    CACHE_COMPANY_MAX_STALE = "CACHE_COMPANY_MAX_STALE"
+    CACHE_JOB_TTL = "CACHE_JOB_TTL"
+    CACHE_JOB_MAX_STALE = "CACHE_JOB_MAX_STALE"
+    CACHE_JOB_SEARCH_TTL = "CACHE_JOB_SEARCH_TTL"
+    CACHE_NOT_FOUND_TTL = "CACHE_NOT_FOUND_TTL"
+    CACHE_DISK_MAX_BYTES = "CACHE_DISK_MAX_BYTES"
 
     # Server configuration
     LOG_LEVEL = "LOG_LEVEL"
@@ -124,6 +145,48 @@ def load_from_env(config: AppConfig) -> AppConfig:
     if user_agent := os.environ.get(EnvironmentKeys.USER_AGENT):
         config.chrome.user_agent = user_agent
 
+    if implicit_wait := os.environ.get(EnvironmentKeys.IMPLICIT_WAIT):
+        try:
+            config.chrome.implicit_wait = float(implicit_wait)
+        except ValueError:
+            logger.warning(
+                f"Ignoring invalid {EnvironmentKeys.IMPLICIT_WAIT}: {implicit_wait}"
+            )
+
+    # Scraper execution and driver pool
+    for key, attr, cast in (
+        (EnvironmentKeys.SCRAPER_QUEUE_DEPTH, "queue_depth", int),
+        (EnvironmentKeys.SCRAPER_POOL_MIN_SIZE, "pool_min_size", int),
+        (EnvironmentKeys.SCRAPER_POOL_MAX_SIZE, "pool_max_size", int),
+        (EnvironmentKeys.SCRAPER_POOL_TIMEOUT, "pool_timeout", float),
+        (EnvironmentKeys.SCRAPER_PAGE_TIMEOUT, "page_ready_timeout", float),
+        (EnvironmentKeys.SCRAPER_LOGIN_TIMEOUT, "login_redirect_timeout", float),
+    ):
+        if value := os.environ.get(key):
+            try:
+                setattr(config.scraper, attr, cast(value))
+            except ValueError:
+                logger.warning(f"Ignoring invalid {key}: {value}")
+
+    # Result caches
+    for key, attr, cast in (
+        (EnvironmentKeys.CACHE_PROFILE_TTL, "profile_ttl", float),
+        (EnvironmentKeys.CACHE_PROFILE_MAX_ENTRIES, "profile_max_entries", int),
+        (EnvironmentKeys.CACHE_PROFILE_MAX_BYTES, "profile_max_bytes", int),
+        (EnvironmentKeys.CACHE_COMPANY_TTL, "company_ttl", float),
+        (EnvironmentKeys.CACHE_COMPANY_MAX_STALE, "company_max_stale", float),
+        (EnvironmentKeys.CACHE_JOB_TTL, "job_ttl", float),
+        (EnvironmentKeys.CACHE_JOB_MAX_STALE, "job_max_stale", float),
+        (EnvironmentKeys.CACHE_JOB_SEARCH_TTL, "job_search_ttl", float),
+        (EnvironmentKeys.CACHE_NOT_FOUND_TTL, "not_found_ttl", float),
+        (EnvironmentKeys.CACHE_DISK_MAX_BYTES, "disk_max_bytes", int),
+    ):
+        if value := os.environ.get(key):
+            try:
+                setattr(config.cache, attr, cast(value))
+            except ValueError:
+                logger.warning(f"Ignoring invalid {key}: {value}")
+
     # Log level
     if log_level_env := os.environ.get(EnvironmentKeys.LOG_LEVEL):
         log_level_upper = log_level_env.upper()
@@ -235,6 +298,20 @@ def load_from_args(config: AppConfig) -> AppConfig:
         help="Specify custom user agent string to prevent anti-scraping detection",
     )
 
+    parser.add_argument(
+        "--scraper-queue-depth",
+        type=int,
+        default=None,
+        help="Maximum number of scrapes allowed to wait for the browser thread (default: 16)",
+    )
+
+    parser.add_argument(
+        "--pool-size",
+        type=int,
+        default=None,
+        help="Maximum number of concurrent Chrome sessions used for scraping (default: 2)",
+    )
+
     args = parser.parse_args()
 
     # Update configuration with parsed arguments
@@ -274,6 +351,13 @@ def load_from_args(config: AppConfig) -> AppConfig:
     if args.user_agent:
         config.chrome.user_agent = args.user_agent
 
+    if args.scraper_queue_depth is not None:
+        config.scraper.queue_depth = args.scraper_queue_depth
+
+    if args.pool_size:
+        config.scraper.pool_max_size = args.pool_size
+        config.scraper.pool_min_size = min(config.scraper.pool_min_size, args.pool_size)
+
     return config
 
 
@@ -10,6 +10,8 @@ and MCP server parameters.
 Key Components:
 - ChromeConfig: Chrome driver and browser configuration
 - LinkedInConfig: LinkedIn authentication and connection settings
+- ScraperConfig: Threading and queueing settings for browser-based scraping
+- CacheConfig: Lifetimes and size limits of cached scrape results
 - ServerConfig: MCP server transport and operational settings
 - AppConfig: Main application configuration combining all components
 """
@@ -32,6 +34,7 @@ class ChromeConfig:
     chromedriver_path: Optional[str] = None
     browser_args: List[str] = field(default_factory=list)
     user_agent: Optional[str] = None
+    implicit_wait: float = 10.0  # Seconds find_element waits for required elements
 
 
 @dataclass
@@ -43,6 +46,36 @@ class LinkedInConfig:
     cookie: Optional[str] = None
 
 
+@dataclass
+class ScraperConfig:
+    """Configuration for browser-based scraping execution."""
+
+    queue_depth: int = 16  # Scrapes allowed to wait behind the running ones
+    pool_min_size: int = 1  # Browsers created up front on eager initialization
+    pool_max_size: int = 2  # Upper bound on concurrent browsers
+    pool_timeout: float = 120.0  # Seconds to wait for a free browser
+    page_ready_timeout: float = 10.0  # Ceiling for page content readiness waits
+    login_redirect_timeout: float = 10.0  # Ceiling for post-login redirect waits
+
+
+@dataclass
+class CacheConfig:
+    """Configuration for caching scraped results."""
+
+    profile_ttl: float = 3600.0  # Seconds a scraped profile is reused (0 disables)
+    profile_max_entries: int = 128  # Profiles kept in memory
+    profile_max_bytes: int = 16 * 1024 * 1024  # Serialized size of kept profiles
+    company_ttl: float = 24 * 3600.0  # Seconds a scraped company page is fresh
+    company_max_stale: float = (
+        7 * 24 * 3600.0
+    )  # Further seconds served while refreshing
+    job_ttl: float = 6 * 3600.0  # Seconds scraped job details are fresh
+    job_max_stale: float = 24 * 3600.0  # Further seconds served while refreshing
+    job_search_ttl: float = 900.0  # Seconds job search results are reused
+    not_found_ttl: float = 600.0  # Seconds a missing or private entity is remembered
+    disk_max_bytes: int = 256 * 1024 * 1024  # Compressed size on disk (0 disables)
+
+
 @dataclass
 class ServerConfig:
     """MCP server configuration."""
@@ -65,6 +98,8 @@ class AppConfig:
 
     chrome: ChromeConfig = field(default_factory=ChromeConfig)
     linkedin: LinkedInConfig = field(default_factory=LinkedInConfig)
+    scraper: ScraperConfig = field(default_factory=ScraperConfig)
+    cache: CacheConfig = field(default_factory=CacheConfig)
     server: ServerConfig = field(default_factory=ServerConfig)
     is_interactive: bool = field(default=False)
 
@@ -73,6 +108,8 @@ class AppConfig:
         self._validate_transport_config()
         self._validate_port_range()
         self._validate_path_format()
+        self._validate_scraper_config()
+        self._validate_cache_config()
 
     def _validate_transport_config(self) -> None:
         """Validate transport configuration is consistent."""
@@ -100,3 +137,35 @@ class AppConfig:
                 raise ConfigurationError(
                     f"HTTP path '{self.server.path}' must be at least 2 characters"
                 )
+
+    def _validate_scraper_config(self) -> None:
+        """Validate scraper execution settings."""
+        if self.scraper.queue_depth < 0:
+            raise ConfigurationError(
+                f"Scraper queue depth {self.scraper.queue_depth} must not be negative"
+            )
+        if self.scraper.pool_max_size < 1:
+            raise ConfigurationError(
+                f"Driver pool max size {self.scraper.pool_max_size} must be at least 1"
+            )
+        if not (0 <= self.scraper.pool_min_size <= self.scraper.pool_max_size):
+            raise ConfigurationError(
+                f"Driver pool min size {self.scraper.pool_min_size} must be between 0 and {self.scraper.pool_max_size}"
+            )
+
+    def _validate_cache_config(self) -> None:
+        """Validate result cache settings."""
+        for name in (
+            "profile_ttl",
+            "profile_max_entries",
+            "profile_max_bytes",
+            "company_ttl",
+            "company_max_stale",
+            "job_ttl",
+            "job_max_stale",
+            "job_search_ttl",
+            "not_found_ttl",
+            "disk_max_bytes",
+        ):
+            if getattr(self.cache, name) < 0:
+                raise ConfigurationError(f"Cache setting {name} must not be negative")
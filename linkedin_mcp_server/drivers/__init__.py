@@ -3,14 +3,15 @@
 Driver management package for LinkedIn scraping.
 
 This package provides Chrome WebDriver management and automation capabilities
-for LinkedIn scraping. It implements a singleton pattern for driver instances
-to ensure session persistence across multiple tool calls while handling
-authentication, session management, and proper resource cleanup.
+for LinkedIn scraping. It maintains a bounded pool of authenticated driver
+instances so scrapes can run concurrently while sessions persist across tool
+calls, handling authentication, session management, and proper resource cleanup.
 
 Key Components:
 - Chrome WebDriver initialization and configuration
 - LinkedIn authentication and session management
-- Singleton pattern for driver reuse across tools
+- Driver pool with checkout/checkin semantics for concurrent scraping
+- Dedicated executor threads that keep blocking Selenium work off the event loop
 - Automatic driver cleanup and resource management
 - Cross-platform Chrome driver detection and setup
 """
@@ -3,22 +3,24 @@
 Chrome WebDriver management for LinkedIn scraping with session persistence.
 
 Handles Chrome WebDriver creation, configuration, authentication, and lifecycle management.
-Implements singleton pattern for driver reuse across tools with automatic cleanup.
+Maintains a bounded pool of authenticated drivers shared across tools with automatic cleanup.
 Provides cookie-based authentication and comprehensive error handling.
 """
 
 import logging
 import os
 import platform
-from typing import Dict, Optional
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Deque, Dict, Iterator, Optional
 
 from linkedin_scraper.exceptions import (
     CaptchaRequiredError,
     InvalidCredentialsError,
     LoginTimeoutError,
-    RateLimitError,
     SecurityChallengeError,
-    TwoFactorAuthError,
 )
 from selenium import webdriver
 from selenium.common.exceptions import WebDriverException
@@ -26,7 +28,10 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 
 from linkedin_mcp_server.config import get_config
-from linkedin_mcp_server.exceptions import DriverInitializationError
+from linkedin_mcp_server.exceptions import (
+    DriverInitializationError,
+    DriverPoolTimeoutError,
+)
 
 
 # Constants
@@ -42,7 +47,7 @@ def get_default_user_agent() -> str:
         return "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/137.0.0.0 Safari/537.36"
 
 
-# Global driver storage to reuse sessions
+# Registry of live pooled drivers keyed by session id
 active_drivers: Dict[str, webdriver.Chrome] = {}
 
 
@@ -122,7 +127,7 @@ def create_temporary_chrome_driver() -> webdriver.Chrome:
     """
     Create a temporary Chrome WebDriver instance for one-off operations.
 
-    This driver is NOT stored in the global active_drivers dict and should be
+    This driver is NOT part of the driver pool and should be
     manually cleaned up by the caller.
 
     Returns:
@@ -153,7 +158,7 @@ def create_temporary_chrome_driver() -> webdriver.Chrome:
     driver.set_page_load_timeout(60)
 
     # Set shorter implicit wait for faster operations
-    driver.implicitly_wait(10)
+    driver.implicitly_wait(config.chrome.implicit_wait)
 
     return driver
 
@@ -189,12 +194,27 @@ def create_chrome_driver() -> webdriver.Chrome:
     # Add a page load timeout for safety
     driver.set_page_load_timeout(60)
 
-    # Set shorter implicit wait for faster cookie validation
-    driver.implicitly_wait(10)
+    # Implicit wait for required elements; optional lookups use probe_mode()
+    driver.implicitly_wait(config.chrome.implicit_wait)
 
     return driver
 
 
+# URL fragments that identify the login page and authenticated pages
+LOGIN_URL_INDICATORS = ("login", "uas/login")
+AUTHENTICATED_URL_INDICATORS = ("feed", "mynetwork", "linkedin.com/in/", "/feed/")
+
+
+def is_login_url(url: str) -> bool:
+    """Check whether a URL is the LinkedIn login page."""
+    return any(indicator in url for indicator in LOGIN_URL_INDICATORS)
+
+
+def is_authenticated_url(url: str) -> bool:
+    """Check whether a URL is a page only reachable when logged in."""
+    return any(indicator in url for indicator in AUTHENTICATED_URL_INDICATORS)
+
+
 def login_with_cookie(driver: webdriver.Chrome, cookie: str) -> bool:
     """
     Log in to LinkedIn using session cookie.
@@ -206,18 +226,21 @@ def login_with_cookie(driver: webdriver.Chrome, cookie: str) -> bool:
     Returns:
         bool: True if login was successful, False otherwise
     """
-    import time
-
     try:
         from linkedin_scraper import actions  # type: ignore
         from selenium.common.exceptions import TimeoutException
 
+        from linkedin_mcp_server.drivers.waits import wait_for_url
+
         logger.info("Attempting cookie authentication...")
 
         # Set longer timeout to handle slow LinkedIn loading
         # Invalid cookies cause indefinite loading, so timeout is our detection mechanism
         driver.set_page_load_timeout(45)
 
+        def is_settled(url: str) -> bool:
+            return is_login_url(url) or is_authenticated_url(url)
+
         # Attempt login
         retry_count = 0
         max_retries = 1
@@ -242,8 +265,10 @@ def login_with_cookie(driver: webdriver.Chrome, cookie: str) -> bool:
                     logger.info(
                         "LinkedIn-scraper reported InvalidCredentialsError - verifying actual authentication status..."
                     )
-                    # Give LinkedIn time to complete redirect
-                    time.sleep(2)
+                    # The redirect to the feed may still be pending while the
+                    # login page is shown, so only an authenticated URL ends the
+                    # wait early; the URL is classified below either way
+                    wait_for_url(driver, is_authenticated_url)
                     break
                 else:
                     logger.warning(f"Login attempt failed: {e}")
@@ -252,6 +277,7 @@ def login_with_cookie(driver: webdriver.Chrome, cookie: str) -> bool:
                         logger.info(
                             f"Retrying authentication (attempt {retry_count + 1}/{max_retries + 1})"
                         )
+                        # Back off briefly before retrying a failed attempt
                         time.sleep(2)
                         continue
                     else:
@@ -261,43 +287,30 @@ def login_with_cookie(driver: webdriver.Chrome, cookie: str) -> bool:
         try:
             current_url = driver.current_url
 
+            # Unexpected page - wait for the redirect to settle
+            if not is_settled(current_url):
+                logger.info(
+                    "Unexpected page after login, checking authentication status..."
+                )
+                current_url = wait_for_url(driver, is_settled)
+
             # Check if we're on login page (authentication failed)
-            if "login" in current_url or "uas/login" in current_url:
+            if is_login_url(current_url):
                 logger.warning(
                     "Cookie authentication failed - redirected to login page"
                 )
                 return False
 
             # Check if we're on authenticated pages (authentication succeeded)
-            elif any(
-                indicator in current_url
-                for indicator in ["feed", "mynetwork", "linkedin.com/in/", "/feed/"]
-            ):
+            elif is_authenticated_url(current_url):
                 logger.info("Cookie authentication successful")
                 return True
 
-            # Unexpected page - wait briefly and check again
             else:
-                logger.info(
-                    "Unexpected page after login, checking authentication status..."
+                logger.warning(
+                    f"Cookie authentication uncertain - unexpected final page: {current_url}"
                 )
-                time.sleep(2)
-
-                final_url = driver.current_url
-                if "login" in final_url or "uas/login" in final_url:
-                    logger.warning("Cookie authentication failed - ended on login page")
-                    return False
-                elif any(
-                    indicator in final_url
-                    for indicator in ["feed", "mynetwork", "linkedin.com/in/", "/feed/"]
-                ):
-                    logger.info("Cookie authentication successful after verification")
-                    return True
-                else:
-                    logger.warning(
-                        f"Cookie authentication uncertain - unexpected final page: {final_url}"
-                    )
-                    return False
+                return False
 
         except Exception as e:
             logger.error(f"Error checking authentication status: {e}")
@@ -358,83 +371,291 @@ def login_to_linkedin(driver: webdriver.Chrome, authentication: str) -> None:
         raise LoginTimeoutError(f"Login failed: {str(e)}")
 
 
-def get_or_create_driver(authentication: str) -> webdriver.Chrome:
+class DriverPool:
+    """
+    Bounded pool of authenticated Chrome WebDriver sessions.
+
+    Drivers are created lazily up to max_size and logged in with the session cookie
+    before first use. Callers check a driver out for the duration of one scrape and
+    check it back in afterwards, so concurrent scrapes never share a browser tab.
+    """
+
+    def __init__(
+        self,
+        authentication: str,
+        min_size: int = 1,
+        max_size: int = 2,
+        checkout_timeout: float = 120.0,
+    ):
+        """
+        Initialize the driver pool.
+
+        Args:
+            authentication: LinkedIn session cookie used to log in each driver
+            min_size: Number of drivers created by warm()
+            max_size: Maximum number of drivers alive at the same time
+            checkout_timeout: Seconds to wait for a free driver before giving up
+        """
+        self.authentication = authentication
+        self.max_size = max(1, max_size)
+        self.min_size = max(0, min(min_size, self.max_size))
+        self.checkout_timeout = checkout_timeout
+
+        self._condition = threading.Condition()
+        self._idle: Deque[webdriver.Chrome] = deque()
+        self._session_ids: Dict[int, str] = {}
+        self._size = 0
+        self._counter = 0
+        self._closed = False
+
+    @property
+    def size(self) -> int:
+        """Number of drivers alive or being created."""
+        with self._condition:
+            return self._size
+
+    @property
+    def idle_count(self) -> int:
+        """Number of drivers waiting to be checked out."""
+        with self._condition:
+            return len(self._idle)
+
+    def warm(self) -> None:
+        """Create drivers until the pool holds at least min_size of them."""
+        drivers = []
+        try:
+            while self.size < self.min_size:
+                drivers.append(self.checkout())
+        finally:
+            for driver in drivers:
+                self.checkin(driver)
+
+    def checkout(self, timeout: Optional[float] = None) -> webdriver.Chrome:
+        """
+        Take a driver out of the pool, creating one if below max_size.
+
+        Args:
+            timeout: Seconds to wait for a free driver (defaults to checkout_timeout)
+
+        Returns:
+            webdriver.Chrome: Authenticated driver reserved for the caller
+
+        Raises:
+            DriverPoolTimeoutError: If no driver became available in time
+            DriverInitializationError: If driver creation fails
+            Various login-related errors: If login fails
+        """
+        timeout = self.checkout_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise DriverInitializationError("Driver pool is closed")
+                if self._idle:
+                    return self._idle.popleft()
+                if self._size < self.max_size:
+                    # Reserve a slot, then create the driver outside the lock
+                    self._size += 1
+                    self._counter += 1
+                    session_id = f"pool-{self._counter}"
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise DriverPoolTimeoutError(
+                        f"No Chrome session became available within {timeout:.0f}s "
+                        f"({self.max_size} in use)"
+                    )
+                self._condition.wait(remaining)
+
+        try:
+            driver = self._create_driver()
+        except BaseException:
+            with self._condition:
+                self._size -= 1
+                self._condition.notify()
+            raise
+
+        with self._condition:
+            self._session_ids[id(driver)] = session_id
+            active_drivers[session_id] = driver
+        logger.info(f"Chrome WebDriver session {session_id} added to pool")
+        return driver
+
+    def checkin(self, driver: webdriver.Chrome, discard: bool = False) -> None:
+        """
+        Return a driver to the pool.
+
+        Args:
+            driver: Driver previously obtained from checkout()
+            discard: Quit the driver instead of reusing it (e.g. after a crash)
+        """
+        with self._condition:
+            if not discard and not self._closed:
+                self._idle.append(driver)
+                self._condition.notify()
+                return
+            session_id = self._forget(driver)
+            self._condition.notify()
+
+        logger.info(f"Closing Chrome WebDriver session: {session_id}")
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning(f"Error closing driver {session_id}: {e}")
+
+    @contextmanager
+    def session(self, timeout: Optional[float] = None) -> Iterator[webdriver.Chrome]:
+        """
+        Check out a driver for the duration of a with-block.
+
+        Drivers that raise WebDriverException are discarded rather than reused.
+        """
+        driver = self.checkout(timeout)
+        try:
+            yield driver
+        except WebDriverException:
+            self.checkin(driver, discard=True)
+            raise
+        except BaseException:
+            self.checkin(driver)
+            raise
+        else:
+            self.checkin(driver)
+
+    def close(self) -> None:
+        """Quit idle drivers; drivers still checked out are quit on checkin."""
+        with self._condition:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            sessions = [(self._forget(driver), driver) for driver in idle]
+            self._condition.notify_all()
+
+        for session_id, driver in sessions:
+            try:
+                logger.info(f"Closing Chrome WebDriver session: {session_id}")
+                driver.quit()
+            except Exception as e:
+                logger.warning(f"Error closing driver {session_id}: {e}")
+
+    def _forget(self, driver: webdriver.Chrome) -> str:
+        """Drop a driver from the pool bookkeeping (caller holds the lock)."""
+        session_id = self._session_ids.pop(id(driver), "unknown")
+        active_drivers.pop(session_id, None)
+        self._size -= 1
+        return session_id
+
+    def _create_driver(self) -> webdriver.Chrome:
+        """Create a new driver and log it in to LinkedIn."""
+        try:
+            driver = create_chrome_driver()
+        except WebDriverException as e:
+            error_msg = f"Error creating web driver: {e}"
+            logger.error(error_msg)
+            raise DriverInitializationError(error_msg)
+
+        try:
+            login_to_linkedin(driver, self.authentication)
+        except BaseException:
+            # Login-related errors - clean up the half-initialized driver
+            try:
+                driver.quit()
+            except Exception:
+                pass
+            raise
+
+        logger.info("Chrome WebDriver session created and authenticated successfully")
+        return driver
+
+
+# Shared pool used by all scraping tools
+_driver_pool: Optional[DriverPool] = None
+_driver_pool_lock = threading.Lock()
+
+
+def get_driver_pool(authentication: str) -> DriverPool:
+    """
+    Get the shared driver pool, creating it from configuration if needed.
+
+    Args:
+        authentication: LinkedIn session cookie for logging in new drivers
+
+    Returns:
+        DriverPool: The shared pool
+    """
+    global _driver_pool
+
+    with _driver_pool_lock:
+        if _driver_pool is None:
+            config = get_config()
+            _driver_pool = DriverPool(
+                authentication,
+                min_size=config.scraper.pool_min_size,
+                max_size=config.scraper.pool_max_size,
+                checkout_timeout=config.scraper.pool_timeout,
+            )
+            logger.info(
+                f"Driver pool created (min {_driver_pool.min_size}, max {_driver_pool.max_size})"
+            )
+        return _driver_pool
+
+
+def initialize_driver_pool(authentication: str) -> DriverPool:
     """
-    Get existing driver or create a new one and login.
+    Create the shared driver pool and log in its minimum number of drivers.
 
     Args:
         authentication: LinkedIn session cookie for login
 
     Returns:
-        webdriver.Chrome: Chrome WebDriver instance, logged in and ready
+        DriverPool: The warmed-up pool
 
     Raises:
         DriverInitializationError: If driver creation fails
         Various login-related errors: If login fails
     """
-    session_id = "default"  # We use a single session for simplicity
+    pool = get_driver_pool(authentication)
+    pool.warm()
+    return pool
 
-    # Return existing driver if available
-    if session_id in active_drivers:
-        logger.info("Using existing Chrome WebDriver session")
-        return active_drivers[session_id]
 
-    try:
-        # Create new driver
-        driver = create_chrome_driver()
-
-        # Login to LinkedIn
-        login_to_linkedin(driver, authentication)
-
-        # Store successful driver
-        active_drivers[session_id] = driver
-        logger.info("Chrome WebDriver session created and authenticated successfully")
+@contextmanager
+def driver_session(authentication: str) -> Iterator[webdriver.Chrome]:
+    """
+    Check out an authenticated driver from the shared pool.
 
-        return driver
+    Args:
+        authentication: LinkedIn session cookie for login
 
-    except WebDriverException as e:
-        error_msg = f"Error creating web driver: {e}"
-        logger.error(error_msg)
-        raise DriverInitializationError(error_msg)
-    except (
-        CaptchaRequiredError,
-        InvalidCredentialsError,
-        SecurityChallengeError,
-        TwoFactorAuthError,
-        RateLimitError,
-        LoginTimeoutError,
-    ) as e:
-        # Login-related errors - clean up driver if it was created
-        if session_id in active_drivers:
-            active_drivers[session_id].quit()
-            del active_drivers[session_id]
-        raise e
+    Yields:
+        webdriver.Chrome: Chrome WebDriver instance, logged in and ready
+    """
+    with get_driver_pool(authentication).session() as driver:
+        yield driver
 
 
 def close_all_drivers() -> None:
     """Close all active drivers and clean up resources."""
-    global active_drivers
+    global _driver_pool
 
-    for session_id, driver in active_drivers.items():
-        try:
-            logger.info(f"Closing Chrome WebDriver session: {session_id}")
-            driver.quit()
-        except Exception as e:
-            logger.warning(f"Error closing driver {session_id}: {e}")
+    with _driver_pool_lock:
+        pool, _driver_pool = _driver_pool, None
+
+    if pool is not None:
+        pool.close()
 
-    active_drivers.clear()
     logger.info("All Chrome WebDriver sessions closed")
 
 
 def get_active_driver() -> Optional[webdriver.Chrome]:
     """
-    Get the currently active driver without creating a new one.
+    Get an active driver without creating a new one.
 
     Returns:
         Optional[webdriver.Chrome]: Active driver if available, None otherwise
     """
-    session_id = "default"
-    return active_drivers.get(session_id)
+    return next(iter(active_drivers.values()), None)
 
 
 def capture_session_cookie(driver: webdriver.Chrome) -> Optional[str]:
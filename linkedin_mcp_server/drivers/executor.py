@@ -0,0 +1,138 @@
+# linkedin_mcp_server/drivers/executor.py
+"""
+Thread executor for blocking Selenium work.
+
+linkedin-scraper and Selenium are synchronous, so every driver-bound call is
+dispatched to dedicated worker threads (one per pooled browser) instead of running
+on the asyncio event loop. This keeps cheap tools (API calls, close_session)
+responsive while a slow scrape is in progress. The number of scrapes waiting for the browser is bounded by the
+configured queue depth so bursts fail fast instead of piling up.
+"""
+
+import asyncio
+import functools
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+from linkedin_mcp_server.config import get_config
+from linkedin_mcp_server.exceptions import ScraperQueueFullError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class DriverExecutor:
+    """Bounded thread executor for driver-bound work."""
+
+    def __init__(self, max_workers: int = 1, queue_depth: int = 16):
+        """
+        Initialize the executor.
+
+        Args:
+            max_workers: Number of worker threads running driver work
+            queue_depth: Number of jobs allowed to wait behind the running ones
+        """
+        self.max_workers = max(1, max_workers)
+        self.queue_depth = max(0, queue_depth)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="linkedin-driver"
+        )
+        self._lock = threading.Lock()
+        self._pending = 0
+
+    @property
+    def pending(self) -> int:
+        """Number of jobs currently running or waiting."""
+        with self._lock:
+            return self._pending
+
+    def submit(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> Future:
+        """
+        Submit a job to the worker threads.
+
+        Raises:
+            ScraperQueueFullError: If the queue is already at capacity
+        """
+        with self._lock:
+            if self._pending >= self.max_workers + self.queue_depth:
+                raise ScraperQueueFullError(
+                    f"Scraper queue is full ({self._pending} scrapes running or waiting)"
+                )
+            self._pending += 1
+
+        try:
+            future = self._executor.submit(functools.partial(func, *args, **kwargs))
+        except Exception:
+            self._release()
+            raise
+
+        # Release the slot when the thread finishes, not when the caller stops
+        # waiting, so cancelled tool calls cannot oversubscribe the browser
+        future.add_done_callback(lambda _: self._release())
+        return future
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking callable on a worker thread and await its result."""
+        return await asyncio.wrap_future(self.submit(func, *args, **kwargs))
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Stop accepting work and cancel jobs that have not started yet."""
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _release(self) -> None:
+        with self._lock:
+            self._pending -= 1
+
+
+# Singleton executor shared by all scraping tools
+_executor: Optional[DriverExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_driver_executor() -> DriverExecutor:
+    """Get the shared driver executor, creating it from configuration if needed."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            config = get_config()
+            # One worker per pooled browser so every driver can be busy at once
+            _executor = DriverExecutor(
+                max_workers=config.scraper.pool_max_size,
+                queue_depth=config.scraper.queue_depth,
+            )
+            logger.info(
+                f"Driver executor started ({_executor.max_workers} workers, "
+                f"queue depth {_executor.queue_depth})"
+            )
+        return _executor
+
+
+async def run_in_driver_thread(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Run driver-bound work off the event loop.
+
+    Args:
+        func: Blocking callable that uses the Chrome WebDriver
+        *args: Positional arguments for func
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        The callable's return value
+
+    Raises:
+        ScraperQueueFullError: If too many scrapes are already waiting
+    """
+    return await get_driver_executor().run(func, *args, **kwargs)
+
+
+def shutdown_driver_executor() -> None:
+    """Shut down the shared driver executor if it was started."""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown()
+            _executor = None
+            logger.info("Driver executor shut down")
@@ -0,0 +1,188 @@
+# linkedin_mcp_server/drivers/extraction.py
+"""
+Single-round-trip DOM extraction for LinkedIn pages.
+
+Every find_element call is a separate HTTP round trip to chromedriver. Instead,
+one injected script collects all fields of a page into a JSON snapshot, which is
+normalized in Python. If the script cannot run (e.g. a JavaScript error), the
+extraction falls back to individual element lookups in probe mode, so absent
+optional elements do not each cost the full implicit wait.
+"""
+
+import logging
+from typing import Any, Dict, Optional
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from linkedin_mcp_server.drivers.waits import probe_mode
+
+logger = logging.getLogger(__name__)
+
+# Selectors shared by the snapshot script and the element-lookup fallback
+POST_SELECTORS: Dict[str, str] = {
+    "author": ".update-components-actor__name, .feed-shared-actor__name",
+    "author_title": ".update-components-actor__description, .feed-shared-actor__description",
+    "content": ".feed-shared-update-v2__description, .feed-shared-text, .break-words",
+    "content_fallback": "[dir='ltr'] .break-words",
+    "posted_date": ".update-components-actor__sub-description, .feed-shared-actor__sub-description",
+    "reactions": ".social-details-social-counts__reactions-count, [aria-label*='reaction']",
+    "comments": ".social-details-social-counts__comments, [aria-label*='comment']",
+    "reposts": "[aria-label*='repost']",
+    "images": ".feed-shared-image__container img, .feed-shared-image img",
+    "video": "video",
+    "article": ".feed-shared-article, .feed-shared-external-article",
+    "article_title": ".feed-shared-article__title",
+}
+
+MAX_POST_IMAGES = 5
+
+# Receives POST_SELECTORS as arguments[0]; missing elements are reported as null
+POST_SNAPSHOT_SCRIPT = """
+const sel = arguments[0];
+const text = (selector, root) => {
+    const el = (root || document).querySelector(selector);
+    return el ? el.innerText : null;
+};
+const article = document.querySelector(sel.article);
+return {
+    author: text(sel.author),
+    author_title: text(sel.author_title),
+    content: text(sel.content) ?? text(sel.content_fallback),
+    posted_date: text(sel.posted_date),
+    reactions: text(sel.reactions),
+    comments: text(sel.comments),
+    reposts: text(sel.reposts),
+    images: Array.from(document.querySelectorAll(sel.images), img => img.src),
+    has_video: document.querySelector(sel.video) !== null,
+    article_title: article ? text(sel.article_title, article) : null,
+};
+"""
+
+
+def extract_post_data(driver: WebDriver) -> Dict[str, Any]:
+    """
+    Extract post details from the currently loaded post page.
+
+    Args:
+        driver: WebDriver with a LinkedIn post page loaded
+
+    Returns:
+        Dict with author, content, date, engagement counts, images, video and article
+    """
+    try:
+        snapshot = driver.execute_script(POST_SNAPSHOT_SCRIPT, POST_SELECTORS)
+    except WebDriverException as e:
+        logger.warning(f"Post snapshot script failed, using element lookups: {e}")
+        snapshot = None
+
+    if not isinstance(snapshot, dict):
+        with probe_mode(driver):
+            return extract_post_data_by_elements(driver)
+
+    return normalize_post_snapshot(snapshot)
+
+
+def normalize_post_snapshot(snapshot: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert a raw post snapshot into the post data format returned by the tools.
+
+    Args:
+        snapshot: Raw values collected by POST_SNAPSHOT_SCRIPT (null when missing)
+
+    Returns:
+        Dict with defaults applied for missing fields
+    """
+    posted_date = snapshot.get("posted_date")
+    images = [
+        src for src in snapshot.get("images") or [] if src and "media.licdn.com" in src
+    ]
+
+    return {
+        "author": _or_default(snapshot.get("author"), "Unknown"),
+        "author_title": _or_default(snapshot.get("author_title"), ""),
+        "content": _or_default(snapshot.get("content"), ""),
+        "posted_date": posted_date.split("•")[0].strip()
+        if posted_date is not None
+        else "Unknown",
+        "reactions": _or_default(snapshot.get("reactions"), "0"),
+        "comments": _first_word(snapshot.get("comments")),
+        "reposts": _first_word(snapshot.get("reposts")),
+        "images": images[:MAX_POST_IMAGES],
+        "has_video": bool(snapshot.get("has_video")),
+        "article_title": snapshot.get("article_title"),
+    }
+
+
+def extract_post_data_by_elements(driver: WebDriver) -> Dict[str, Any]:
+    """
+    Extract post details with one WebDriver lookup per field.
+
+    Slower fallback used when the snapshot script cannot run. Every field is
+    optional, so callers should run it inside probe_mode().
+
+    Args:
+        driver: WebDriver with a LinkedIn post page loaded
+
+    Returns:
+        Dict in the same format as normalize_post_snapshot()
+    """
+    snapshot: Dict[str, Any] = {}
+
+    for field in (
+        "author",
+        "author_title",
+        "posted_date",
+        "reactions",
+        "comments",
+        "reposts",
+    ):
+        snapshot[field] = _element_text(driver, POST_SELECTORS[field])
+
+    snapshot["content"] = _element_text(driver, POST_SELECTORS["content"])
+    if snapshot["content"] is None:
+        snapshot["content"] = _element_text(driver, POST_SELECTORS["content_fallback"])
+
+    try:
+        snapshot["images"] = [
+            img.get_attribute("src")
+            for img in driver.find_elements(By.CSS_SELECTOR, POST_SELECTORS["images"])
+        ]
+    except WebDriverException:
+        snapshot["images"] = []
+
+    try:
+        snapshot["has_video"] = bool(
+            driver.find_elements(By.CSS_SELECTOR, POST_SELECTORS["video"])
+        )
+    except WebDriverException:
+        snapshot["has_video"] = False
+
+    try:
+        article = driver.find_element(By.CSS_SELECTOR, POST_SELECTORS["article"])
+        snapshot["article_title"] = article.find_element(
+            By.CSS_SELECTOR, POST_SELECTORS["article_title"]
+        ).text
+    except WebDriverException:
+        snapshot["article_title"] = None
+
+    return normalize_post_snapshot(snapshot)
+
+
+def _element_text(driver: WebDriver, selector: str) -> Optional[str]:
+    """Text of the first element matching selector, or None if absent."""
+    try:
+        return driver.find_element(By.CSS_SELECTOR, selector).text
+    except WebDriverException:
+        return None
+
+
+def _or_default(value: Optional[str], default: str) -> str:
+    return value if value is not None else default
+
+
+def _first_word(text: Optional[str]) -> str:
+    """First token of a count label such as '12 comments'."""
+    parts = (text or "").split()
+    return parts[0] if parts else "0"
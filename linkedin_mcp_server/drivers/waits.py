@@ -0,0 +1,201 @@
+# linkedin_mcp_server/drivers/waits.py
+"""
+Event-driven readiness waits for LinkedIn pages.
+
+Replaces fixed sleeps with WebDriverWait polling on document.readyState and a
+per-page-type "ready selector", so scraping continues as soon as the content is
+present. Waits are capped by configurable ceilings and report a timeout instead
+of raising, leaving it to the extraction step to handle missing content.
+
+Lookups of optional elements run in probe mode (zero implicit wait), so an absent
+element costs one round trip instead of the full implicit wait.
+
+Pages that do not exist or are not accessible (LinkedIn's 404 and "unavailable"
+pages) are recognized so scrapes of them fail with EntityNotFoundError.
+"""
+
+import logging
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, Optional
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support.ui import WebDriverWait
+
+from linkedin_mcp_server.config import get_config
+from linkedin_mcp_server.exceptions import EntityNotFoundError
+
+logger = logging.getLogger(__name__)
+
+# Interval between readiness checks
+POLL_FREQUENCY = 0.1
+
+# CSS selectors whose presence means the main content of a page type has rendered
+READY_SELECTORS: Dict[str, str] = {
+    "post": (
+        ".update-components-actor__name, .feed-shared-actor__name, "
+        ".feed-shared-update-v2__description"
+    ),
+}
+
+# Paths of the pages LinkedIn redirects to for missing or private entities
+UNAVAILABLE_PATHS = {"/404", "/in/unavailable", "/company/unavailable"}
+
+# Lowercase headline phrases of pages for missing or private entities
+UNAVAILABLE_TEXT_MARKERS = (
+    "page not found",
+    "this page doesn't exist",
+    "this page doesn\u2019t exist",
+    "profile is not available",
+    "this linkedin page isn't available",
+    "this linkedin page isn\u2019t available",
+    "this job is no longer available",
+    "this post cannot be displayed",
+    "this content isn't available",
+    "this content isn\u2019t available",
+)
+
+# Title and headlines of the current page, in one round trip
+_HEADLINES_SCRIPT = """
+var texts = [document.title || ''];
+document.querySelectorAll('h1, h2, .artdeco-empty-state__headline').forEach(
+    function (el) { texts.push(el.textContent || ''); }
+);
+return texts.join('\\n').toLowerCase();
+"""
+
+# Single round trip per poll: DOM parsed and (optionally) the ready selector present
+_READY_SCRIPT = """
+if (document.readyState === 'loading') return false;
+return !arguments[0] || document.querySelector(arguments[0]) !== null;
+"""
+
+
+def wait_for_page_ready(
+    driver: WebDriver, page_type: Optional[str] = None, timeout: Optional[float] = None
+) -> bool:
+    """
+    Wait until the document is parsed and the page type's content is present.
+
+    Args:
+        driver: Chrome WebDriver instance
+        page_type: Key in READY_SELECTORS; None waits for the document only
+        timeout: Ceiling in seconds (defaults to the configured page ready timeout)
+
+    Returns:
+        bool: True if the page became ready, False if the ceiling was reached
+    """
+    if timeout is None:
+        timeout = get_config().scraper.page_ready_timeout
+
+    selector = READY_SELECTORS.get(page_type) if page_type else None
+    if page_type and selector is None:
+        logger.warning(f"No ready selector registered for page type '{page_type}'")
+
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=POLL_FREQUENCY).until(
+            lambda d: d.execute_script(_READY_SCRIPT, selector)
+        )
+        return True
+    except TimeoutException:
+        logger.warning(
+            f"Page not ready after {timeout:.1f}s (type: {page_type or 'document'})"
+        )
+        return False
+
+
+def wait_for_url(
+    driver: WebDriver, predicate: Callable[[str], bool], timeout: Optional[float] = None
+) -> str:
+    """
+    Wait until the current URL satisfies a predicate.
+
+    Args:
+        driver: Chrome WebDriver instance
+        predicate: Function returning True for an acceptable URL
+        timeout: Ceiling in seconds (defaults to the configured login redirect timeout)
+
+    Returns:
+        str: The URL that matched, or the current URL if the ceiling was reached
+    """
+    if timeout is None:
+        timeout = get_config().scraper.login_redirect_timeout
+
+    try:
+        return WebDriverWait(driver, timeout, poll_frequency=POLL_FREQUENCY).until(
+            lambda d: d.current_url if predicate(d.current_url) else False
+        )
+    except TimeoutException:
+        return driver.current_url
+
+
+@contextmanager
+def probe_mode(driver: WebDriver) -> Iterator[WebDriver]:
+    """
+    Temporarily disable the implicit wait for lookups of optional elements.
+
+    Inside the with-block a missing element raises NoSuchElementException
+    immediately; the configured implicit wait is restored on exit.
+
+    Args:
+        driver: Chrome WebDriver instance
+
+    Yields:
+        WebDriver: The same driver, with implicit wait set to zero
+    """
+    driver.implicitly_wait(0)
+    try:
+        yield driver
+    finally:
+        driver.implicitly_wait(get_config().chrome.implicit_wait)
+
+
+def page_unavailable_reason(driver: WebDriver) -> Optional[str]:
+    """
+    Check whether the current page is LinkedIn's page for a missing or private entity.
+
+    Args:
+        driver: Chrome WebDriver instance
+
+    Returns:
+        Optional[str]: Why the page is unavailable, or None for a regular page
+    """
+    try:
+        # Compare whole paths, so e.g. /jobs/view/4041234567/ is not a 404 page
+        path = "/" + urlsplit(driver.current_url or "").path.strip("/")
+        if path in UNAVAILABLE_PATHS:
+            return "does not exist or is not accessible"
+
+        headlines = driver.execute_script(_HEADLINES_SCRIPT) or ""
+    except Exception as e:
+        logger.debug(f"Could not inspect page availability: {e}")
+        return None
+
+    for marker in UNAVAILABLE_TEXT_MARKERS:
+        if marker in headlines:
+            return f"is not available ({marker})"
+    return None
+
+
+@contextmanager
+def raise_if_unavailable(driver: WebDriver, entity: str) -> Iterator[None]:
+    """
+    Report a scrape that failed on a missing or private page as EntityNotFoundError.
+
+    Other failures are re-raised unchanged.
+
+    Args:
+        driver: Chrome WebDriver instance the scrape navigated
+        entity: Description for the error message (e.g. "Profile 'johndoe'")
+
+    Raises:
+        EntityNotFoundError: If the scrape failed and the page is unavailable
+    """
+    try:
+        yield
+    except Exception as e:
+        reason = page_unavailable_reason(driver)
+        if reason is None:
+            raise
+        raise EntityNotFoundError(f"{entity} {reason}") from e
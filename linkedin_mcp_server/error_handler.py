@@ -8,7 +8,8 @@ Eliminates code duplication while ensuring user-friendly error messages.
 """
 
 import logging
-from typing import Any, Dict, List
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List
 
 from linkedin_scraper.exceptions import (
     CaptchaRequiredError,
@@ -21,7 +22,10 @@ from linkedin_scraper.exceptions import (
 
 from linkedin_mcp_server.exceptions import (
     CredentialsNotFoundError,
+    DriverPoolTimeoutError,
+    EntityNotFoundError,
     LinkedInMCPError,
+    ScraperQueueFullError,
 )
 
 
@@ -119,6 +123,27 @@ def convert_exception_to_response(
             "resolution": "Check network connection and try again",
         }
 
+    elif isinstance(exception, ScraperQueueFullError):
+        return {
+            "error": "scraper_busy",
+            "message": str(exception),
+            "resolution": "Wait for running scrapes to finish and try again",
+        }
+
+    elif isinstance(exception, DriverPoolTimeoutError):
+        return {
+            "error": "driver_pool_exhausted",
+            "message": str(exception),
+            "resolution": "All browser sessions are busy; try again shortly or raise SCRAPER_POOL_MAX_SIZE",
+        }
+
+    elif isinstance(exception, EntityNotFoundError):
+        return {
+            "error": "entity_not_found",
+            "message": str(exception),
+            "resolution": "Check the username, company name or ID; the page may have been removed or is private",
+        }
+
     elif isinstance(exception, LinkedInMCPError):
         return {"error": "linkedin_error", "message": str(exception)}
 
@@ -158,23 +183,25 @@ def convert_exception_to_list_response(
     return [convert_exception_to_response(exception, context)]
 
 
-def safe_get_driver():
+@contextmanager
+def safe_driver_session() -> Iterator[Any]:
     """
-    Safely get or create a driver with proper error handling.
+    Safely check out a pooled driver with proper error handling.
 
-    Returns:
+    The driver is returned to the pool when the with-block exits.
+
+    Yields:
         Driver instance
 
     Raises:
-        LinkedInMCPError: If driver initialization fails
+        LinkedInMCPError: If driver initialization fails or the pool is exhausted
     """
     from linkedin_mcp_server.authentication import ensure_authentication
-    from linkedin_mcp_server.drivers.chrome import get_or_create_driver
+    from linkedin_mcp_server.drivers.chrome import driver_session
 
     # Get authentication first
     authentication = ensure_authentication()
 
-    # Create driver with authentication
-    driver = get_or_create_driver(authentication)
-
-    return driver
+    # Check out a driver logged in with this authentication
+    with driver_session(authentication) as driver:
+        yield driver
@@ -24,3 +24,21 @@ class DriverInitializationError(LinkedInMCPError):
     """Failed to initialize Chrome WebDriver."""
 
     pass
+
+
+class ScraperQueueFullError(LinkedInMCPError):
+    """Too many scrapes are already waiting for the browser."""
+
+    pass
+
+
+class DriverPoolTimeoutError(LinkedInMCPError):
+    """No browser session became available within the pool timeout."""
+
+    pass
+
+
+class EntityNotFoundError(LinkedInMCPError):
+    """The requested profile, company, job or post does not exist or is not accessible."""
+
+    pass
@@ -8,21 +8,35 @@ Provides clean shutdown handling and resource cleanup.
 """
 
 import logging
-from typing import Any, Dict
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict
 
 from fastmcp import FastMCP
 
 from linkedin_mcp_server.tools.company import register_company_tools
 from linkedin_mcp_server.tools.job import register_job_tools
 from linkedin_mcp_server.tools.person import register_person_tools
-from linkedin_mcp_server.tools.post import register_post_tools
+from linkedin_mcp_server.tools.post import get_post_scheduler, register_post_tools
 
 logger = logging.getLogger(__name__)
 
 
+@asynccontextmanager
+async def server_lifespan(server: FastMCP) -> AsyncIterator[Dict[str, Any]]:
+    """Run background services (the scheduled post publisher) while the server runs."""
+    scheduler = get_post_scheduler()
+    if scheduler is not None:
+        scheduler.ensure_started()
+    try:
+        yield {}
+    finally:
+        if scheduler is not None:
+            await scheduler.stop()
+
+
 def create_mcp_server() -> FastMCP:
     """Create and configure the MCP server with all LinkedIn tools."""
-    mcp = FastMCP("linkedin_mcp")
+    mcp = FastMCP("linkedin_mcp", lifespan=server_lifespan)
 
     # Register all tools
     register_person_tools(mcp)
@@ -54,5 +68,7 @@ def create_mcp_server() -> FastMCP:
 def shutdown_handler() -> None:
     """Clean up resources on shutdown."""
     from linkedin_mcp_server.drivers.chrome import close_all_drivers
+    from linkedin_mcp_server.drivers.executor import shutdown_driver_executor
 
+    shutdown_driver_executor()
     close_all_drivers()
@@ -0,0 +1,136 @@
+# linkedin_mcp_server/storage.py
+"""
+Persistent local state for LinkedIn MCP Server.
+
+State that must survive restarts of the (often short-lived) stdio server, such
+as caches, is kept in one data directory: LINKEDIN_MCP_DATA_DIR if set,
+otherwise ~/.linkedin-mcp. Small key-value caches are stored as JSON files with
+a TTL per entry.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def get_data_dir() -> Path:
+    """
+    Get the data directory, creating it if needed.
+
+    Returns:
+        Path: Directory for persistent server state
+    """
+    data_dir = Path(
+        os.getenv("LINKEDIN_MCP_DATA_DIR") or Path.home() / ".linkedin-mcp"
+    ).expanduser()
+    data_dir.mkdir(parents=True, exist_ok=True)
+    return data_dir
+
+
+class JSONFileCache:
+    """Key-value cache with per-entry expiry, stored in a small JSON file."""
+
+    def __init__(self, filename: str, ttl: float, path: Optional[Path] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            filename: File name in the data directory
+            ttl: Entry lifetime in seconds (0 disables the cache)
+            path: Explicit cache file, overriding filename
+        """
+        self.filename = filename
+        self.ttl = ttl
+        self._path = path
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> Path:
+        if self._path is None:
+            self._path = get_data_dir() / self.filename
+        return self._path
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Optional[Any]: The value, or None if missing or expired
+        """
+        if self.ttl <= 0:
+            return None
+
+        with self._lock:
+            entry = self._load().get(key)
+
+        if not entry or entry.get("expires_at", 0) <= time.time():
+            return None
+        return entry.get("value")
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Cache a JSON-serializable value, pruning expired entries.
+
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        if self.ttl <= 0:
+            return
+
+        now = time.time()
+        with self._lock:
+            entries = {
+                k: entry
+                for k, entry in self._load().items()
+                if entry.get("expires_at", 0) > now
+            }
+            entries[key] = {"value": value, "expires_at": now + self.ttl}
+            self._save(entries)
+
+    def invalidate(self, key: str) -> bool:
+        """
+        Drop a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            bool: True if an entry was removed
+        """
+        with self._lock:
+            entries = self._load()
+            if entries.pop(key, None) is None:
+                return False
+            self._save(entries)
+            return True
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable cache file {self.path}: {e}")
+            return {}
+
+    def _save(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        # Write to a temporary file first, so readers never see a partial file
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entries, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not write cache file {self.path}: {e}")
@@ -14,7 +14,7 @@ Available Tools:
 Architecture:
 - FastMCP integration for MCP-compliant tool registration
 - Shared error handling through centralized error_handler module
-- Singleton driver pattern for session persistence (scraping tools)
+- Pooled, authenticated drivers for session persistence (scraping tools)
 - LinkedIn API client for post creation (API tools)
 - Structured data return format for consistent MCP responses
 """
@@ -12,11 +12,95 @@ from typing import Any, Dict, List
 from fastmcp import FastMCP
 from linkedin_scraper import Company
 
-from linkedin_mcp_server.error_handler import handle_tool_error, safe_get_driver
+from linkedin_mcp_server.cache import (
+    cache_key,
+    get_scrape_cache,
+    guard_not_found,
+    normalize_company_name,
+    read_through,
+    scrape_flights,
+)
+from linkedin_mcp_server.config import get_config
+from linkedin_mcp_server.drivers.executor import run_in_driver_thread
+from linkedin_mcp_server.drivers.waits import raise_if_unavailable
+from linkedin_mcp_server.error_handler import handle_tool_error, safe_driver_session
 
 logger = logging.getLogger(__name__)
 
 
+def scrape_company_profile(
+    company_name: str, get_employees: bool = False
+) -> Dict[str, Any]:
+    """
+    Scrape a company's LinkedIn profile (blocking, runs on the driver thread).
+
+    Args:
+        company_name (str): LinkedIn company name
+        get_employees (bool): Whether to scrape the company's employees (slower)
+
+    Returns:
+        Dict[str, Any]: Structured data from the company's profile
+    """
+    # Construct clean LinkedIn URL from company name
+    linkedin_url = f"https://www.linkedin.com/company/{company_name}/"
+
+    with safe_driver_session() as driver:
+        logger.info(f"Scraping company: {linkedin_url}")
+        if get_employees:
+            logger.info("Fetching employees may take a while...")
+
+        with raise_if_unavailable(driver, f"Company '{company_name}'"):
+            company = Company(
+                linkedin_url,
+                driver=driver,
+                get_employees=get_employees,
+                close_on_complete=False,
+            )
+
+    # Convert showcase pages to structured dictionaries
+    showcase_pages: List[Dict[str, Any]] = [
+        {
+            "name": page.name,
+            "linkedin_url": page.linkedin_url,
+            "followers": page.followers,
+        }
+        for page in company.showcase_pages
+    ]
+
+    # Convert affiliated companies to structured dictionaries
+    affiliated_companies: List[Dict[str, Any]] = [
+        {
+            "name": affiliated.name,
+            "linkedin_url": affiliated.linkedin_url,
+            "followers": affiliated.followers,
+        }
+        for affiliated in company.affiliated_companies
+    ]
+
+    # Build the result dictionary
+    result: Dict[str, Any] = {
+        "name": company.name,
+        "about_us": company.about_us,
+        "website": company.website,
+        "phone": company.phone,
+        "headquarters": company.headquarters,
+        "founded": company.founded,
+        "industry": company.industry,
+        "company_type": company.company_type,
+        "company_size": company.company_size,
+        "specialties": company.specialties,
+        "showcase_pages": showcase_pages,
+        "affiliated_companies": affiliated_companies,
+        "headcount": company.headcount,
+    }
+
+    # Add employees if requested and available
+    if get_employees and company.employees:
+        result["employees"] = company.employees
+
+    return result
+
+
 def register_company_tools(mcp: FastMCP) -> None:
     """
     Register all company-related tools with the MCP server.
@@ -24,79 +108,55 @@ def register_company_tools(mcp: FastMCP) -> None:
     Args:
         mcp (FastMCP): The MCP server instance
     """
+    cache_config = get_config().cache
+    scrape_cache = get_scrape_cache()
 
     @mcp.tool()
     async def get_company_profile(
-        company_name: str, get_employees: bool = False
+        company_name: str, get_employees: bool = False, force_refresh: bool = False
     ) -> Dict[str, Any]:
         """
         Get a specific company's LinkedIn profile.
 
+        Recently scraped companies are answered from a cache. Older cached
+        results are still returned immediately while a background scrape
+        refreshes them.
+
         Args:
             company_name (str): LinkedIn company name (e.g., "docker", "anthropic", "microsoft")
             get_employees (bool): Whether to scrape the company's employees (slower)
+            force_refresh (bool): Scrape the company again even if it is cached
 
         Returns:
             Dict[str, Any]: Structured data from the company's profile
         """
         try:
-            # Construct clean LinkedIn URL from company name
-            linkedin_url = f"https://www.linkedin.com/company/{company_name}/"
-
-            driver = safe_get_driver()
-
-            logger.info(f"Scraping company: {linkedin_url}")
-            if get_employees:
-                logger.info("Fetching employees may take a while...")
-
-            company = Company(
-                linkedin_url,
-                driver=driver,
-                get_employees=get_employees,
-                close_on_complete=False,
+            name = normalize_company_name(company_name)
+            variant = "employees" if get_employees else "basic"
+            key = cache_key("company", name, variant)
+
+            async def scrape() -> Dict[str, Any]:
+                return await guard_not_found(
+                    scrape_cache,
+                    key,
+                    lambda: scrape_flights.do(
+                        cache_key("get_company_profile", name, variant),
+                        run_in_driver_thread,
+                        scrape_company_profile,
+                        name,
+                        get_employees,
+                    ),
+                    cache_config.not_found_ttl,
+                    force_refresh,
+                )
+
+            return await read_through(
+                scrape_cache,
+                key,
+                scrape,
+                cache_config.company_ttl,
+                cache_config.company_max_stale,
+                force_refresh,
             )
-
-            # Convert showcase pages to structured dictionaries
-            showcase_pages: List[Dict[str, Any]] = [
-                {
-                    "name": page.name,
-                    "linkedin_url": page.linkedin_url,
-                    "followers": page.followers,
-                }
-                for page in company.showcase_pages
-            ]
-
-            # Convert affiliated companies to structured dictionaries
-            affiliated_companies: List[Dict[str, Any]] = [
-                {
-                    "name": affiliated.name,
-                    "linkedin_url": affiliated.linkedin_url,
-                    "followers": affiliated.followers,
-                }
-                for affiliated in company.affiliated_companies
-            ]
-
-            # Build the result dictionary
-            result: Dict[str, Any] = {
-                "name": company.name,
-                "about_us": company.about_us,
-                "website": company.website,
-                "phone": company.phone,
-                "headquarters": company.headquarters,
-                "founded": company.founded,
-                "industry": company.industry,
-                "company_type": company.company_type,
-                "company_size": company.company_size,
-                "specialties": company.specialties,
-                "showcase_pages": showcase_pages,
-                "affiliated_companies": affiliated_companies,
-                "headcount": company.headcount,
-            }
-
-            # Add employees if requested and available
-            if get_employees and company.employees:
-                result["employees"] = company.employees
-
-            return result
         except Exception as e:
             return handle_tool_error(e, "get_company_profile")
@@ -12,15 +12,90 @@ from typing import Any, Dict, List
 from fastmcp import FastMCP
 from linkedin_scraper import Job, JobSearch
 
+from linkedin_mcp_server.cache import (
+    cache_key,
+    get_scrape_cache,
+    guard_not_found,
+    normalize_job_id,
+    normalize_search_term,
+    read_through,
+    scrape_flights,
+)
+from linkedin_mcp_server.config import get_config
+from linkedin_mcp_server.drivers.executor import run_in_driver_thread
+from linkedin_mcp_server.drivers.waits import raise_if_unavailable
 from linkedin_mcp_server.error_handler import (
     handle_tool_error,
     handle_tool_error_list,
-    safe_get_driver,
+    safe_driver_session,
 )
 
 logger = logging.getLogger(__name__)
 
 
+def scrape_job_details(job_id: str) -> Dict[str, Any]:
+    """
+    Scrape a job posting (blocking, runs on the driver thread).
+
+    Args:
+        job_id (str): LinkedIn job ID
+
+    Returns:
+        Dict[str, Any]: Structured job data
+    """
+    # Construct clean LinkedIn URL from job ID
+    job_url = f"https://www.linkedin.com/jobs/view/{job_id}/"
+
+    with safe_driver_session() as driver:
+        logger.info(f"Scraping job: {job_url}")
+        with raise_if_unavailable(driver, f"Job {job_id}"):
+            job = Job(job_url, driver=driver, close_on_complete=False)
+
+        # Convert job object to a dictionary
+        return job.to_dict()
+
+
+def scrape_job_search(search_term: str) -> List[Dict[str, Any]]:
+    """
+    Run a job search (blocking, runs on the driver thread).
+
+    Args:
+        search_term (str): Search term to use for the job search
+
+    Returns:
+        List[Dict[str, Any]]: List of job search results
+    """
+    with safe_driver_session() as driver:
+        logger.info(f"Searching jobs: {search_term}")
+        job_search = JobSearch(driver=driver, close_on_complete=False, scrape=False)
+        jobs = job_search.search(search_term)
+
+        # Convert job objects to dictionaries
+        return [job.to_dict() for job in jobs]
+
+
+def scrape_recommended_jobs() -> List[Dict[str, Any]]:
+    """
+    Scrape personalized job recommendations (blocking, runs on the driver thread).
+
+    Returns:
+        List[Dict[str, Any]]: List of recommended jobs
+    """
+    with safe_driver_session() as driver:
+        logger.info("Getting recommended jobs")
+        job_search = JobSearch(
+            driver=driver,
+            close_on_complete=False,
+            scrape=True,  # Enable scraping to get recommended jobs
+            scrape_recommended_jobs=True,
+        )
+
+        if hasattr(job_search, "recommended_jobs") and job_search.recommended_jobs:
+            return [job.to_dict() for job in job_search.recommended_jobs]
+        else:
+            return []
+
+
 def register_job_tools(mcp: FastMCP) -> None:
     """
     Register all job-related tools with the MCP server.
@@ -28,53 +103,91 @@ def register_job_tools(mcp: FastMCP) -> None:
     Args:
         mcp (FastMCP): The MCP server instance
     """
+    cache_config = get_config().cache
+    scrape_cache = get_scrape_cache()
 
     @mcp.tool()
-    async def get_job_details(job_id: str) -> Dict[str, Any]:
+    async def get_job_details(
+        job_id: str, force_refresh: bool = False
+    ) -> Dict[str, Any]:
         """
         Get job details for a specific job posting on LinkedIn
 
+        Recently scraped postings are answered from a cache. Older cached
+        results are still returned immediately while a background scrape
+        refreshes them.
+
         Args:
             job_id (str): LinkedIn job ID (e.g., "4252026496", "3856789012")
+            force_refresh (bool): Scrape the posting again even if it is cached
 
         Returns:
             Dict[str, Any]: Structured job data including title, company, location, posting date,
                           application count, and job description (may be empty if content is protected)
         """
         try:
-            # Construct clean LinkedIn URL from job ID
-            job_url = f"https://www.linkedin.com/jobs/view/{job_id}/"
-
-            driver = safe_get_driver()
-
-            logger.info(f"Scraping job: {job_url}")
-            job = Job(job_url, driver=driver, close_on_complete=False)
-
-            # Convert job object to a dictionary
-            return job.to_dict()
+            job_id = normalize_job_id(job_id)
+            key = cache_key("job", job_id)
+
+            async def scrape() -> Dict[str, Any]:
+                return await guard_not_found(
+                    scrape_cache,
+                    key,
+                    lambda: scrape_flights.do(
+                        cache_key("get_job_details", job_id),
+                        run_in_driver_thread,
+                        scrape_job_details,
+                        job_id,
+                    ),
+                    cache_config.not_found_ttl,
+                    force_refresh,
+                )
+
+            return await read_through(
+                scrape_cache,
+                key,
+                scrape,
+                cache_config.job_ttl,
+                cache_config.job_max_stale,
+                force_refresh,
+            )
         except Exception as e:
             return handle_tool_error(e, "get_job_details")
 
     @mcp.tool()
-    async def search_jobs(search_term: str) -> List[Dict[str, Any]]:
+    async def search_jobs(
+        search_term: str, force_refresh: bool = False
+    ) -> List[Dict[str, Any]]:
         """
         Search for jobs on LinkedIn using a search term.
 
+        Recent identical searches are answered from a cache.
+
         Args:
             search_term (str): Search term to use for the job search.
+            force_refresh (bool): Run the search again even if it is cached
 
         Returns:
             List[Dict[str, Any]]: List of job search results
         """
         try:
-            driver = safe_get_driver()
-
-            logger.info(f"Searching jobs: {search_term}")
-            job_search = JobSearch(driver=driver, close_on_complete=False, scrape=False)
-            jobs = job_search.search(search_term)
-
-            # Convert job objects to dictionaries
-            return [job.to_dict() for job in jobs]
+            term = normalize_search_term(search_term)
+            key = cache_key("job_search", term)
+            if not force_refresh:
+                cached = await scrape_cache.aget(key)
+                if cached is not None:
+                    return cached
+
+            jobs = await scrape_flights.do(
+                cache_key("search_jobs", term),
+                run_in_driver_thread,
+                scrape_job_search,
+                search_term,
+            )
+            # An empty result is more likely a failed scrape than a real answer
+            if jobs:
+                await scrape_cache.aset(key, jobs, cache_config.job_search_ttl)
+            return jobs
         except Exception as e:
             return handle_tool_error_list(e, "search_jobs")
 
@@ -87,19 +200,10 @@ def register_job_tools(mcp: FastMCP) -> None:
             List[Dict[str, Any]]: List of recommended jobs
         """
         try:
-            driver = safe_get_driver()
-
-            logger.info("Getting recommended jobs")
-            job_search = JobSearch(
-                driver=driver,
-                close_on_complete=False,
-                scrape=True,  # Enable scraping to get recommended jobs
-                scrape_recommended_jobs=True,
+            return await scrape_flights.do(
+                cache_key("get_recommended_jobs"),
+                run_in_driver_thread,
+                scrape_recommended_jobs,
             )
-
-            if hasattr(job_search, "recommended_jobs") and job_search.recommended_jobs:
-                return [job.to_dict() for job in job_search.recommended_jobs]
-            else:
-                return []
         except Exception as e:
             return handle_tool_error_list(e, "get_recommended_jobs")
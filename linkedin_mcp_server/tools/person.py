@@ -12,11 +12,100 @@ from typing import Any, Dict, List
 from fastmcp import FastMCP
 from linkedin_scraper import Person
 
-from linkedin_mcp_server.error_handler import handle_tool_error, safe_get_driver
+from linkedin_mcp_server.cache import (
+    ResultCache,
+    cache_key,
+    get_scrape_cache,
+    guard_not_found,
+    normalize_username,
+    scrape_flights,
+)
+from linkedin_mcp_server.config import get_config
+from linkedin_mcp_server.drivers.executor import run_in_driver_thread
+from linkedin_mcp_server.drivers.waits import raise_if_unavailable
+from linkedin_mcp_server.error_handler import handle_tool_error, safe_driver_session
+from linkedin_mcp_server.exceptions import EntityNotFoundError
 
 logger = logging.getLogger(__name__)
 
 
+def scrape_person_profile(linkedin_username: str) -> Dict[str, Any]:
+    """
+    Scrape a person's LinkedIn profile (blocking, runs on the driver thread).
+
+    Args:
+        linkedin_username (str): LinkedIn username
+
+    Returns:
+        Dict[str, Any]: Structured data from the person's profile
+    """
+    # Construct clean LinkedIn URL from username
+    linkedin_url = f"https://www.linkedin.com/in/{linkedin_username}/"
+
+    with safe_driver_session() as driver:
+        logger.info(f"Scraping profile: {linkedin_url}")
+        with raise_if_unavailable(driver, f"Profile '{linkedin_username}'"):
+            person = Person(linkedin_url, driver=driver, close_on_complete=False)
+
+    # Convert experiences to structured dictionaries
+    experiences: List[Dict[str, Any]] = [
+        {
+            "position_title": exp.position_title,
+            "company": exp.institution_name,
+            "from_date": exp.from_date,
+            "to_date": exp.to_date,
+            "duration": exp.duration,
+            "location": exp.location,
+            "description": exp.description,
+        }
+        for exp in person.experiences
+    ]
+
+    # Convert educations to structured dictionaries
+    educations: List[Dict[str, Any]] = [
+        {
+            "institution": edu.institution_name,
+            "degree": edu.degree,
+            "from_date": edu.from_date,
+            "to_date": edu.to_date,
+            "description": edu.description,
+        }
+        for edu in person.educations
+    ]
+
+    # Convert interests to list of titles
+    interests: List[str] = [interest.title for interest in person.interests]
+
+    # Convert accomplishments to structured dictionaries
+    accomplishments: List[Dict[str, str]] = [
+        {"category": acc.category, "title": acc.title} for acc in person.accomplishments
+    ]
+
+    # Convert contacts to structured dictionaries
+    contacts: List[Dict[str, str]] = [
+        {
+            "name": contact.name,
+            "occupation": contact.occupation,
+            "url": contact.url,
+        }
+        for contact in person.contacts
+    ]
+
+    # Return the complete profile data
+    return {
+        "name": person.name,
+        "about": person.about,
+        "experiences": experiences,
+        "educations": educations,
+        "interests": interests,
+        "accomplishments": accomplishments,
+        "contacts": contacts,
+        "company": person.company,
+        "job_title": person.job_title,
+        "open_to_work": getattr(person, "open_to_work", False),
+    }
+
+
 def register_person_tools(mcp: FastMCP) -> None:
     """
     Register all person-related tools with the MCP server.
@@ -24,84 +113,62 @@ def register_person_tools(mcp: FastMCP) -> None:
     Args:
         mcp (FastMCP): The MCP server instance
     """
+    cache_config = get_config().cache
+    profile_cache = ResultCache(
+        cache_config.profile_ttl,
+        max_entries=cache_config.profile_max_entries,
+        max_bytes=cache_config.profile_max_bytes,
+    )
+    scrape_cache = get_scrape_cache()
 
     @mcp.tool()
-    async def get_person_profile(linkedin_username: str) -> Dict[str, Any]:
+    async def get_person_profile(
+        linkedin_username: str, force_refresh: bool = False
+    ) -> Dict[str, Any]:
         """
         Get a specific person's LinkedIn profile.
 
+        Recently scraped profiles are answered from a cache in memory or on disk.
+
         Args:
             linkedin_username (str): LinkedIn username (e.g., "stickerdaniel", "anistji")
+            force_refresh (bool): Scrape the profile again even if it is cached
 
         Returns:
             Dict[str, Any]: Structured data from the person's profile
         """
         try:
-            # Construct clean LinkedIn URL from username
-            linkedin_url = f"https://www.linkedin.com/in/{linkedin_username}/"
-
-            driver = safe_get_driver()
-
-            logger.info(f"Scraping profile: {linkedin_url}")
-            person = Person(linkedin_url, driver=driver, close_on_complete=False)
-
-            # Convert experiences to structured dictionaries
-            experiences: List[Dict[str, Any]] = [
-                {
-                    "position_title": exp.position_title,
-                    "company": exp.institution_name,
-                    "from_date": exp.from_date,
-                    "to_date": exp.to_date,
-                    "duration": exp.duration,
-                    "location": exp.location,
-                    "description": exp.description,
-                }
-                for exp in person.experiences
-            ]
-
-            # Convert educations to structured dictionaries
-            educations: List[Dict[str, Any]] = [
-                {
-                    "institution": edu.institution_name,
-                    "degree": edu.degree,
-                    "from_date": edu.from_date,
-                    "to_date": edu.to_date,
-                    "description": edu.description,
-                }
-                for edu in person.educations
-            ]
-
-            # Convert interests to list of titles
-            interests: List[str] = [interest.title for interest in person.interests]
-
-            # Convert accomplishments to structured dictionaries
-            accomplishments: List[Dict[str, str]] = [
-                {"category": acc.category, "title": acc.title}
-                for acc in person.accomplishments
-            ]
-
-            # Convert contacts to structured dictionaries
-            contacts: List[Dict[str, str]] = [
-                {
-                    "name": contact.name,
-                    "occupation": contact.occupation,
-                    "url": contact.url,
-                }
-                for contact in person.contacts
-            ]
-
-            # Return the complete profile data
-            return {
-                "name": person.name,
-                "about": person.about,
-                "experiences": experiences,
-                "educations": educations,
-                "interests": interests,
-                "accomplishments": accomplishments,
-                "contacts": contacts,
-                "company": person.company,
-                "job_title": person.job_title,
-                "open_to_work": getattr(person, "open_to_work", False),
-            }
+            username = normalize_username(linkedin_username)
+            key = cache_key("person", username)
+            if not force_refresh:
+                cached = profile_cache.get(key)
+                if cached is None:
+                    cached = await scrape_cache.aget(key)
+                    if cached is not None:
+                        profile_cache.set(key, cached)
+                if cached is not None:
+                    logger.debug(f"Profile cache hit: {key}")
+                    return cached
+
+            profile = await guard_not_found(
+                scrape_cache,
+                key,
+                lambda: scrape_flights.do(
+                    cache_key("get_person_profile", username),
+                    run_in_driver_thread,
+                    scrape_person_profile,
+                    username,
+                ),
+                cache_config.not_found_ttl,
+                force_refresh,
+            )
+            profile_cache.set(key, profile)
+            await scrape_cache.aset(key, profile, cache_config.profile_ttl)
+            return profile
+        except EntityNotFoundError as e:
+            # guard_not_found only drops the disk entry; the memory copy would
+            # otherwise keep serving the deleted profile
+            profile_cache.invalidate(key)
+            return handle_tool_error(e, "get_person_profile")
         except Exception as e:
             return handle_tool_error(e, "get_person_profile")
@@ -9,194 +9,164 @@ Comprehensive LinkedIn REST API integration supporting:
 - Complete w_member_social permission coverage
 """
 
+import asyncio
 import logging
 import os
-from enum import Enum
+import sqlite3
 from typing import Any, Dict, List, Optional
 
-import requests
 from fastmcp import FastMCP
 
-logger = logging.getLogger(__name__)
-
-
-class PostVisibility(str, Enum):
-    """LinkedIn post visibility options."""
-
-    PUBLIC = "PUBLIC"
-    CONNECTIONS = "CONNECTIONS"
-
+from linkedin_mcp_server.api import (
+    AsyncLinkedInAPIClient,
+    LinkedInAPIClient,  # noqa: F401 - re-exported for code importing it from here
+    PostVisibility,
+    ReactionType,
+)
+from linkedin_mcp_server.api.post_queue import (
+    POST_STATES,
+    PostQueue,
+    PostScheduler,
+    parse_schedule_time,
+)
+from linkedin_mcp_server.exceptions import EntityNotFoundError
 
-class ReactionType(str, Enum):
-    """LinkedIn reaction types."""
-
-    LIKE = "LIKE"
-    PRAISE = "PRAISE"
-    APPRECIATION = "APPRECIATION"
-    EMPATHY = "EMPATHY"
-    INTEREST = "INTEREST"
-    ENTERTAINMENT = "ENTERTAINMENT"
+logger = logging.getLogger(__name__)
 
+# Publisher of scheduled posts, set when the API tools are enabled
+_post_scheduler: Optional[PostScheduler] = None
+
+
+def get_post_scheduler() -> Optional[PostScheduler]:
+    """Get the scheduled post publisher, or None if the API tools are disabled."""
+    return _post_scheduler
+
+
+def scrape_linkedin_post(post_url: str, post_id: str) -> Dict[str, Any]:
+    """
+    Scrape a LinkedIn post with a pooled, authenticated driver.
+
+    Blocking; runs on the driver thread. The pooled driver is already logged in,
+    so each call only pays for navigating to the post.
+
+    Args:
+        post_url: Full LinkedIn post URL
+        post_id: Activity ID extracted from the URL
+
+    Returns:
+        Dict with post details including content, author, reactions, etc.
+    """
+    from linkedin_mcp_server.drivers.extraction import extract_post_data
+    from linkedin_mcp_server.drivers.waits import (
+        page_unavailable_reason,
+        wait_for_page_ready,
+    )
+    from linkedin_mcp_server.error_handler import safe_driver_session
+
+    with safe_driver_session() as driver:
+        # Navigate to post
+        clean_url = post_url.split('?')[0]  # Remove URL parameters
+        driver.get(clean_url)
+        if not wait_for_page_ready(driver, "post"):
+            reason = page_unavailable_reason(driver)
+            if reason:
+                raise EntityNotFoundError(f"Post {post_id} {reason}")
+
+        # Extract all post fields in a single script round trip
+        return {
+            "status": "success",
+            "post_id": post_id,
+            "url": clean_url,
+            "data": extract_post_data(driver),
+        }
 
-class LinkedInAPIClient:
-    """Comprehensive LinkedIn REST API client."""
 
-    def __init__(self, access_token: str, base_url: Optional[str] = None):
-        """
-        Initialize LinkedIn API client.
+def register_post_tools(mcp: FastMCP) -> None:
+    """Register all LinkedIn API tools with the MCP server."""
+    access_token = os.getenv("LINKEDIN_ACCESS_TOKEN")
 
-        Args:
-            access_token (str): LinkedIn API access token
-            base_url (str, optional): Base URL for REST API
-        """
-        self.access_token = access_token
-        self.base_url = base_url or os.getenv(
-            "LINKEDIN_API_BASE_URL", "https://api.linkedin.com/rest"
+    if not access_token:
+        logger.warning(
+            "LINKEDIN_ACCESS_TOKEN not found. API tools disabled. "
+            "Set LINKEDIN_ACCESS_TOKEN environment variable to enable."
         )
-        self.headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json",
-            "LinkedIn-Version": os.getenv("LINKEDIN_API_VERSION", "202510"),
-            "X-Restli-Protocol-Version": "2.0.0",
-        }
-        self._person_urn = None
-
-    def _get_person_urn(self) -> str:
-        """Get cached person URN or fetch it."""
-        if self._person_urn:
-            return self._person_urn
-
-        try:
-            # Use /v2/userinfo endpoint (works with w_member_social)
-            response = requests.get(
-                "https://api.linkedin.com/v2/userinfo",
-                headers=self.headers,
-                timeout=10,
-            )
-            if response.status_code == 200:
-                data = response.json()
-                person_id = data.get("sub")
-                if person_id:
-                    self._person_urn = f"urn:li:person:{person_id}"
-                    logger.info(f"Got person URN: {self._person_urn}")
-                    return self._person_urn
-        except Exception as e:
-            logger.warning(f"Failed to get person URN from userinfo: {e}")
+        return
 
-        try:
-            # Fallback: Try /rest/me endpoint
-            response = requests.get(
-                f"{self.base_url}/me",
-                headers=self.headers,
-                timeout=10,
-            )
-            if response.status_code == 200:
-                data = response.json()
-                person_id = data.get("id") or data.get("sub")
-                if person_id:
-                    self._person_urn = f"urn:li:person:{person_id}"
-                    logger.info(f"Got person URN from /rest/me: {self._person_urn}")
-                    return self._person_urn
-        except Exception as e:
-            logger.warning(f"Failed to get person URN from /rest/me: {e}")
+    global _post_scheduler
+
+    client = AsyncLinkedInAPIClient(access_token)
+    scheduler: Optional[PostScheduler] = None
+    scheduling_error = ""
+    try:
+        scheduler = _post_scheduler = PostScheduler(client, PostQueue())
+    except (sqlite3.Error, OSError) as e:
+        # A read-only or broken data directory must not take down the other tools
+        scheduling_error = f"Post scheduling unavailable: could not open the post queue ({e})"
+        logger.warning(scheduling_error)
+    logger.info("✓ LinkedIn API tools enabled")
 
-        raise Exception(
-            "Cannot determine user ID. Ensure you have w_member_social permission."
-        )
+    def require_scheduler() -> PostScheduler:
+        if scheduler is None:
+            raise RuntimeError(scheduling_error)
+        return scheduler
 
-    # ==================== POST MANAGEMENT ====================
+    # ==================== POST TOOLS ====================
 
-    def create_post(
-        self,
+    @mcp.tool()
+    async def create_linkedin_post(
         text: str,
-        visibility: PostVisibility = PostVisibility.PUBLIC,
-        media_urns: Optional[List[str]] = None,
+        visibility: str = "PUBLIC",
+        image_url: Optional[str] = None,
+        image_urls: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
         """
-        Create a LinkedIn post (text, image, video, or document).
+        Create a LinkedIn post (text, with an image, or with several images).
 
         Args:
-            text: Post content
-            visibility: PUBLIC or CONNECTIONS
-            media_urns: Optional list of media URNs (images/videos/documents)
+            text: Post content text
+            visibility: 'PUBLIC' or 'CONNECTIONS' (default: PUBLIC)
+            image_url: Optional image URL or file in LINKEDIN_UPLOAD_DIR to include
+            image_urls: Optional list of image URLs or files in LINKEDIN_UPLOAD_DIR for a
+                multi-image post (uploaded in parallel)
 
         Returns:
             Dict with post URN and status
         """
-        author_urn = self._get_person_urn()
-
-        post_data = {
-            "author": author_urn,
-            "commentary": text,
-            "visibility": visibility.value,
-            "distribution": {
-                "feedDistribution": "MAIN_FEED",
-                "targetEntities": [],
-                "thirdPartyDistributionChannels": [],
-            },
-            "lifecycleState": "PUBLISHED",
-            "isReshareDisabledByAuthor": False,
-        }
+        try:
+            vis = PostVisibility.PUBLIC if visibility.upper() != "CONNECTIONS" else PostVisibility.CONNECTIONS
 
-        # Add media if provided
-        if media_urns:
-            post_data["content"] = {"media": {"id": media_urns[0]}}
+            images = ([image_url] if image_url else []) + (image_urls or [])
+            media_urns = None
+            if images:
+                upload_result = await client.upload_images(images)
+                media_urns = upload_result["image_urns"]
 
-        try:
-            logger.info("Creating LinkedIn post")
-            response = requests.post(
-                f"{self.base_url}/posts",
-                headers=self.headers,
-                json=post_data,
-                timeout=15,
-            )
-            response.raise_for_status()
-
-            result = response.json()
-            post_urn = result.get("id", result.get("urn", "unknown"))
-
-            logger.info(f"Post created: {post_urn}")
-            return {"post_urn": post_urn, "status": "success", "data": result}
-        except requests.exceptions.RequestException as e:
-            error_msg = f"Failed to create post: {str(e)}"
-            if hasattr(e, "response") and e.response is not None:
-                try:
-                    error_data = e.response.json()
-                    error_msg += f" - {error_data}"
-                except Exception:
-                    error_msg += f" - {e.response.text}"
-            logger.error(error_msg)
-            raise Exception(error_msg)
-
-    def update_post(self, post_urn: str, text: str) -> Dict[str, Any]:
+            result = await client.create_post(text, vis, media_urns)
+            return {"status": "success", "post_urn": result["post_urn"], "message": "Post created successfully"}
+        except Exception as e:
+            logger.error(f"Error creating post: {e}")
+            return {"status": "error", "message": str(e)}
+
+    @mcp.tool()
+    async def update_linkedin_post(post_urn: str, text: str) -> Dict[str, Any]:
         """
         Update an existing LinkedIn post.
 
         Args:
-            post_urn: URN of the post to update
+            post_urn: URN of the post to update (e.g., 'urn:li:share:123456')
             text: New post content
 
         Returns:
             Dict with status
         """
         try:
-            patch_data = {"commentary": text}
-
-            response = requests.patch(
-                f"{self.base_url}/posts/{post_urn}",
-                headers=self.headers,
-                json={"patch": {"$set": patch_data}},
-                timeout=15,
-            )
-            response.raise_for_status()
-
-            logger.info(f"Post updated: {post_urn}")
-            return {"status": "success", "message": "Post updated successfully"}
+            result = await client.update_post(post_urn, text)
+            return result
         except Exception as e:
-            logger.error(f"Failed to update post: {e}")
-            raise Exception(f"Failed to update post: {str(e)}")
+            return {"status": "error", "message": str(e)}
 
-    def delete_post(self, post_urn: str) -> Dict[str, Any]:
+    @mcp.tool()
+    async def delete_linkedin_post(post_urn: str) -> Dict[str, Any]:
         """
         Delete a LinkedIn post.
 
@@ -207,462 +177,260 @@ class LinkedInAPIClient:
             Dict with status
         """
         try:
-            response = requests.delete(
-                f"{self.base_url}/posts/{post_urn}",
-                headers=self.headers,
-                timeout=15,
-            )
-            response.raise_for_status()
-
-            logger.info(f"Post deleted: {post_urn}")
-            return {"status": "success", "message": "Post deleted successfully"}
+            result = await client.delete_post(post_urn)
+            return result
         except Exception as e:
-            logger.error(f"Failed to delete post: {e}")
-            raise Exception(f"Failed to delete post: {str(e)}")
+            return {"status": "error", "message": str(e)}
 
-    # ==================== IMAGE MANAGEMENT ====================
+    # ==================== SCHEDULED POST TOOLS ====================
 
-    def initialize_image_upload(self) -> Dict[str, Any]:
+    @mcp.tool()
+    async def schedule_linkedin_post(
+        text: str,
+        scheduled_at: Optional[str] = None,
+        visibility: str = "PUBLIC",
+        image_urls: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
         """
-        Initialize image upload to LinkedIn.
+        Queue a LinkedIn post to be published in the background.
 
-        Returns:
-            Dict with upload URL and image URN
-        """
-        author_urn = self._get_person_urn()
-
-        try:
-            response = requests.post(
-                f"{self.base_url}/images?action=initializeUpload",
-                headers=self.headers,
-                json={"initializeUploadRequest": {"owner": author_urn}},
-                timeout=15,
-            )
-            response.raise_for_status()
-
-            result = response.json()
-            return {
-                "upload_url": result.get("value", {}).get("uploadUrl"),
-                "image_urn": result.get("value", {}).get("image"),
-                "status": "success",
-            }
-        except Exception as e:
-            logger.error(f"Failed to initialize image upload: {e}")
-            raise Exception(f"Failed to initialize image upload: {str(e)}")
-
-    def upload_image(self, image_url: str) -> Dict[str, Any]:
-        """
-        Complete image upload workflow.
+        The queue is stored on disk and survives restarts. Posts are published
+        at their scheduled time, paced by the client-side rate limit, and
+        retried a few times if publishing fails.
 
         Args:
-            image_url: URL of the image to upload
+            text: Post content text
+            scheduled_at: ISO 8601 publish time, e.g. '2025-06-01T09:00:00+02:00'
+                (UTC if no timezone is given; default: as soon as possible)
+            visibility: 'PUBLIC' or 'CONNECTIONS' (default: PUBLIC)
+            image_urls: Optional image URLs or files in LINKEDIN_UPLOAD_DIR, uploaded at publish time
 
         Returns:
-            Dict with image URN
+            Dict with the queued post, including its ID for cancellation
         """
-        # Initialize upload
-        init_result = self.initialize_image_upload()
-        upload_url = init_result["upload_url"]
-        image_urn = init_result["image_urn"]
-
-        try:
-            # Download image
-            img_response = requests.get(image_url, timeout=30)
-            img_response.raise_for_status()
-
-            # Upload to LinkedIn
-            upload_response = requests.put(
-                upload_url, data=img_response.content, timeout=30
-            )
-            upload_response.raise_for_status()
-
-            logger.info(f"Image uploaded: {image_urn}")
-            return {"image_urn": image_urn, "status": "success"}
-        except Exception as e:
-            logger.error(f"Failed to upload image: {e}")
-            raise Exception(f"Failed to upload image: {str(e)}")
-
-    def get_image(self, image_id: str) -> Dict[str, Any]:
-        """Get image details."""
         try:
-            response = requests.get(
-                f"{self.base_url}/images/{image_id}", headers=self.headers, timeout=10
+            vis = PostVisibility.PUBLIC if visibility.upper() != "CONNECTIONS" else PostVisibility.CONNECTIONS
+            publisher = require_scheduler()
+            # Queue writes can wait on another process's lock, keep them off the loop
+            post = await asyncio.to_thread(
+                publisher.queue.enqueue,
+                text,
+                vis,
+                image_urls,
+                parse_schedule_time(scheduled_at),
             )
-            response.raise_for_status()
-            return {"status": "success", "data": response.json()}
+            publisher.ensure_started()
+            publisher.wake()
+            return {"status": "success", "post": post, "message": "Post scheduled"}
         except Exception as e:
-            raise Exception(f"Failed to get image: {str(e)}")
-
-    # ==================== VIDEO MANAGEMENT ====================
+            logger.error(f"Error scheduling post: {e}")
+            return {"status": "error", "message": str(e)}
 
-    def initialize_video_upload(self, file_size: int) -> Dict[str, Any]:
+    @mcp.tool()
+    async def list_scheduled_linkedin_posts(
+        status: Optional[str] = None, limit: int = 50
+    ) -> Dict[str, Any]:
         """
-        Initialize video upload.
+        List queued LinkedIn posts ordered by scheduled time.
 
         Args:
-            file_size: Size of video file in bytes
+            status: Only posts in this state: 'pending', 'publishing',
+                'published', 'failed' or 'cancelled' (default: all)
+            limit: Maximum number of posts to return (default: 50)
 
         Returns:
-            Dict with upload instructions and video URN
+            Dict with the queued posts and their publish status
         """
-        author_urn = self._get_person_urn()
-
         try:
-            response = requests.post(
-                f"{self.base_url}/videos?action=initializeUpload",
-                headers=self.headers,
-                json={
-                    "initializeUploadRequest": {
-                        "owner": author_urn,
-                        "fileSizeBytes": file_size,
-                        "uploadCaptions": False,
-                        "uploadThumbnail": False,
-                    }
-                },
-                timeout=15,
+            if status and status.lower() not in POST_STATES:
+                raise ValueError(
+                    f"Invalid status '{status}', expected one of: {', '.join(POST_STATES)}"
+                )
+            publisher = require_scheduler()
+            publisher.ensure_started()
+            posts = await asyncio.to_thread(
+                publisher.queue.list, status.lower() if status else None, limit
             )
-            response.raise_for_status()
-
-            result = response.json()
-            return {
-                "upload_instructions": result.get("value", {}).get(
-                    "uploadInstructions"
-                ),
-                "video_urn": result.get("value", {}).get("video"),
-                "status": "success",
-            }
+            return {"status": "success", "count": len(posts), "posts": posts}
         except Exception as e:
-            raise Exception(f"Failed to initialize video upload: {str(e)}")
+            return {"status": "error", "message": str(e)}
 
-    def finalize_video_upload(
-        self, video_urn: str, upload_token: str, etags: List[str]
-    ) -> Dict[str, Any]:
+    @mcp.tool()
+    async def cancel_scheduled_linkedin_post(post_id: int) -> Dict[str, Any]:
         """
-        Finalize video upload after chunks are uploaded.
+        Cancel a queued LinkedIn post that has not been published yet.
 
         Args:
-            video_urn: Video URN from initialization
-            upload_token: Upload token from initialization
-            etags: List of ETags from chunk uploads
+            post_id: ID returned by schedule_linkedin_post
 
         Returns:
             Dict with status
         """
         try:
-            response = requests.post(
-                f"{self.base_url}/videos?action=finalizeUpload",
-                headers=self.headers,
-                json={
-                    "finalizeUploadRequest": {
-                        "video": video_urn,
-                        "uploadToken": upload_token,
-                        "uploadedPartIds": etags,
-                    }
-                },
-                timeout=15,
-            )
-            response.raise_for_status()
-
-            return {"status": "success", "message": "Video upload finalized"}
-        except Exception as e:
-            raise Exception(f"Failed to finalize video upload: {str(e)}")
-
-    def get_video(self, video_id: str) -> Dict[str, Any]:
-        """Get video details."""
-        try:
-            response = requests.get(
-                f"{self.base_url}/videos/{video_id}", headers=self.headers, timeout=10
-            )
-            response.raise_for_status()
-            return {"status": "success", "data": response.json()}
-        except Exception as e:
-            raise Exception(f"Failed to get video: {str(e)}")
-
-    # ==================== DOCUMENT MANAGEMENT ====================
-
-    def initialize_document_upload(self) -> Dict[str, Any]:
-        """Initialize document upload."""
-        author_urn = self._get_person_urn()
-
-        try:
-            response = requests.post(
-                f"{self.base_url}/documents?action=initializeUpload",
-                headers=self.headers,
-                json={"initializeUploadRequest": {"owner": author_urn}},
-                timeout=15,
-            )
-            response.raise_for_status()
-
-            result = response.json()
+            publisher = require_scheduler()
+            if await asyncio.to_thread(publisher.queue.cancel, post_id):
+                return {"status": "success", "message": f"Scheduled post {post_id} cancelled"}
+            post = await asyncio.to_thread(publisher.queue.get, post_id)
+            if post is None:
+                return {"status": "error", "message": f"Scheduled post {post_id} not found"}
             return {
-                "upload_url": result.get("value", {}).get("uploadUrl"),
-                "document_urn": result.get("value", {}).get("document"),
-                "status": "success",
+                "status": "error",
+                "message": f"Scheduled post {post_id} is {post['status']} and can no longer be cancelled",
             }
         except Exception as e:
-            raise Exception(f"Failed to initialize document upload: {str(e)}")
-
-    def get_document(self, document_id: str) -> Dict[str, Any]:
-        """Get document details."""
-        try:
-            response = requests.get(
-                f"{self.base_url}/documents/{document_id}",
-                headers=self.headers,
-                timeout=10,
-            )
-            response.raise_for_status()
-            return {"status": "success", "data": response.json()}
-        except Exception as e:
-            raise Exception(f"Failed to get document: {str(e)}")
+            return {"status": "error", "message": str(e)}
 
-    # ==================== REACTIONS ====================
+    # ==================== IMAGE TOOLS ====================
 
-    def add_reaction(self, entity_urn: str, reaction_type: ReactionType) -> Dict[str, Any]:
+    @mcp.tool()
+    async def upload_linkedin_image(image_url: str) -> Dict[str, Any]:
         """
-        Add a reaction to a post or comment.
+        Upload an image to LinkedIn.
 
         Args:
-            entity_urn: URN of the entity to react to
-            reaction_type: Type of reaction (LIKE, PRAISE, etc.)
+            image_url: URL or file in LINKEDIN_UPLOAD_DIR of the image to upload
 
         Returns:
-            Dict with status
+            Dict with image URN for use in posts
         """
-        author_urn = self._get_person_urn()
-
-        try:
-            response = requests.post(
-                f"{self.base_url}/reactions",
-                headers=self.headers,
-                json={
-                    "actor": author_urn,
-                    "object": entity_urn,
-                    "reactionType": reaction_type.value,
-                },
-                timeout=15,
-            )
-            response.raise_for_status()
-
-            return {"status": "success", "message": f"Reaction {reaction_type.value} added"}
-        except Exception as e:
-            raise Exception(f"Failed to add reaction: {str(e)}")
-
-    def remove_reaction(self, reaction_id: str) -> Dict[str, Any]:
-        """Remove a reaction."""
-        try:
-            response = requests.delete(
-                f"{self.base_url}/reactions/{reaction_id}",
-                headers=self.headers,
-                timeout=15,
-            )
-            response.raise_for_status()
-
-            return {"status": "success", "message": "Reaction removed"}
-        except Exception as e:
-            raise Exception(f"Failed to remove reaction: {str(e)}")
-
-    def get_reactions(self, entity_urn: str) -> Dict[str, Any]:
-        """Get reactions for an entity."""
         try:
-            response = requests.get(
-                f"{self.base_url}/reactions",
-                headers=self.headers,
-                params={"q": "entity", "entity": entity_urn},
-                timeout=10,
-            )
-            response.raise_for_status()
-
-            return {"status": "success", "data": response.json()}
+            result = await client.upload_image(image_url)
+            return result
         except Exception as e:
-            raise Exception(f"Failed to get reactions: {str(e)}")
+            return {"status": "error", "message": str(e)}
 
-    # ==================== PROFILE & VALIDATION ====================
+    @mcp.tool()
+    async def get_linkedin_image(image_id: str) -> Dict[str, Any]:
+        """
+        Get LinkedIn image details.
 
-    def get_profile(self) -> Dict[str, Any]:
-        """Get authenticated user's profile (requires r_liteprofile permission)."""
-        try:
-            # Try /rest/me endpoint
-            response = requests.get(f"{self.base_url}/me", headers=self.headers, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                return {"status": "success", "profile": data}
-            elif response.status_code == 403:
-                # Token doesn't have profile read permission
-                return {
-                    "status": "limited",
-                    "message": "Profile access requires r_liteprofile permission. Your token has w_member_social (post creation) only.",
-                    "person_urn": self._person_urn or "Call validate_credentials first",
-                }
-            else:
-                response.raise_for_status()
-        except Exception as e:
-            logger.warning(f"Failed to get profile: {e}")
-            return {
-                "status": "limited",
-                "message": f"Profile access limited: {str(e)}",
-                "person_urn": self._person_urn or "Unknown",
-            }
+        Args:
+            image_id: Image ID or URN
 
-    def validate_credentials(self) -> bool:
-        """Validate API credentials by testing access."""
+        Returns:
+            Dict with image data
+        """
         try:
-            # Try to get person URN - this works with w_member_social
-            self._get_person_urn()
-            return True
+            result = await client.get_image(image_id)
+            return result
         except Exception as e:
-            logger.error(f"Credential validation failed: {e}")
-            return False
-
-    # ==================== POST READING (SCRAPING-BASED) ====================
+            return {"status": "error", "message": str(e)}
 
-    @staticmethod
-    def extract_post_id_from_url(url: str) -> Optional[str]:
+    @mcp.tool()
+    async def get_linkedin_images(image_ids: List[str]) -> Dict[str, Any]:
         """
-        Extract post/activity ID from LinkedIn post URL.
-        
-        Supports multiple URL formats:
-        - https://www.linkedin.com/posts/username_activity-7394701839126016000-3V9W
-        - https://www.linkedin.com/feed/update/urn:li:activity:7394701839126016000
-        - https://www.linkedin.com/posts/aemal_llm-ai-promptengineering-activity-7394335719143555072-ye8K
-        
+        Get details of many LinkedIn images in a few batch requests.
+
         Args:
-            url: LinkedIn post URL
-            
+            image_ids: Image IDs or URNs
+
         Returns:
-            Post/activity ID or None if not found
+            Dict with results and errors keyed by image URN
         """
-        import re
-        
-        # Remove URL parameters
-        url = url.split('?')[0]
-        
-        patterns = [
-            r'activity[:-](\d{19})',  # Most common: activity-7394701839126016000
-            r'share[:-](\d{19})',     # Share format
-            r'ugcPost[:-](\d{19})',   # UGC post format
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
-        
-        return None
-
-
-def register_post_tools(mcp: FastMCP) -> None:
-    """Register all LinkedIn API tools with the MCP server."""
-    access_token = os.getenv("LINKEDIN_ACCESS_TOKEN")
-
-    if not access_token:
-        logger.warning(
-            "LINKEDIN_ACCESS_TOKEN not found. API tools disabled. "
-            "Set LINKEDIN_ACCESS_TOKEN environment variable to enable."
-        )
-        return
-
-    client = LinkedInAPIClient(access_token)
-    logger.info("✓ LinkedIn API tools enabled")
+        try:
+            result = await client.get_images(image_ids)
+            return result
+        except Exception as e:
+            return {"status": "error", "message": str(e)}
 
-    # ==================== POST TOOLS ====================
+    # ==================== VIDEO TOOLS ====================
 
     @mcp.tool()
-    async def create_linkedin_post(
-        text: str, visibility: str = "PUBLIC", image_url: Optional[str] = None
-    ) -> Dict[str, Any]:
+    async def upload_linkedin_video(video_url: str) -> Dict[str, Any]:
         """
-        Create a LinkedIn post (text or with image).
+        Upload a video to LinkedIn.
+
+        Large videos are uploaded in parallel parts without being loaded into memory.
 
         Args:
-            text: Post content text
-            visibility: 'PUBLIC' or 'CONNECTIONS' (default: PUBLIC)
-            image_url: Optional image URL to include
+            video_url: URL or file in LINKEDIN_UPLOAD_DIR of the video to upload
 
         Returns:
-            Dict with post URN and status
+            Dict with video URN for use in posts
         """
         try:
-            vis = PostVisibility.PUBLIC if visibility.upper() != "CONNECTIONS" else PostVisibility.CONNECTIONS
-
-            media_urns = None
-            if image_url:
-                upload_result = client.upload_image(image_url)
-                media_urns = [upload_result["image_urn"]]
-
-            result = client.create_post(text, vis, media_urns)
-            return {"status": "success", "post_urn": result["post_urn"], "message": "Post created successfully"}
+            result = await client.upload_video(video_url)
+            return result
         except Exception as e:
-            logger.error(f"Error creating post: {e}")
             return {"status": "error", "message": str(e)}
 
     @mcp.tool()
-    async def update_linkedin_post(post_urn: str, text: str) -> Dict[str, Any]:
+    async def get_linkedin_videos(video_ids: List[str]) -> Dict[str, Any]:
         """
-        Update an existing LinkedIn post.
+        Get details of many LinkedIn videos in a few batch requests.
 
         Args:
-            post_urn: URN of the post to update (e.g., 'urn:li:share:123456')
-            text: New post content
+            video_ids: Video IDs or URNs
 
         Returns:
-            Dict with status
+            Dict with results and errors keyed by video URN
         """
         try:
-            result = client.update_post(post_urn, text)
+            result = await client.get_videos(video_ids)
             return result
         except Exception as e:
             return {"status": "error", "message": str(e)}
 
+    # ==================== DOCUMENT TOOLS ====================
+
     @mcp.tool()
-    async def delete_linkedin_post(post_urn: str) -> Dict[str, Any]:
+    async def upload_linkedin_document(document_url: str) -> Dict[str, Any]:
         """
-        Delete a LinkedIn post.
+        Upload a document (PDF, PPTX, DOCX) to LinkedIn and wait until it is processed.
 
         Args:
-            post_urn: URN of the post to delete
+            document_url: URL or file in LINKEDIN_UPLOAD_DIR of the document to upload
 
         Returns:
-            Dict with status
+            Dict with document URN for use in posts
         """
         try:
-            result = client.delete_post(post_urn)
+            result = await client.upload_document(document_url)
             return result
         except Exception as e:
             return {"status": "error", "message": str(e)}
 
-    # ==================== IMAGE TOOLS ====================
-
     @mcp.tool()
-    async def upload_linkedin_image(image_url: str) -> Dict[str, Any]:
+    async def create_linkedin_document_post(
+        text: str, document_url: str, title: str, visibility: str = "PUBLIC"
+    ) -> Dict[str, Any]:
         """
-        Upload an image to LinkedIn.
+        Create a LinkedIn post with a document (e.g. a PDF carousel).
 
         Args:
-            image_url: URL of the image to upload
+            text: Post content text
+            document_url: URL or file in LINKEDIN_UPLOAD_DIR of the document to attach
+            title: Document title shown on the post
+            visibility: 'PUBLIC' or 'CONNECTIONS' (default: PUBLIC)
 
         Returns:
-            Dict with image URN for use in posts
+            Dict with post URN and status
         """
         try:
-            result = client.upload_image(image_url)
-            return result
+            vis = PostVisibility.PUBLIC if visibility.upper() != "CONNECTIONS" else PostVisibility.CONNECTIONS
+
+            upload_result = await client.upload_document(document_url)
+            result = await client.create_post(
+                text, vis, [upload_result["document_urn"]], media_title=title
+            )
+            return {"status": "success", "post_urn": result["post_urn"], "message": "Post created successfully"}
         except Exception as e:
+            logger.error(f"Error creating document post: {e}")
             return {"status": "error", "message": str(e)}
 
     @mcp.tool()
-    async def get_linkedin_image(image_id: str) -> Dict[str, Any]:
+    async def get_linkedin_documents(document_ids: List[str]) -> Dict[str, Any]:
         """
-        Get LinkedIn image details.
+        Get details of many LinkedIn documents in a few batch requests.
 
         Args:
-            image_id: Image ID or URN
+            document_ids: Document IDs or URNs
 
         Returns:
-            Dict with image data
+            Dict with results and errors keyed by document URN
         """
         try:
-            result = client.get_image(image_id)
+            result = await client.get_documents(document_ids)
             return result
         except Exception as e:
             return {"status": "error", "message": str(e)}
@@ -685,7 +453,36 @@ def register_post_tools(mcp: FastMCP) -> None:
         """
         try:
             reaction = ReactionType[reaction_type.upper()]
-            result = client.add_reaction(entity_urn, reaction)
+            result = await client.add_reaction(entity_urn, reaction)
+            return result
+        except KeyError:
+            return {
+                "status": "error",
+                "message": f"Invalid reaction type. Use: {', '.join([r.name for r in ReactionType])}",
+            }
+        except Exception as e:
+            return {"status": "error", "message": str(e)}
+
+    @mcp.tool()
+    async def add_linkedin_reactions_bulk(
+        entity_urns: List[str], reaction_type: str = "LIKE"
+    ) -> Dict[str, Any]:
+        """
+        Add the same reaction to many LinkedIn posts in one call.
+
+        Reactions are sent concurrently (rate limited), and each post gets its own result.
+
+        Args:
+            entity_urns: URNs of the posts/comments to react to
+            reaction_type: LIKE, PRAISE, APPRECIATION, EMPATHY, INTEREST, or ENTERTAINMENT
+
+        Returns:
+            Dict with overall status (success, partial or error), counts and
+            per-URN results
+        """
+        try:
+            reaction = ReactionType[reaction_type.upper()]
+            result = await client.add_reactions(entity_urns, reaction)
             return result
         except KeyError:
             return {
@@ -707,25 +504,36 @@ def register_post_tools(mcp: FastMCP) -> None:
             Dict with status
         """
         try:
-            result = client.remove_reaction(reaction_id)
+            result = await client.remove_reaction(reaction_id)
             return result
         except Exception as e:
             return {"status": "error", "message": str(e)}
 
     @mcp.tool()
-    async def get_linkedin_reactions(entity_urn: str) -> Dict[str, Any]:
+    async def get_linkedin_reactions(
+        entity_urn: str, limit: Optional[int] = None
+    ) -> Dict[str, Any]:
         """
         Get reactions for a LinkedIn entity.
 
         Args:
             entity_urn: URN of the post/comment
+            limit: Maximum number of reactions to collect across all pages
+                (0 for all reactions; default: first page only)
 
         Returns:
             Dict with reactions data
         """
         try:
-            result = client.get_reactions(entity_urn)
-            return result
+            if limit is None:
+                result = await client.get_reactions(entity_urn)
+                return result
+
+            reactions = [
+                reaction
+                async for reaction in client.iter_reactions(entity_urn, limit=limit or None)
+            ]
+            return {"status": "success", "count": len(reactions), "reactions": reactions}
         except Exception as e:
             return {"status": "error", "message": str(e)}
 
@@ -740,7 +548,7 @@ def register_post_tools(mcp: FastMCP) -> None:
             Dict with profile data
         """
         try:
-            result = client.get_profile()
+            result = await client.get_profile()
             return result
         except Exception as e:
             return {"status": "error", "message": str(e)}
@@ -754,7 +562,7 @@ def register_post_tools(mcp: FastMCP) -> None:
             Dict with validation status
         """
         try:
-            is_valid = client.validate_credentials()
+            is_valid = await client.validate_credentials()
             if is_valid:
                 return {
                     "status": "success",
@@ -768,6 +576,17 @@ def register_post_tools(mcp: FastMCP) -> None:
         except Exception as e:
             return {"status": "error", "message": str(e)}
 
+    @mcp.tool()
+    async def get_linkedin_rate_limit_stats() -> Dict[str, Any]:
+        """
+        Get client-side rate limit statistics for LinkedIn API calls.
+
+        Returns:
+            Dict with the limit, available tokens and wait statistics per
+            endpoint family (posts, reactions, images, videos, documents, other)
+        """
+        return {"status": "success", "limits": client.rate_limiter.stats()}
+
     # ==================== POST READING TOOL ====================
 
     @mcp.tool()
@@ -783,7 +602,8 @@ def register_post_tools(mcp: FastMCP) -> None:
         - Images/media (if any)
         
         Works with both public posts and posts from your network.
-        Requires LINKEDIN_COOKIE environment variable for scraping.
+        Requires a LinkedIn cookie for scraping and reuses the pooled browser
+        sessions of the other scraping tools.
         
         Args:
             post_url: Full LinkedIn post URL
@@ -794,11 +614,9 @@ def register_post_tools(mcp: FastMCP) -> None:
         Returns:
             Dict with post details including content, author, reactions, etc.
         """
-        from linkedin_mcp_server.tools.person import scrape_linkedin_profile_url
-        
         try:
             # Extract post ID from URL
-            post_id = LinkedInAPIClient.extract_post_id_from_url(post_url)
+            post_id = AsyncLinkedInAPIClient.extract_post_id_from_url(post_url)
             
             if not post_id:
                 return {
@@ -807,158 +625,43 @@ def register_post_tools(mcp: FastMCP) -> None:
                     "example": "https://www.linkedin.com/posts/username_activity-7394701839126016000-abcd"
                 }
             
-            # Check if scraping is available
-            linkedin_cookie = os.getenv("LINKEDIN_COOKIE")
-            if not linkedin_cookie:
-                return {
-                    "status": "error",
-                    "message": "LINKEDIN_COOKIE environment variable required for reading posts",
-                    "note": "Set LINKEDIN_COOKIE=li_at=your_cookie_value in .env file",
-                    "extracted_post_id": post_id
-                }
-            
             # Use the existing scraping infrastructure
             try:
-                from linkedin_scraper import actions
-                from selenium import webdriver
-                from selenium.webdriver.common.by import By
-                from selenium.webdriver.support.ui import WebDriverWait
-                from selenium.webdriver.support import expected_conditions as EC
-                import time
-                
-                # Setup Chrome driver
-                options = webdriver.ChromeOptions()
-                options.add_argument('--headless')
-                options.add_argument('--no-sandbox')
-                options.add_argument('--disable-dev-shm-usage')
-                options.add_argument('--disable-blink-features=AutomationControlled')
-                options.add_experimental_option("excludeSwitches", ["enable-automation"])
-                options.add_experimental_option('useAutomationExtension', False)
-                
-                driver = webdriver.Chrome(options=options)
-                
-                try:
-                    # Login with cookie
-                    driver.get("https://www.linkedin.com")
-                    driver.add_cookie({
-                        'name': 'li_at',
-                        'value': linkedin_cookie.replace('li_at=', ''),
-                        'domain': '.linkedin.com'
-                    })
-                    
-                    # Navigate to post
-                    clean_url = post_url.split('?')[0]  # Remove URL parameters
-                    driver.get(clean_url)
-                    time.sleep(3)  # Wait for page load
-                    
-                    # Extract post data
-                    post_data = {
-                        "status": "success",
-                        "post_id": post_id,
-                        "url": clean_url,
-                        "data": {}
-                    }
-                    
-                    try:
-                        # Author name
-                        author_elem = driver.find_element(By.CSS_SELECTOR, ".update-components-actor__name, .feed-shared-actor__name")
-                        post_data["data"]["author"] = author_elem.text
-                    except:
-                        post_data["data"]["author"] = "Unknown"
-                    
-                    try:
-                        # Author title/headline
-                        title_elem = driver.find_element(By.CSS_SELECTOR, ".update-components-actor__description, .feed-shared-actor__description")
-                        post_data["data"]["author_title"] = title_elem.text
-                    except:
-                        post_data["data"]["author_title"] = ""
-                    
-                    try:
-                        # Post content/text
-                        content_elem = driver.find_element(By.CSS_SELECTOR, ".feed-shared-update-v2__description, .feed-shared-text, .break-words")
-                        post_data["data"]["content"] = content_elem.text
-                    except:
-                        try:
-                            # Alternative selector
-                            content_elem = driver.find_element(By.CSS_SELECTOR, "[dir='ltr'] .break-words")
-                            post_data["data"]["content"] = content_elem.text
-                        except:
-                            post_data["data"]["content"] = ""
-                    
-                    try:
-                        # Posted date/time
-                        date_elem = driver.find_element(By.CSS_SELECTOR, ".update-components-actor__sub-description, .feed-shared-actor__sub-description")
-                        post_data["data"]["posted_date"] = date_elem.text.split('•')[0].strip()
-                    except:
-                        post_data["data"]["posted_date"] = "Unknown"
-                    
-                    try:
-                        # Reaction count
-                        reactions_elem = driver.find_element(By.CSS_SELECTOR, ".social-details-social-counts__reactions-count, [aria-label*='reaction']")
-                        post_data["data"]["reactions"] = reactions_elem.text
-                    except:
-                        post_data["data"]["reactions"] = "0"
-                    
-                    try:
-                        # Comments count
-                        comments_elem = driver.find_element(By.CSS_SELECTOR, ".social-details-social-counts__comments, [aria-label*='comment']")
-                        comments_text = comments_elem.text
-                        post_data["data"]["comments"] = comments_text.split()[0] if comments_text else "0"
-                    except:
-                        post_data["data"]["comments"] = "0"
-                    
-                    try:
-                        # Reposts count
-                        reposts_elem = driver.find_element(By.CSS_SELECTOR, "[aria-label*='repost']")
-                        reposts_text = reposts_elem.text
-                        post_data["data"]["reposts"] = reposts_text.split()[0] if reposts_text else "0"
-                    except:
-                        post_data["data"]["reposts"] = "0"
-                    
-                    try:
-                        # Extract images
-                        image_elems = driver.find_elements(By.CSS_SELECTOR, ".feed-shared-image__container img, .feed-shared-image img")
-                        images = []
-                        for img in image_elems:
-                            src = img.get_attribute("src")
-                            if src and 'media.licdn.com' in src:
-                                images.append(src)
-                        post_data["data"]["images"] = images[:5]  # Limit to 5 images
-                    except:
-                        post_data["data"]["images"] = []
-                    
-                    try:
-                        # Extract video if present
-                        video_elem = driver.find_element(By.CSS_SELECTOR, "video")
-                        post_data["data"]["has_video"] = True
-                    except:
-                        post_data["data"]["has_video"] = False
-                    
-                    try:
-                        # Extract document/article if present
-                        article_elem = driver.find_element(By.CSS_SELECTOR, ".feed-shared-article, .feed-shared-external-article")
-                        article_title = article_elem.find_element(By.CSS_SELECTOR, ".feed-shared-article__title").text
-                        post_data["data"]["article_title"] = article_title
-                    except:
-                        post_data["data"]["article_title"] = None
-                    
-                    return post_data
-                    
-                finally:
-                    driver.quit()
-                    
+                from linkedin_mcp_server.cache import (
+                    cache_key,
+                    get_scrape_cache,
+                    guard_not_found,
+                    scrape_flights,
+                )
+                from linkedin_mcp_server.config import get_config
+                from linkedin_mcp_server.drivers.executor import run_in_driver_thread
+
+                return await guard_not_found(
+                    get_scrape_cache(),
+                    cache_key("post", post_id),
+                    lambda: scrape_flights.do(
+                        cache_key("read_linkedin_post", post_id),
+                        run_in_driver_thread,
+                        scrape_linkedin_post,
+                        post_url,
+                        post_id,
+                    ),
+                    get_config().cache.not_found_ttl,
+                )
             except ImportError:
                 return {
                     "status": "error",
                     "message": "linkedin-scraper not installed. Install with: pip install linkedin-scraper",
                     "note": "Selenium and ChromeDriver are also required"
                 }
-                
+
         except Exception as e:
-            logger.error(f"Failed to read post: {str(e)}")
+            # Same error codes as the other scraping tools (entity_not_found,
+            # authentication_not_found, scraper_busy, driver_pool_exhausted, ...)
+            from linkedin_mcp_server.error_handler import handle_tool_error
+
             return {
                 "status": "error",
-                "message": f"Failed to read post: {str(e)}",
+                **handle_tool_error(e, "read_linkedin_post"),
                 "url": post_url
             }
-
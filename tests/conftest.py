@@ -10,6 +10,14 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+@pytest.fixture(autouse=True)
+def isolated_data_dir(tmp_path, monkeypatch):
+    """Keep persistent server state (caches) out of the user's data directory."""
+    data_dir = tmp_path / "data"
+    monkeypatch.setenv("LINKEDIN_MCP_DATA_DIR", str(data_dir))
+    return data_dir
+
+
 @pytest.fixture(scope="session")
 def linkedin_cookie():
     """Get LinkedIn session cookie from environment."""
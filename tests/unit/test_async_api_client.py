@@ -0,0 +1,573 @@
+"""
+Unit tests for the async LinkedIn API client.
+
+Requests are served by httpx.MockTransport, so no network access is needed.
+"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from linkedin_mcp_server.api import (
+    AsyncLinkedInAPIClient,
+    LinkedInAPIClient,
+    RateLimiter,
+    ReactionType,
+    RetryPolicy,
+)
+from linkedin_mcp_server.api.common import next_page_start
+
+
+def make_client(handler):
+    """Create a client whose HTTP calls are answered by handler."""
+    client = AsyncLinkedInAPIClient(
+        "test-token",
+        base_url="https://api.test/rest",
+        rate_limiter=RateLimiter(),
+        retry_policy=RetryPolicy(base_delay=0.001),
+    )
+    client.http = httpx.AsyncClient(
+        headers=client.headers,
+        event_hooks=client.http.event_hooks,
+        transport=httpx.MockTransport(handler),
+    )
+    return client
+
+
+class TestAsyncAPIClient:
+    """Tests for AsyncLinkedInAPIClient."""
+
+    @pytest.mark.asyncio
+    async def test_headers_bound_on_client(self):
+        """Test that auth and version headers are sent with every request."""
+        seen = []
+
+        def handler(request):
+            seen.append(request.headers)
+            return httpx.Response(200, json={"elements": []})
+
+        async with make_client(handler) as client:
+            result = await client.get_reactions("urn:li:share:1")
+
+        assert result["status"] == "success"
+        assert seen[0]["Authorization"] == "Bearer test-token"
+        assert seen[0]["X-Restli-Protocol-Version"] == "2.0.0"
+        print("✅ Headers bound once on the client")
+
+    @pytest.mark.asyncio
+    async def test_person_urn_looked_up_once(self):
+        """Test that concurrent calls share one person URN lookup."""
+        lookups = 0
+
+        def handler(request):
+            nonlocal lookups
+            if request.url.path == "/v2/userinfo":
+                lookups += 1
+                return httpx.Response(200, json={"sub": "abc"})
+            return httpx.Response(201, json={})
+
+        async with make_client(handler) as client:
+            await asyncio.gather(
+                *(
+                    client.add_reaction(f"urn:li:share:{i}", ReactionType.LIKE)
+                    for i in range(5)
+                )
+            )
+
+        assert lookups == 1
+        print("✅ Person URN fetched once")
+
+    @pytest.mark.asyncio
+    async def test_http_errors_are_wrapped(self):
+        """Test that HTTP errors surface as descriptive exceptions."""
+
+        def handler(request):
+            return httpx.Response(500, json={"message": "boom"})
+
+        async with make_client(handler) as client:
+            with pytest.raises(Exception, match="Failed to get image"):
+                await client.get_image("123")
+        print("✅ HTTP errors wrapped")
+
+    @pytest.mark.asyncio
+    async def test_idempotent_calls_retried(self):
+        """Test that GETs retry transient errors, honoring Retry-After."""
+        attempts = []
+
+        def handler(request):
+            attempts.append(request.method)
+            if request.method == "GET" and len(attempts) == 1:
+                return httpx.Response(429, headers={"Retry-After": "0"})
+            if request.method == "GET" and len(attempts) == 2:
+                raise httpx.ConnectError("reset", request=request)
+            if request.method == "GET":
+                return httpx.Response(200, json={"id": "123"})
+            return httpx.Response(503)
+
+        async with make_client(handler) as client:
+            result = await client.get_image("123")
+            assert result["data"] == {"id": "123"}
+            assert attempts == ["GET"] * 3
+
+            # Creating a post is not idempotent, so it is never re-sent
+            attempts.clear()
+            client._person_urn = "urn:li:person:abc"
+            with pytest.raises(Exception, match="Failed to create post"):
+                await client.create_post("Hello")
+            assert attempts == ["POST"]
+        print("✅ Idempotent calls retried, POST sent once")
+
+    @pytest.mark.asyncio
+    async def test_person_urn_persisted_across_clients(self):
+        """Test that a new client reuses the URN until the token is rejected."""
+        lookups = 0
+        token_valid = True
+
+        def handler(request):
+            nonlocal lookups
+            if request.url.path == "/v2/userinfo":
+                lookups += 1
+                return httpx.Response(200, json={"sub": "abc"})
+            return httpx.Response(201 if token_valid else 401, json={})
+
+        async with make_client(handler) as client:
+            await client.add_reaction("urn:li:share:1", ReactionType.LIKE)
+
+        # Cold start of another worker with the same token
+        async with make_client(handler) as client:
+            await client.add_reaction("urn:li:share:2", ReactionType.LIKE)
+            assert lookups == 1
+
+            token_valid = False
+            with pytest.raises(Exception):
+                await client.add_reaction("urn:li:share:3", ReactionType.LIKE)
+            assert client._person_urn is None
+
+        assert client.urn_cache.get("test-token") is None
+        print("✅ Person URN persisted and invalidated on 401")
+
+    @pytest.mark.asyncio
+    async def test_validate_credentials_asks_the_api(self):
+        """Test that validation ignores a cached URN and detects a revoked token."""
+        calls = []
+
+        def handler(request):
+            calls.append(request.url.path)
+            return httpx.Response(401, json={})
+
+        async with make_client(handler) as client:
+            client.urn_cache.set("test-token", "urn:li:person:abc")
+            assert not await client.validate_credentials()
+            assert calls
+            assert client.urn_cache.get("test-token") is None
+        print("✅ Revoked token reported invalid despite a cached URN")
+
+    @pytest.mark.asyncio
+    async def test_upload_image_streams_local_file(self, tmp_path, monkeypatch):
+        """Test that a local image is streamed with a fixed Content-Length."""
+        monkeypatch.setattr("linkedin_mcp_server.api.uploads.UPLOAD_DIR", str(tmp_path))
+        image = tmp_path / "image.png"
+        image.write_bytes(b"x" * 2500)
+        uploads = []
+
+        def handler(request):
+            if request.url.path == "/v2/userinfo":
+                return httpx.Response(200, json={"sub": "abc"})
+            if request.url.path == "/rest/images":
+                return httpx.Response(
+                    200,
+                    json={
+                        "value": {
+                            "uploadUrl": "https://upload.test/img",
+                            "image": "urn:li:image:1",
+                        }
+                    },
+                )
+            uploads.append(request)
+            return httpx.Response(201)
+
+        async with make_client(handler) as client:
+            client.upload_http = httpx.AsyncClient(
+                transport=httpx.MockTransport(handler)
+            )
+            result = await client.upload_image(str(image))
+
+        assert result == {"image_urn": "urn:li:image:1", "status": "success"}
+        assert uploads[0].headers["Content-Length"] == "2500"
+        assert "Transfer-Encoding" not in uploads[0].headers
+        assert uploads[0].read() == b"x" * 2500
+        print("✅ Local image streamed from a memory map")
+
+    @pytest.mark.asyncio
+    async def test_upload_video_parts(self, tmp_path, monkeypatch):
+        """Test that video parts upload concurrently, retry and finalize in order."""
+        monkeypatch.setattr("linkedin_mcp_server.api.uploads.UPLOAD_DIR", str(tmp_path))
+        monkeypatch.setattr("linkedin_mcp_server.api.uploads.PART_RETRY_BACKOFF", 0)
+        video = tmp_path / "video.mp4"
+        video.write_bytes(b"a" * 4 + b"b" * 4 + b"c" * 2)
+        instructions = [
+            {
+                "uploadUrl": f"https://upload.test/{n}",
+                "firstByte": first,
+                "lastByte": last,
+            }
+            for n, first, last in [(2, 8, 9), (0, 0, 3), (1, 4, 7)]
+        ]
+        bodies = {}
+        failures = {"1": 1}
+        finalized = []
+
+        def handler(request):
+            if request.url.path == "/v2/userinfo":
+                return httpx.Response(200, json={"sub": "abc"})
+            if request.url.params.get("action") == "initializeUpload":
+                return httpx.Response(
+                    200,
+                    json={
+                        "value": {
+                            "uploadInstructions": instructions,
+                            "uploadToken": "token",
+                            "video": "urn:li:video:1",
+                        }
+                    },
+                )
+            if request.url.params.get("action") == "finalizeUpload":
+                finalized.append(json.loads(request.content))
+                return httpx.Response(200, json={})
+            part = request.url.path.strip("/")
+            if failures.get(part):
+                failures[part] -= 1
+                return httpx.Response(503)
+            bodies[part] = request.read()
+            return httpx.Response(200, headers={"ETag": f"etag-{part}"})
+
+        async with make_client(handler) as client:
+            client.upload_http = httpx.AsyncClient(
+                transport=httpx.MockTransport(handler)
+            )
+            result = await client.upload_video(str(video), workers=2)
+
+        assert result["video_urn"] == "urn:li:video:1"
+        assert bodies == {"0": b"aaaa", "1": b"bbbb", "2": b"cc"}
+        request = finalized[0]["finalizeUploadRequest"]
+        assert request["uploadedPartIds"] == ["etag-0", "etag-1", "etag-2"]
+        assert request["uploadToken"] == "token"
+        print("✅ Video parts uploaded, retried and finalized in order")
+
+    @pytest.mark.asyncio
+    async def test_upload_parts_reads_no_further_than_workers(self):
+        """Test that part bodies are read only once an upload slot is free."""
+        read = []
+        in_flight = []
+        release = asyncio.Event()
+
+        async def bodies():
+            for n in range(4):
+                read.append(n)
+                yield b"x"
+
+        async def upload_part(part, body):
+            in_flight.append(part)
+            await release.wait()
+            return f"etag-{part}"
+
+        async with make_client(lambda request: httpx.Response(200)) as client:
+            client._upload_part = upload_part
+            task = asyncio.create_task(
+                client._upload_parts([0, 1, 2, 3], bodies(), workers=2)
+            )
+            for _ in range(10):
+                await asyncio.sleep(0)
+            assert read == [0, 1]
+            assert in_flight == [0, 1]
+            release.set()
+            etags = await task
+
+        assert etags == ["etag-0", "etag-1", "etag-2", "etag-3"]
+        print("✅ Part bodies held in memory bounded by workers")
+
+    @pytest.mark.asyncio
+    async def test_multi_image_post(self):
+        """Test that several images upload concurrently into a multiImage post."""
+        in_flight = peak = 0
+        posts = []
+
+        async def handler(request):
+            nonlocal in_flight, peak
+            if request.url.path == "/v2/userinfo":
+                return httpx.Response(200, json={"sub": "abc"})
+            if request.url.path == "/rest/images":
+                n = len(posts)
+                posts.append(None)
+                return httpx.Response(
+                    200,
+                    json={
+                        "value": {
+                            "uploadUrl": f"https://upload.test/{n}",
+                            "image": f"urn:li:image:{n}",
+                        }
+                    },
+                )
+            if request.url.path == "/rest/posts":
+                posts.append(json.loads(request.content))
+                return httpx.Response(201, json={"id": "urn:li:share:1"})
+            if request.url.host == "upload.test":
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+                return httpx.Response(201)
+            return httpx.Response(200, content=request.url.path.encode())
+
+        async with make_client(handler) as client:
+            client.upload_http = httpx.AsyncClient(
+                transport=httpx.MockTransport(handler)
+            )
+            uploaded = await client.upload_images(
+                [f"https://img.test/{i}.png" for i in range(4)], workers=2
+            )
+            await client.create_post("Album", media_urns=uploaded["image_urns"])
+
+        assert sorted(uploaded["image_urns"]) == [f"urn:li:image:{i}" for i in range(4)]
+        assert peak == 2
+        images = posts[-1]["content"]["multiImage"]["images"]
+        assert [i["id"] for i in images] == uploaded["image_urns"]
+        print("✅ Images uploaded concurrently into a multiImage post")
+
+    @pytest.mark.asyncio
+    async def test_upload_document_waits_until_available(self, tmp_path, monkeypatch):
+        """Test that a document is streamed and polled until AVAILABLE."""
+        monkeypatch.setattr("linkedin_mcp_server.api.uploads.UPLOAD_DIR", str(tmp_path))
+        monkeypatch.setattr("linkedin_mcp_server.api.uploads.POLL_INITIAL_DELAY", 0.001)
+        document = tmp_path / "deck.pdf"
+        document.write_bytes(b"%PDF" * 100)
+        statuses = iter(["WAITING_UPLOAD", "PROCESSING", "AVAILABLE"])
+        polls = 0
+
+        def handler(request):
+            nonlocal polls
+            if request.url.path == "/v2/userinfo":
+                return httpx.Response(200, json={"sub": "abc"})
+            if request.url.path == "/rest/documents":
+                return httpx.Response(
+                    200,
+                    json={
+                        "value": {
+                            "uploadUrl": "https://upload.test/doc",
+                            "document": "urn:li:document:1",
+                        }
+                    },
+                )
+            if request.url.path.startswith("/rest/documents/"):
+                polls += 1
+                return httpx.Response(200, json={"status": next(statuses)})
+            assert request.read() == b"%PDF" * 100
+            return httpx.Response(201)
+
+        async with make_client(handler) as client:
+            client.upload_http = httpx.AsyncClient(
+                transport=httpx.MockTransport(handler)
+            )
+            result = await client.upload_document(str(document), timeout=5)
+
+        assert result == {"document_urn": "urn:li:document:1", "status": "success"}
+        assert polls == 3
+        print("✅ Document streamed and polled until available")
+
+    @pytest.mark.asyncio
+    async def test_iter_reactions_walks_pages(self):
+        """Test that reactions are streamed across pages up to a limit."""
+        reactions = [{"id": f"r{i}"} for i in range(7)]
+        requested = []
+
+        def handler(request):
+            start = int(request.url.params.get("start", 0))
+            count = int(request.url.params["count"])
+            requested.append(start)
+            return httpx.Response(
+                200,
+                json={
+                    "elements": reactions[start : start + count],
+                    "paging": {"start": start, "count": count, "total": len(reactions)},
+                },
+            )
+
+        async with make_client(handler) as client:
+            everything = [
+                r async for r in client.iter_reactions("urn:li:share:1", page_size=3)
+            ]
+            assert everything == reactions
+            assert requested == [0, 3, 6]
+
+            requested.clear()
+            limited = [
+                r
+                async for r in client.iter_reactions(
+                    "urn:li:share:1", page_size=3, limit=4, prefetch=False
+                )
+            ]
+            assert limited == reactions[:4]
+            assert requested == [0, 3]
+        print("✅ Reactions streamed across pages")
+
+    def test_next_page_start_prefers_total(self):
+        """Test that paging.total decides the last page when present."""
+        short = {"elements": [{}] * 2, "paging": {"total": 10}}
+        assert next_page_start(short, 0, 3) == 2
+        assert (
+            next_page_start({"elements": [{}] * 3, "paging": {"total": 3}}, 0, 3)
+            is None
+        )
+        assert next_page_start({"elements": [], "paging": {"total": 10}}, 2, 3) is None
+
+        assert next_page_start({"elements": [{}] * 3}, 0, 3) == 3
+        assert next_page_start({"elements": [{}] * 2}, 3, 3) is None
+        print("✅ Next page found from the total or a short page")
+
+    @pytest.mark.asyncio
+    async def test_batch_get_images_chunked(self, monkeypatch):
+        """Test that many image lookups become a few BATCH_GET requests."""
+        monkeypatch.setattr("linkedin_mcp_server.api.common.BATCH_MAX_URL_LENGTH", 300)
+        requested = []
+
+        def handler(request):
+            requested.append(request.url)
+            ids = str(request.url).split("ids=List(")[1].rstrip(")").split(",")
+            urns = [i.replace("%3A", ":") for i in ids]
+            return httpx.Response(
+                200, json={"results": {urn: {"status": "AVAILABLE"} for urn in urns}}
+            )
+
+        image_ids = [f"C4E10AQ{i:06d}" for i in range(40)]
+        async with make_client(handler) as client:
+            result = await client.get_images(image_ids)
+
+        assert set(result["results"]) == {f"urn:li:image:{i}" for i in image_ids}
+        assert 1 < len(requested) < 10
+        assert all(len(str(url)) <= 300 for url in requested)
+        print("✅ Image lookups batched into chunked BATCH_GET requests")
+
+    @pytest.mark.asyncio
+    async def test_bulk_reactions_report_per_urn(self):
+        """Test that bulk reactions run concurrently and report each URN."""
+        in_flight = peak = 0
+
+        async def handler(request):
+            nonlocal in_flight, peak
+            if request.url.path == "/v2/userinfo":
+                return httpx.Response(200, json={"sub": "abc"})
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            failed = json.loads(request.content)["object"].endswith(":3")
+            return httpx.Response(403 if failed else 201, json={})
+
+        urns = [f"urn:li:share:{i}" for i in range(6)]
+        async with make_client(handler) as client:
+            result = await client.add_reactions(urns, ReactionType.PRAISE, workers=3)
+
+        assert result["status"] == "partial"
+        assert (result["succeeded"], result["failed"]) == (5, 1)
+        assert [r["entity_urn"] for r in result["results"]] == urns
+        assert result["results"][3]["status"] == "error"
+        assert peak == 3
+        print("✅ Bulk reactions capped and reported per URN")
+
+    @pytest.mark.asyncio
+    async def test_identical_images_reuse_cached_urn(self, tmp_path, monkeypatch):
+        """Test that re-uploading the same bytes reuses the verified image URN."""
+        monkeypatch.setattr("linkedin_mcp_server.api.uploads.UPLOAD_DIR", str(tmp_path))
+        first = tmp_path / "logo.png"
+        copy = tmp_path / "logo-copy.png"
+        first.write_bytes(b"logo" * 100)
+        copy.write_bytes(b"logo" * 100)
+        initialized = 0
+        image_status = "AVAILABLE"
+
+        def handler(request):
+            nonlocal initialized
+            if request.url.path == "/v2/userinfo":
+                return httpx.Response(200, json={"sub": "abc"})
+            if request.url.path == "/rest/images":
+                initialized += 1
+                return httpx.Response(
+                    200,
+                    json={
+                        "value": {
+                            "uploadUrl": "https://upload.test/img",
+                            "image": f"urn:li:image:{initialized}",
+                        }
+                    },
+                )
+            if request.url.path.startswith("/rest/images/"):
+                if image_status is None:
+                    return httpx.Response(404, json={})
+                return httpx.Response(200, json={"status": image_status})
+            return httpx.Response(201)
+
+        async with make_client(handler) as client:
+            client.upload_http = httpx.AsyncClient(
+                transport=httpx.MockTransport(handler)
+            )
+            uploaded = await client.upload_image(str(first))
+            reused = await client.upload_image(str(copy))
+            assert reused == {
+                "image_urn": uploaded["image_urn"],
+                "status": "success",
+                "cached": True,
+            }
+            assert initialized == 1
+
+            # A deleted image is uploaded again and the cache updated
+            image_status = None
+            replaced = await client.upload_image(str(first))
+            assert replaced["image_urn"] == "urn:li:image:2"
+            assert initialized == 2
+        print("✅ Identical images deduplicated by content hash")
+
+
+class TestSyncClient:
+    """Tests for the deprecated LinkedInAPIClient facade."""
+
+    def test_calls_run_on_the_async_client(self):
+        """Test that sync calls and iterators are served by the async client."""
+        reactions = [{"id": f"r{i}"} for i in range(3)]
+
+        def handler(request):
+            if request.url.path == "/v2/userinfo":
+                return httpx.Response(200, json={"sub": "abc"})
+            if request.url.path == "/rest/posts":
+                return httpx.Response(201, json={"id": "urn:li:share:1"})
+            start = int(request.url.params.get("start", 0))
+            count = int(request.url.params["count"])
+            return httpx.Response(
+                200,
+                json={
+                    "elements": reactions[start : start + count],
+                    "paging": {"total": len(reactions)},
+                },
+            )
+
+        with pytest.warns(DeprecationWarning):
+            client = LinkedInAPIClient(
+                "test-token",
+                base_url="https://api.test/rest",
+                rate_limiter=RateLimiter(),
+                retry_policy=RetryPolicy(base_delay=0.001),
+            )
+        client._client.http = make_client(handler).http
+
+        async def from_running_loop():
+            return client.create_post("hello")
+
+        with client:
+            assert client.create_post("hello")["post_urn"] == "urn:li:share:1"
+            assert (
+                list(client.iter_reactions("urn:li:share:1", page_size=2)) == reactions
+            )
+            assert asyncio.run(from_running_loop())["post_urn"] == "urn:li:share:1"
+            assert client.access_token == "test-token"
+        print("✅ Sync client delegates to the async client")
@@ -0,0 +1,65 @@
+"""
+Unit tests for the driver executor.
+
+These tests verify that blocking driver work runs off the event loop and that
+the wait queue is bounded, without starting a browser.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from linkedin_mcp_server.drivers.executor import DriverExecutor
+from linkedin_mcp_server.exceptions import ScraperQueueFullError
+
+
+class TestDriverExecutor:
+    """Tests for DriverExecutor."""
+
+    @pytest.mark.asyncio
+    async def test_runs_on_worker_thread(self):
+        """Test that work runs on a dedicated thread."""
+        executor = DriverExecutor(queue_depth=1)
+        try:
+            thread_name = await executor.run(lambda: threading.current_thread().name)
+            assert thread_name.startswith("linkedin-driver")
+            print("✅ Driver work runs on worker thread")
+        finally:
+            executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_event_loop_stays_responsive(self):
+        """Test that the event loop keeps serving while a job blocks."""
+        executor = DriverExecutor(queue_depth=1)
+        try:
+            task = asyncio.create_task(executor.run(time.sleep, 0.3))
+            started = time.monotonic()
+            await asyncio.sleep(0.01)
+            assert time.monotonic() - started < 0.2
+            await task
+            print("✅ Event loop responsive during blocking work")
+        finally:
+            executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_queue_depth_is_bounded(self):
+        """Test that jobs beyond the queue depth are rejected."""
+        executor = DriverExecutor(queue_depth=1)
+        release = threading.Event()
+        try:
+            running = asyncio.create_task(executor.run(release.wait))
+            waiting = asyncio.create_task(executor.run(release.wait))
+            await asyncio.sleep(0.05)
+
+            with pytest.raises(ScraperQueueFullError):
+                executor.submit(release.wait)
+
+            release.set()
+            await asyncio.gather(running, waiting)
+            assert executor.pending == 0
+            print("✅ Queue depth enforced")
+        finally:
+            release.set()
+            executor.shutdown()
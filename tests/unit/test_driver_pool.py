@@ -0,0 +1,132 @@
+"""
+Unit tests for the Chrome driver pool.
+
+These tests replace driver creation with lightweight fakes so checkout/checkin
+semantics can be verified without launching a browser.
+"""
+
+import threading
+import types
+
+import pytest
+
+# Skip all tests if linkedin_scraper is not installed
+pytest.importorskip("linkedin_scraper", reason="linkedin_scraper not installed")
+
+import linkedin_scraper  # noqa: E402
+
+from linkedin_mcp_server import config  # noqa: E402
+from linkedin_mcp_server.drivers import chrome  # noqa: E402
+from linkedin_mcp_server.exceptions import DriverPoolTimeoutError  # noqa: E402
+
+
+class FakeDriver:
+    """Minimal stand-in for webdriver.Chrome."""
+
+    def __init__(self):
+        self.quit_called = False
+
+    def quit(self):
+        self.quit_called = True
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    """Driver pool that creates fake drivers."""
+    pool = chrome.DriverPool("li_at=test", min_size=1, max_size=2, checkout_timeout=0.2)
+    monkeypatch.setattr(pool, "_create_driver", FakeDriver)
+    yield pool
+    pool.close()
+
+
+class TestDriverPool:
+    """Tests for DriverPool."""
+
+    def test_checkout_reuses_idle_driver(self, pool):
+        """Test that a checked-in driver is handed out again."""
+        driver = pool.checkout()
+        pool.checkin(driver)
+        assert pool.checkout() is driver
+        assert pool.size == 1
+        print("✅ Idle driver reused")
+
+    def test_concurrent_checkouts_get_distinct_drivers(self, pool):
+        """Test that concurrent callers never share a driver."""
+        first = pool.checkout()
+        second = pool.checkout()
+        assert first is not second
+        assert pool.size == 2
+        print("✅ Distinct drivers per checkout")
+
+    def test_checkout_times_out_when_exhausted(self, pool):
+        """Test that checkout waits, then fails, when the pool is full."""
+        pool.checkout()
+        pool.checkout()
+        with pytest.raises(DriverPoolTimeoutError):
+            pool.checkout()
+        print("✅ Exhausted pool times out")
+
+    def test_checkin_wakes_waiting_caller(self, pool):
+        """Test that a waiting caller gets the next checked-in driver."""
+        first = pool.checkout()
+        pool.checkout()
+        threading.Timer(0.05, pool.checkin, args=(first,)).start()
+        assert pool.checkout(timeout=1) is first
+        print("✅ Waiting caller woken on checkin")
+
+    def test_discard_quits_driver(self, pool):
+        """Test that discarded drivers are quit and free their slot."""
+        driver = pool.checkout()
+        pool.checkin(driver, discard=True)
+        assert driver.quit_called
+        assert pool.size == 0
+        print("✅ Discarded driver quit")
+
+    def test_warm_creates_min_size(self, pool):
+        """Test that warm() pre-creates min_size drivers."""
+        pool.warm()
+        assert pool.size == 1
+        assert pool.idle_count == 1
+        print("✅ Pool warmed")
+
+
+class InvalidCredentialsError(Exception):
+    """Stand-in for the linkedin-scraper error of the same name."""
+
+
+class RedirectingDriver:
+    """Driver whose URL stays on the login page before reaching the feed."""
+
+    def __init__(self, login_reads):
+        self.login_reads = login_reads
+
+    @property
+    def current_url(self):
+        if self.login_reads > 0:
+            self.login_reads -= 1
+            return "https://www.linkedin.com/login"
+        return "https://www.linkedin.com/feed/"
+
+    def set_page_load_timeout(self, seconds):
+        pass
+
+
+class TestCookieLogin:
+    """Tests for login_with_cookie."""
+
+    def test_misreported_failure_waits_for_feed(self, monkeypatch):
+        """Test that a reported failure still waits for a late feed redirect."""
+        monkeypatch.setattr(config, "_config", config.AppConfig())
+
+        def login(driver, cookie):
+            raise InvalidCredentialsError("Cookie login failed")
+
+        monkeypatch.setattr(
+            linkedin_scraper,
+            "actions",
+            types.SimpleNamespace(login=login),
+            raising=False,
+        )
+
+        assert chrome.login_with_cookie(RedirectingDriver(login_reads=3), "li_at=x")
+        print("✅ Late redirect after a misreported failure accepted")
@@ -0,0 +1,204 @@
+"""
+Unit tests for single-round-trip post extraction.
+
+These tests drive the extraction with a fake WebDriver so no browser is needed.
+"""
+
+import pytest
+
+pytest.importorskip("selenium", reason="selenium not installed")
+
+from selenium.common.exceptions import (  # noqa: E402
+    JavascriptException,
+    NoSuchElementException,
+)
+
+from linkedin_mcp_server import config  # noqa: E402
+from linkedin_mcp_server.drivers.extraction import (  # noqa: E402
+    extract_post_data,
+    normalize_post_snapshot,
+)
+from linkedin_mcp_server.drivers.waits import (  # noqa: E402
+    page_unavailable_reason,
+    raise_if_unavailable,
+)
+from linkedin_mcp_server.exceptions import (  # noqa: E402
+    DriverPoolTimeoutError,
+    EntityNotFoundError,
+    ScraperQueueFullError,
+)
+
+
+@pytest.fixture(autouse=True)
+def default_config(monkeypatch):
+    """Use default configuration instead of parsing pytest's command line."""
+    monkeypatch.setattr(config, "_config", config.AppConfig())
+
+
+class FakeDriver:
+    """WebDriver stand-in that records execute_script calls."""
+
+    def __init__(self, snapshot=None, script_error=False):
+        self.snapshot = snapshot
+        self.script_error = script_error
+        self.script_calls = 0
+        self.implicit_waits = []
+
+    def implicitly_wait(self, seconds):
+        self.implicit_waits.append(seconds)
+
+    def execute_script(self, script, *args):
+        self.script_calls += 1
+        if self.script_error:
+            raise JavascriptException("blocked")
+        return self.snapshot
+
+    def find_element(self, by, selector):
+        raise NoSuchElementException(selector)
+
+    def find_elements(self, by, selector):
+        return []
+
+
+class TestPostSnapshot:
+    """Tests for post snapshot normalization."""
+
+    def test_full_snapshot(self):
+        """Test that a complete snapshot maps onto the tool output."""
+        data = normalize_post_snapshot(
+            {
+                "author": "Ada Lovelace",
+                "author_title": "Mathematician",
+                "content": "Hello world",
+                "posted_date": "2d • Edited",
+                "reactions": "1,234",
+                "comments": "56 comments",
+                "reposts": "7 reposts",
+                "images": [
+                    "https://media.licdn.com/a.jpg",
+                    "https://static.licdn.com/icon.svg",
+                ],
+                "has_video": False,
+                "article_title": None,
+            }
+        )
+        assert data["author"] == "Ada Lovelace"
+        assert data["posted_date"] == "2d"
+        assert data["comments"] == "56"
+        assert data["reposts"] == "7"
+        assert data["images"] == ["https://media.licdn.com/a.jpg"]
+        print("✅ Full snapshot normalized")
+
+    def test_missing_fields_use_defaults(self):
+        """Test defaults for a text-only post."""
+        data = normalize_post_snapshot({"images": None})
+        assert data == {
+            "author": "Unknown",
+            "author_title": "",
+            "content": "",
+            "posted_date": "Unknown",
+            "reactions": "0",
+            "comments": "0",
+            "reposts": "0",
+            "images": [],
+            "has_video": False,
+            "article_title": None,
+        }
+        blank = normalize_post_snapshot({"comments": "\n", "reposts": "  "})
+        assert blank["comments"] == blank["reposts"] == "0"
+        print("✅ Missing fields defaulted")
+
+    def test_single_script_round_trip(self):
+        """Test that extraction uses exactly one execute_script call."""
+        driver = FakeDriver(snapshot={"author": "Ada", "images": []})
+        data = extract_post_data(driver)
+        assert driver.script_calls == 1
+        assert data["author"] == "Ada"
+        print("✅ Single round trip")
+
+    def test_falls_back_to_element_lookups(self):
+        """Test that a failing script falls back to per-element lookups."""
+        driver = FakeDriver(script_error=True)
+        data = extract_post_data(driver)
+        assert data["author"] == "Unknown"
+        assert data["images"] == []
+        assert driver.implicit_waits[0] == 0  # Optional lookups ran in probe mode
+        print("✅ Element lookup fallback")
+
+
+class TestPageAvailability:
+    """Tests for recognizing missing or private pages."""
+
+    def test_unavailable_pages_detected(self):
+        """Test that 404 redirects and 'not available' headlines are recognized."""
+        redirected = FakeDriver(snapshot="")
+        redirected.current_url = "https://www.linkedin.com/404/"
+        assert page_unavailable_reason(redirected)
+
+        private = FakeDriver(snapshot="linkedin\nthis linkedin page isn’t available")
+        private.current_url = "https://www.linkedin.com/company/gone/"
+        assert page_unavailable_reason(private)
+
+        regular = FakeDriver(snapshot="anthropic | linkedin\nanthropic")
+        regular.current_url = "https://www.linkedin.com/company/anthropic/"
+        assert page_unavailable_reason(regular) is None
+
+        # IDs and slugs that merely start with 404 are regular pages
+        for url in (
+            "https://www.linkedin.com/jobs/view/4041234567/",
+            "https://www.linkedin.com/in/404-studio/",
+            "https://www.linkedin.com/company/404lab/",
+        ):
+            page = FakeDriver(snapshot="software engineer")
+            page.current_url = url
+            assert page_unavailable_reason(page) is None
+        print("✅ Unavailable pages detected")
+
+    def test_failed_scrape_of_missing_page_raises_not_found(self):
+        """Test that only failures on unavailable pages become EntityNotFoundError."""
+        driver = FakeDriver(snapshot="page not found")
+        driver.current_url = "https://www.linkedin.com/in/nobody/"
+        with pytest.raises(EntityNotFoundError):
+            with raise_if_unavailable(driver, "Profile 'nobody'"):
+                raise NoSuchElementException("h1")
+
+        driver.snapshot = "jane doe"
+        with pytest.raises(NoSuchElementException):
+            with raise_if_unavailable(driver, "Profile 'jane'"):
+                raise NoSuchElementException("h1")
+        print("✅ Missing pages reported as not found")
+
+
+class TestReadPostTool:
+    """Tests for the read_linkedin_post tool."""
+
+    @pytest.mark.asyncio
+    async def test_scraper_errors_carry_error_codes(self, tmp_path, monkeypatch):
+        """Test that scraper failures map to the shared tool error codes."""
+        from fastmcp import FastMCP
+
+        from linkedin_mcp_server import cache
+        from linkedin_mcp_server.api.post_queue import PostQueue
+        from linkedin_mcp_server.tools import post
+
+        monkeypatch.setenv("LINKEDIN_ACCESS_TOKEN", "test-token")
+        monkeypatch.setattr(post, "PostQueue", lambda: PostQueue(tmp_path / "queue.db"))
+        mcp = FastMCP("test")
+        post.register_post_tools(mcp)
+        tool = await mcp.get_tool("read_linkedin_post")
+        url = "https://www.linkedin.com/posts/jane_activity-7394701839126016000-3V9W"
+
+        for error, code in (
+            (ScraperQueueFullError("queue full"), "scraper_busy"),
+            (DriverPoolTimeoutError("no driver"), "driver_pool_exhausted"),
+            (EntityNotFoundError("gone"), "entity_not_found"),
+        ):
+
+            async def failing(*args, error=error):
+                raise error
+
+            monkeypatch.setattr(cache, "guard_not_found", failing)
+            result = await tool.fn(post_url=url)
+            assert result["status"] == "error"
+            assert result["error"] == code
+        print("✅ Post reader errors carry error codes")
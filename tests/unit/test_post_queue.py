@@ -0,0 +1,235 @@
+"""
+Unit tests for the scheduled post queue and its background publisher.
+"""
+
+import asyncio
+import sqlite3
+import time
+
+import httpx
+import pytest
+from fastmcp import FastMCP
+
+from linkedin_mcp_server.api import (
+    AsyncLinkedInAPIClient,
+    PostQueue,
+    PostScheduler,
+    PostVisibility,
+    RateLimiter,
+    RetryPolicy,
+)
+from linkedin_mcp_server.api.post_queue import parse_schedule_time
+from linkedin_mcp_server.tools import post as post_tools
+
+
+def make_client(handler):
+    """Create a client whose HTTP calls are answered by handler."""
+    client = AsyncLinkedInAPIClient(
+        "test-token",
+        base_url="https://api.test/rest",
+        rate_limiter=RateLimiter(),
+        retry_policy=RetryPolicy(base_delay=0.001),
+    )
+    client.http = httpx.AsyncClient(
+        headers=client.headers,
+        event_hooks=client.http.event_hooks,
+        transport=httpx.MockTransport(handler),
+    )
+    return client
+
+
+class TestPostQueue:
+    """Tests for PostQueue and PostScheduler."""
+
+    def test_claims_due_posts_in_order(self, tmp_path):
+        """Test that only due pending posts are claimed, earliest first."""
+        queue = PostQueue(tmp_path / "queue.db")
+        now = time.time()
+        later = queue.enqueue("later", scheduled_at=now + 3600)
+        second = queue.enqueue("second", scheduled_at=now - 10)
+        first = queue.enqueue(
+            "first", PostVisibility.CONNECTIONS, scheduled_at=now - 20
+        )
+
+        assert queue.claim_due(now)["id"] == first["id"]
+        assert queue.claim_due(now)["id"] == second["id"]
+        assert queue.claim_due(now) is None
+        assert queue.next_due_time() == pytest.approx(now + 3600)
+
+        assert queue.cancel(later["id"])
+        assert not queue.cancel(first["id"])
+        assert [p["status"] for p in queue.list()] == [
+            "publishing",
+            "publishing",
+            "cancelled",
+        ]
+        assert queue.recover(now) == 0
+        assert queue.recover(now + queue.lease) == 2
+        print("✅ Due posts claimed in schedule order")
+
+    @pytest.mark.asyncio
+    async def test_claim_survives_second_scheduler(self, tmp_path):
+        """Test that starting another process's scheduler keeps in-flight claims."""
+        path = tmp_path / "queue.db"
+        first = PostQueue(path)
+        second = PostQueue(path)
+        entry = first.enqueue("hello")
+        assert first.claim_due()["id"] == entry["id"]
+
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(201, json={"id": "urn:li:share:2"})
+
+        async with make_client(handler) as client:
+            scheduler = PostScheduler(client, second, poll_interval=0.01)
+            scheduler.ensure_started()
+            await asyncio.sleep(0.05)
+            await scheduler.stop()
+
+        assert requests == []
+        assert second.get(entry["id"])["status"] == "publishing"
+
+        # A failure reported by another queue does not touch the claim
+        second.mark_failed(entry["id"], "not mine", retry_at=time.time())
+        assert first.get(entry["id"])["status"] == "publishing"
+        print("✅ In-flight claim kept when another scheduler starts")
+
+    def test_parse_schedule_time(self):
+        """Test ISO 8601 parsing with and without timezone."""
+        assert parse_schedule_time("2030-01-01T00:00:00Z") == parse_schedule_time(
+            "2030-01-01T01:00:00+01:00"
+        )
+        assert parse_schedule_time("2030-01-01T00:00:00") == parse_schedule_time(
+            "2030-01-01T00:00:00+00:00"
+        )
+        with pytest.raises(ValueError):
+            parse_schedule_time("tomorrow")
+        print("✅ Schedule times parsed")
+
+    @pytest.mark.asyncio
+    async def test_scheduler_publishes_and_retries(self, tmp_path):
+        """Test that due posts are published and failures are retried."""
+        posts = []
+
+        def handler(request):
+            if request.url.path == "/v2/userinfo":
+                return httpx.Response(200, json={"sub": "abc"})
+            posts.append(request.content)
+            if len(posts) == 1:
+                return httpx.Response(400, json={"message": "try again"})
+            return httpx.Response(201, json={"id": "urn:li:share:1"})
+
+        queue = PostQueue(tmp_path / "queue.db")
+        entry = queue.enqueue("hello")
+
+        async with make_client(handler) as client:
+            scheduler = PostScheduler(
+                client,
+                queue,
+                poll_interval=0.01,
+                retry_policy=RetryPolicy(base_delay=0.001, max_delay=0.001),
+            )
+            scheduler.ensure_started()
+            for _ in range(200):
+                if queue.get(entry["id"])["status"] == "published":
+                    break
+                await asyncio.sleep(0.01)
+            await scheduler.stop()
+
+        published = queue.get(entry["id"])
+        assert published["status"] == "published"
+        assert published["post_urn"] == "urn:li:share:1"
+        assert published["attempts"] == 2
+        assert len(posts) == 2
+        print("✅ Scheduled post published after a retry")
+
+    @pytest.mark.asyncio
+    async def test_published_post_never_republished(self, tmp_path, monkeypatch):
+        """Test that a failed status write after publishing does not retry the publish."""
+        posts = []
+
+        def handler(request):
+            if request.url.path == "/v2/userinfo":
+                return httpx.Response(200, json={"sub": "abc"})
+            posts.append(request.content)
+            return httpx.Response(201, json={"id": "urn:li:share:3"})
+
+        queue = PostQueue(tmp_path / "queue.db")
+        entry = queue.enqueue("hello")
+        writes = []
+
+        def locked(post_id, post_urn):
+            writes.append(post_urn)
+            raise sqlite3.OperationalError("database is locked")
+
+        monkeypatch.setattr(queue, "mark_published", locked)
+
+        async with make_client(handler) as client:
+            scheduler = PostScheduler(
+                client,
+                queue,
+                poll_interval=0.01,
+                retry_policy=RetryPolicy(base_delay=0.001, max_delay=0.001),
+            )
+            scheduler.ensure_started()
+            await asyncio.sleep(0.1)
+            await scheduler.stop()
+
+        assert len(posts) == 1
+        assert writes == ["urn:li:share:3"] * scheduler.retry_policy.max_attempts
+        assert queue.get(entry["id"])["status"] == "publishing"
+        print("✅ Published post not republished after a bookkeeping failure")
+
+    @pytest.mark.asyncio
+    async def test_unopenable_queue_disables_scheduling(self, monkeypatch):
+        """Test that a broken queue database only disables the scheduling tools."""
+
+        def broken_queue():
+            raise sqlite3.OperationalError("unable to open database file")
+
+        monkeypatch.setenv("LINKEDIN_ACCESS_TOKEN", "test-token")
+        monkeypatch.setattr(post_tools, "PostQueue", broken_queue)
+        monkeypatch.setattr(post_tools, "_post_scheduler", None)
+
+        mcp = FastMCP("test")
+        post_tools.register_post_tools(mcp)
+        assert post_tools.get_post_scheduler() is None
+
+        schedule = await mcp.get_tool("schedule_linkedin_post")
+        result = await schedule.fn(text="hello")
+        assert result["status"] == "error"
+        assert "unable to open database file" in result["message"]
+        assert await mcp.get_tool("create_linkedin_post") is not None
+        print("✅ Scheduling disabled when the queue cannot be opened")
+
+    @pytest.mark.asyncio
+    async def test_scheduling_tools_use_the_queue(self, tmp_path, monkeypatch):
+        """Test scheduling, listing and cancelling through the MCP tools."""
+        monkeypatch.setenv("LINKEDIN_ACCESS_TOKEN", "test-token")
+        monkeypatch.setattr(
+            post_tools, "PostQueue", lambda: PostQueue(tmp_path / "queue.db")
+        )
+        monkeypatch.setattr(post_tools, "_post_scheduler", None)
+
+        mcp = FastMCP("test")
+        post_tools.register_post_tools(mcp)
+        schedule = await mcp.get_tool("schedule_linkedin_post")
+        listing = await mcp.get_tool("list_scheduled_linkedin_posts")
+        cancel = await mcp.get_tool("cancel_scheduled_linkedin_post")
+
+        try:
+            scheduled = await schedule.fn(
+                text="later", scheduled_at="2099-01-01T09:00:00Z"
+            )
+            post_id = scheduled["post"]["id"]
+            assert (await listing.fn(status="pending"))["count"] == 1
+            assert (await cancel.fn(post_id=post_id))["status"] == "success"
+            assert (
+                "no longer be cancelled"
+                in (await cancel.fn(post_id=post_id))["message"]
+            )
+        finally:
+            await post_tools.get_post_scheduler().stop()
+        print("✅ Scheduling tools drive the post queue")
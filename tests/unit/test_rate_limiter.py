@@ -0,0 +1,84 @@
+"""
+Unit tests for the client-side API rate limiter.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from linkedin_mcp_server.api.ratelimit import (
+    RateLimiter,
+    TokenBucket,
+    endpoint_family,
+    load_rate_limits,
+    parse_rate_limit,
+)
+
+
+class TestRateLimiter:
+    """Tests for TokenBucket and RateLimiter."""
+
+    def test_endpoint_families(self):
+        """Test that URLs map to their endpoint family."""
+        assert endpoint_family("https://api.linkedin.com/rest/posts") == "posts"
+        assert (
+            endpoint_family("https://api.linkedin.com/rest/posts/urn:li:share:1")
+            == "posts"
+        )
+        assert (
+            endpoint_family("https://api.linkedin.com/rest/reactions/(actor:x)")
+            == "reactions"
+        )
+        assert (
+            endpoint_family(
+                "https://api.linkedin.com/rest/images?action=initializeUpload"
+            )
+            == "images"
+        )
+        assert endpoint_family("https://api.linkedin.com/v2/userinfo") == "other"
+        print("✅ Endpoint families resolved")
+
+    def test_bucket_queues_after_burst(self):
+        """Test that requests beyond the burst are delayed in order, not rejected."""
+        bucket = TokenBucket(rate=10, burst=2)
+
+        waits = [bucket.reserve() for _ in range(4)]
+
+        assert waits[:2] == [0.0, 0.0]
+        assert waits[2] == pytest.approx(0.1, abs=0.01)
+        assert waits[3] == pytest.approx(0.2, abs=0.01)
+        assert bucket.stats()["throttled"] == 2
+        print("✅ Requests beyond the burst are queued")
+
+    @pytest.mark.asyncio
+    async def test_async_acquire_paces_requests(self):
+        """Test that concurrent async callers are paced at the configured rate."""
+        limiter = RateLimiter({"reactions": (20, 1)})
+        start = time.monotonic()
+
+        await asyncio.gather(
+            *(
+                limiter.acquire_async("https://api.test/rest/reactions")
+                for _ in range(3)
+            )
+        )
+
+        assert time.monotonic() - start >= 0.09
+        assert limiter.stats()["reactions"]["requests"] == 3
+        assert limiter.stats()["other"]["requests"] == 0
+        print("✅ Async callers paced by the token bucket")
+
+    def test_limits_from_environment(self, monkeypatch):
+        """Test parsing of LINKEDIN_RATE_LIMIT_<FAMILY> overrides."""
+        monkeypatch.setenv("LINKEDIN_RATE_LIMIT_POSTS", "0.5/3")
+        monkeypatch.setenv("LINKEDIN_RATE_LIMIT_VIDEOS", "bogus")
+
+        limits = load_rate_limits()
+
+        assert limits["posts"] == (0.5, 3.0)
+        assert limits["videos"] == (5.0, 10.0)
+        assert parse_rate_limit("2") == (2.0, 2.0)
+        with pytest.raises(ValueError):
+            parse_rate_limit("-1")
+        print("✅ Rate limits configurable per family")
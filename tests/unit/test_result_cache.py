@@ -0,0 +1,279 @@
+"""
+Unit tests for the scrape result caches.
+"""
+
+import asyncio
+import os
+import time
+
+import pytest
+
+from linkedin_mcp_server.cache import (
+    ResultCache,
+    ScrapeCache,
+    SingleFlight,
+    cache_key,
+    guard_not_found,
+    normalize_company_name,
+    normalize_job_id,
+    normalize_search_term,
+    normalize_username,
+    read_through,
+)
+from linkedin_mcp_server.exceptions import EntityNotFoundError
+
+
+class TestResultCache:
+    """Tests for ResultCache."""
+
+    def test_expired_entries_are_missed(self):
+        """Test that entries are served until their TTL passes."""
+        cache = ResultCache(ttl=0.05)
+        cache.set("a", {"name": "A"})
+        assert cache.get("a") == {"name": "A"}
+
+        time.sleep(0.06)
+        assert cache.get("a") is None
+        assert cache.stats()["entries"] == 0
+        print("✅ Expired entries dropped")
+
+    def test_lru_eviction_by_count_and_bytes(self):
+        """Test that least recently used entries are evicted first."""
+        cache = ResultCache(ttl=60, max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1 and cache.get("c") == 3
+
+        cache = ResultCache(ttl=60, max_bytes=30)
+        cache.set("a", "x" * 10)
+        cache.set("b", "y" * 10)
+        cache.set("c", "z" * 10)
+        cache.set("huge", "h" * 100)
+        assert cache.get("a") is None
+        assert cache.get("huge") is None
+        assert cache.stats()["bytes"] <= 30
+        print("✅ LRU eviction respects entry and byte limits")
+
+    def test_disabled_cache(self):
+        """Test that a TTL of 0 disables caching."""
+        cache = ResultCache(ttl=0)
+        cache.set("a", 1)
+        assert cache.get("a") is None
+        print("✅ Zero TTL disables the cache")
+
+    def test_normalize_username(self):
+        """Test that usernames and profile URLs share one key."""
+        assert normalize_username(" JohnDoe/ ") == "johndoe"
+        assert (
+            normalize_username("https://www.linkedin.com/in/JohnDoe/?trk=x")
+            == "johndoe"
+        )
+        assert normalize_username("linkedin.com/in/john-doe") == "john-doe"
+        print("✅ Usernames normalized")
+
+
+class TestScrapeCache:
+    """Tests for the SQLite-backed ScrapeCache."""
+
+    def test_results_shared_between_instances(self, tmp_path):
+        """Test that results written by one process are read by another."""
+        path = tmp_path / "cache.db"
+        writer = ScrapeCache(max_bytes=1024 * 1024, path=path)
+        reader = ScrapeCache(max_bytes=1024 * 1024, path=path)
+
+        writer.set(
+            cache_key("company", "anthropic", "basic"), {"name": "Anthropic"}, ttl=60
+        )
+        writer.set(cache_key("job", "1"), {"title": "gone"}, ttl=0.01)
+        time.sleep(0.02)
+
+        assert reader.get("company:anthropic:basic") == {"name": "Anthropic"}
+        assert reader.get("job:1") is None
+        assert reader.stats()["company"]["entries"] == 1
+        print("✅ Scrape results shared through the database")
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        """Test that the compressed size stays within the budget."""
+        cache = ScrapeCache(max_bytes=1500, path=tmp_path / "cache.db")
+        for i in range(4):
+            # Random-looking payloads so compression cannot shrink them much
+            cache.set(f"person:{i}", {"about": os.urandom(400).hex()}, ttl=60)
+            if i == 1:
+                cache.get("person:0")
+            time.sleep(0.001)
+
+        assert cache.get("person:0") is not None
+        assert cache.get("person:1") is None
+        assert cache.get("person:3") is not None
+        assert sum(kind["bytes"] for kind in cache.stats().values()) <= 1500
+        print("✅ Least recently used results evicted")
+
+    def test_unopenable_database_disables_cache(self, tmp_path):
+        """Test that a database that cannot be opened falls back to no caching."""
+        cache = ScrapeCache(
+            max_bytes=1024 * 1024, path=tmp_path / "missing" / "cache.db"
+        )
+        assert not cache.enabled
+
+        cache.set("person:a", {"name": "A"}, ttl=60)
+        assert cache.get("person:a") is None
+        assert cache.stats() == {}
+        print("✅ Unopenable scrape cache disabled")
+
+    def test_normalized_keys(self):
+        """Test normalization of company names, job IDs and searches."""
+        assert (
+            normalize_company_name("https://www.linkedin.com/company/Anthropic/")
+            == "anthropic"
+        )
+        assert (
+            normalize_job_id("https://www.linkedin.com/jobs/view/4252026496/")
+            == "4252026496"
+        )
+        assert normalize_search_term("  Python   Developer ") == "python developer"
+        print("✅ Tool arguments normalized")
+
+
+class TestStaleWhileRevalidate:
+    """Tests for read_through."""
+
+    @pytest.mark.asyncio
+    async def test_stale_result_served_while_refreshing(self, tmp_path):
+        """Test that a stale result is returned at once and refreshed once."""
+        cache = ScrapeCache(max_bytes=1024 * 1024, path=tmp_path / "cache.db")
+        scrapes = []
+
+        async def scrape():
+            scrapes.append(len(scrapes) + 1)
+            await asyncio.sleep(0.05)
+            return {"version": len(scrapes)}
+
+        first = await read_through(cache, "company:a", scrape, ttl=0.01, max_stale=60)
+        assert first == {"version": 1}
+        await asyncio.sleep(0.02)
+
+        stale = await asyncio.gather(
+            *(
+                read_through(cache, "company:a", scrape, ttl=0.01, max_stale=60)
+                for _ in range(3)
+            )
+        )
+        assert stale == [{"version": 1}] * 3
+        await asyncio.sleep(0.1)
+
+        assert len(scrapes) == 2
+        assert cache.get("company:a") == {"version": 2}
+        print("✅ Stale result served while one refresh runs")
+
+    @pytest.mark.asyncio
+    async def test_expired_result_waits_for_scrape(self, tmp_path):
+        """Test that results past the stale window are scraped in the foreground."""
+        cache = ScrapeCache(max_bytes=1024 * 1024, path=tmp_path / "cache.db")
+        versions = iter(range(1, 10))
+
+        async def scrape():
+            return {"version": next(versions)}
+
+        await read_through(cache, "job:1", scrape, ttl=0.01)
+        await asyncio.sleep(0.02)
+        assert await read_through(cache, "job:1", scrape, ttl=0.01) == {"version": 2}
+        assert await read_through(
+            cache, "job:1", scrape, ttl=60, force_refresh=True
+        ) == {"version": 3}
+        print("✅ Expired results scraped again")
+
+
+class TestSingleFlight:
+    """Tests for SingleFlight."""
+
+    @pytest.mark.asyncio
+    async def test_identical_calls_share_one_run(self):
+        """Test that concurrent calls with one key run once."""
+        flights = SingleFlight()
+        runs = []
+
+        async def scrape(name):
+            runs.append(name)
+            await asyncio.sleep(0.02)
+            return {"name": name}
+
+        results = await asyncio.gather(
+            *(flights.do("get_company_profile:a", scrape, "a") for _ in range(5)),
+            flights.do("get_company_profile:b", scrape, "b"),
+        )
+
+        assert runs == ["a", "b"]
+        assert results[:5] == [{"name": "a"}] * 5
+        assert flights.coalesced == 4 and flights.in_flight == 0
+        print("✅ Identical in-flight calls coalesced")
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        """Test that the shared call survives a cancelled waiter and shares errors."""
+        flights = SingleFlight()
+
+        async def scrape():
+            await asyncio.sleep(0.02)
+            raise RuntimeError("boom")
+
+        first = asyncio.create_task(flights.do("k", scrape))
+        second = asyncio.create_task(flights.do("k", scrape))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        with pytest.raises(RuntimeError):
+            await second
+        print("✅ Shared call outlives cancelled callers")
+
+
+class TestNegativeCache:
+    """Tests for guard_not_found."""
+
+    @pytest.mark.asyncio
+    async def test_missing_entity_remembered(self, tmp_path):
+        """Test that a not-found outcome is served without scraping again."""
+        cache = ScrapeCache(max_bytes=1024 * 1024, path=tmp_path / "cache.db")
+        cache.set("person:gone", {"name": "Gone"}, ttl=60)
+        scrapes = 0
+
+        async def scrape():
+            nonlocal scrapes
+            scrapes += 1
+            raise EntityNotFoundError(
+                "Profile 'gone' does not exist or is not accessible"
+            )
+
+        for _ in range(3):
+            with pytest.raises(EntityNotFoundError):
+                await guard_not_found(cache, "person:gone", scrape, ttl=60)
+        assert scrapes == 1
+        assert cache.get("person:gone") is None
+
+        with pytest.raises(EntityNotFoundError):
+            await guard_not_found(
+                cache, "person:gone", scrape, ttl=60, force_refresh=True
+            )
+        assert scrapes == 2
+        print("✅ Missing entities remembered")
+
+    @pytest.mark.asyncio
+    async def test_missing_entity_remembered_without_disk_cache(self):
+        """Test that negative entries are kept in memory when the disk cache is off."""
+        cache = ScrapeCache(max_bytes=0)
+        scrapes = 0
+
+        async def scrape():
+            nonlocal scrapes
+            scrapes += 1
+            raise EntityNotFoundError(
+                "Job 'memory-gone' does not exist or is not accessible"
+            )
+
+        for _ in range(3):
+            with pytest.raises(EntityNotFoundError):
+                await guard_not_found(cache, "job:memory-gone", scrape, ttl=60)
+        assert scrapes == 1
+        print("✅ Missing entities remembered in memory")
@@ -0,0 +1,43 @@
+"""
+Unit tests for the API retry policy.
+"""
+
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+from linkedin_mcp_server.api.retry import RetryPolicy, parse_retry_after
+
+
+class TestRetryPolicy:
+    """Tests for RetryPolicy and Retry-After parsing."""
+
+    def test_backoff_is_capped_full_jitter(self):
+        """Test that delays are random within the capped exponential bound."""
+        policy = RetryPolicy(base_delay=1, max_delay=4)
+
+        for attempt, cap in [(1, 1), (2, 2), (3, 4), (8, 4)]:
+            delays = [policy.backoff(attempt) for _ in range(50)]
+            assert all(0 <= d <= cap for d in delays)
+        print("✅ Backoff capped with full jitter")
+
+    def test_gives_up_on_attempts_and_deadline(self):
+        """Test that retries stop at max attempts or when the deadline would pass."""
+        policy = RetryPolicy(max_attempts=3, deadline=10)
+        now = time.monotonic()
+
+        assert policy.next_delay(1, now, retry_after=2) == 2
+        assert policy.next_delay(3, now) is None
+        assert policy.next_delay(1, now, retry_after=11) is None
+        assert policy.next_delay(1, now - 9.5, retry_after=1) is None
+        print("✅ Retries bounded by attempts and deadline")
+
+    def test_parse_retry_after(self):
+        """Test Retry-After in seconds and HTTP-date form."""
+        later = datetime.now(timezone.utc) + timedelta(seconds=30)
+
+        assert parse_retry_after("5") == 5
+        assert 25 < parse_retry_after(format_datetime(later, usegmt=True)) <= 30
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+        print("✅ Retry-After parsed")
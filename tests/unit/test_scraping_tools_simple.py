@@ -211,6 +211,46 @@ class TestSpecialCharacterHandling:
         print(f"✅ Unicode text validated")
 
 
+class TestPersonProfileCache:
+    """Tests for the caches behind get_person_profile."""
+
+    @pytest.mark.asyncio
+    async def test_deleted_profile_not_served_from_memory(self, tmp_path, monkeypatch):
+        """Test that a refresh finding a deleted profile also clears the memory copy."""
+        from fastmcp import FastMCP
+
+        from linkedin_mcp_server import config
+        from linkedin_mcp_server.cache import ScrapeCache
+        from linkedin_mcp_server.exceptions import EntityNotFoundError
+        from linkedin_mcp_server.tools import person
+
+        exists = True
+
+        async def fake_scrape(fn, username):
+            if not exists:
+                raise EntityNotFoundError(f"Profile '{username}' does not exist")
+            return {"name": "Gone Soon"}
+
+        monkeypatch.setattr(config, "_config", config.AppConfig())
+        monkeypatch.setattr(
+            person,
+            "get_scrape_cache",
+            lambda: ScrapeCache(max_bytes=1024 * 1024, path=tmp_path / "cache.db"),
+        )
+        monkeypatch.setattr(person, "run_in_driver_thread", fake_scrape)
+
+        mcp = FastMCP("test")
+        person.register_person_tools(mcp)
+        tool = await mcp.get_tool("get_person_profile")
+
+        assert await tool.fn(linkedin_username="gone-soon") == {"name": "Gone Soon"}
+        exists = False
+        refreshed = await tool.fn(linkedin_username="gone-soon", force_refresh=True)
+        assert refreshed["error"] == "entity_not_found"
+        assert (await tool.fn(linkedin_username="gone-soon"))["error"] == "entity_not_found"
+        print("✅ Deleted profile dropped from the memory cache")
+
+
 @pytest.mark.integration
 @pytest.mark.skip(reason="Integration tests disabled - require browser and cookie")
 class TestRealScraping:
@@ -0,0 +1,105 @@
+"""
+Unit tests for the media upload streaming helpers.
+"""
+
+import pytest
+
+from linkedin_mcp_server.api.uploads import (
+    content_length,
+    is_local_source,
+    iter_chunks,
+    local_path,
+    map_file,
+    poll_delays,
+    regroup_parts,
+    upload_parts,
+)
+
+
+class TestUploadStreaming:
+    """Tests for chunked media streaming."""
+
+    def test_map_file_chunks(self, tmp_path):
+        """Test that a mapped file is yielded in bounded chunks."""
+        path = tmp_path / "media.bin"
+        path.write_bytes(bytes(range(10)))
+
+        with map_file(path) as buffer:
+            chunks = list(iter_chunks(buffer, chunk_size=4))
+            part = list(iter_chunks(buffer, start=2, end=7, chunk_size=4))
+
+        assert chunks == [bytes([0, 1, 2, 3]), bytes([4, 5, 6, 7]), bytes([8, 9])]
+        assert part == [bytes([2, 3, 4, 5]), bytes([6])]
+        print("✅ Mapped file streamed in bounded chunks")
+
+    def test_empty_file(self, tmp_path):
+        """Test that empty files stream as an empty body."""
+        path = tmp_path / "empty.bin"
+        path.write_bytes(b"")
+
+        with map_file(path) as buffer:
+            assert list(iter_chunks(buffer)) == []
+        print("✅ Empty file handled without mmap")
+
+    def test_sources_and_lengths(self):
+        """Test source detection and streamed length handling."""
+        assert not is_local_source("https://example.com/a.png")
+        assert is_local_source("/tmp/a.png")
+
+        assert content_length({"Content-Length": "42"}) == 42
+        assert (
+            content_length({"Content-Length": "42", "Content-Encoding": "gzip"}) is None
+        )
+        print("✅ Source and length detection works")
+
+    def test_local_paths_confined_to_upload_dir(self, tmp_path, monkeypatch):
+        """Test that local media is only read from LINKEDIN_UPLOAD_DIR."""
+        monkeypatch.setattr("linkedin_mcp_server.api.uploads.UPLOAD_DIR", None)
+        with pytest.raises(PermissionError):
+            local_path("/etc/passwd")
+
+        media = tmp_path / "media"
+        media.mkdir()
+        (tmp_path / "secret.txt").write_text("secret")
+        (media / "link.png").symlink_to(tmp_path / "secret.txt")
+        monkeypatch.setattr("linkedin_mcp_server.api.uploads.UPLOAD_DIR", str(media))
+
+        assert local_path(f"file://{media}/a.png") == media / "a.png"
+        assert local_path("a.png") == media / "a.png"
+        for source in (
+            "/etc/passwd",
+            "../secret.txt",
+            f"{media}/../secret.txt",
+            "link.png",
+        ):
+            with pytest.raises(PermissionError):
+                local_path(source)
+        print("✅ Local media confined to the upload directory")
+
+    def test_regroup_parts(self):
+        """Test that a chunked stream is regrouped into ordered part bodies."""
+        parts = upload_parts(
+            [
+                {"uploadUrl": "u2", "firstByte": 5, "lastByte": 6},
+                {"uploadUrl": "u1", "firstByte": 0, "lastByte": 4},
+            ]
+        )
+
+        assert [p.url for p in parts] == ["u1", "u2"]
+        assert [p.size for p in parts] == [5, 2]
+        bodies = list(regroup_parts(iter([b"abc", b"defg"]), parts))
+        assert bodies == [b"abcde", b"fg"]
+
+        with pytest.raises(ValueError):
+            list(regroup_parts(iter([b"abc"]), parts))
+        print("✅ Stream regrouped into upload parts")
+
+    def test_poll_delays_back_off_within_timeout(self):
+        """Test that poll delays grow, are capped and fit the timeout."""
+        delays = list(poll_delays(30))
+
+        assert delays[0] == 0.5
+        assert delays[1] > delays[0]
+        assert max(delays) <= 8.0
+        assert sum(delays) == pytest.approx(30)
+        print("✅ Poll delays back off within the timeout")